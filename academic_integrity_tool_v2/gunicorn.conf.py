@@ -0,0 +1,29 @@
+"""
+Gunicorn config for serving academic_integrity_tool_v2 in production:
+
+    gunicorn -c academic_integrity_tool_v2/gunicorn.conf.py academic_integrity_tool_v2.wsgi
+
+The views spend most of a request waiting on Postgres and Redis round trips, so each worker process runs a pool
+of threads (the gthread worker): while one thread waits on the network, the others serve requests. Django 2.2
+has neither an ASGI handler nor async views, so threads are how a worker overlaps requests.
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+keepalive = 5
+# Recycle workers now and then, staggered, so none grows without bound
+max_requests = 5000
+max_requests_jitter = 500
+# Heartbeat files on tmpfs, since a container's filesystem can stall the workers' heartbeats
+worker_tmp_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+accesslog = '-'
+
+def worker_exit(server, worker):
+    # Close the worker's pooled database connections, if any, rather than leave Postgres to notice they are gone
+    from policy_wizard.postgresql.base import close_pools
+    close_pools()
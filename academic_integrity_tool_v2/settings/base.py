@@ -35,8 +35,12 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'policy_wizard.metrics.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
+    # Serves the static files, precompressed and, under hashed names, with far-future cache headers
+    'whitenoise.middleware.WhiteNoiseMiddleware',
+    # Django's SessionMiddleware, optionally accepting the session key from the URL (see SESSION_URL_PARAMETER)
+    'policy_wizard.sessions.LTISessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -58,7 +62,8 @@ ROOT_URLCONF = 'academic_integrity_tool_v2.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # The Django template backend, instrumented to report template render time to the request metrics
+        'BACKEND': 'policy_wizard.metrics.InstrumentedDjangoTemplates',
         'DIRS': [os.path.join(BASE_DIR, 'templates')],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -79,20 +84,50 @@ WSGI_APPLICATION = 'academic_integrity_tool_v2.wsgi.application'
 
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
+        # Django's backend, with health checks and an optional pool of connections (see policy_wizard.postgresql)
+        'ENGINE': 'policy_wizard.postgresql',
         'NAME': SECURE_SETTINGS.get('db_default_name', 'academic_integrity_tool_v2'),
         'USER': SECURE_SETTINGS.get('db_default_user', 'academic_integrity_tool_v2'),
         'PASSWORD': SECURE_SETTINGS.get('db_default_password'),
         'HOST': SECURE_SETTINGS.get('db_default_host', '127.0.0.1'),
         'PORT': SECURE_SETTINGS.get('db_default_port', 5432),  # Default postgres port
+        # Seconds each thread keeps its connection open for later requests, instead of opening one per request.
+        # 0 closes it at the end of every request, None keeps it open for good.
+        'CONN_MAX_AGE': SECURE_SETTINGS.get('db_conn_max_age', 60),
+        # Check a kept connection still works before a request uses it
+        'CONN_HEALTH_CHECKS': SECURE_SETTINGS.get('db_conn_health_checks', True),
+        'OPTIONS': {},
     },
 }
 
+# An optional pool of connections shared by the threads of each process, e.g. {'min_size': 4, 'max_size': 8}.
+# Each request takes a connection from the pool and hands it back when it ends. When all max_size are taken, a
+# request waits up to 'timeout' seconds (default 5) for one and then fails, so max_size should be at least the
+# number of threads per worker, and workers x max_size within what Postgres accepts.
+DB_POOL = SECURE_SETTINGS.get('db_pool')
+if DB_POOL:
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+    DATABASES['default']['OPTIONS']['pool'] = DB_POOL
+
 # Sessions
 # https://docs.djangoproject.com/en/1.9/topics/http/sessions/#module-django.contrib.sessions
 
-# Store sessions in default cache defined below
-SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
+# 'cache': store sessions in default cache defined below. A launch saves its session in the same round trip
+# as it records its LTI nonce (see policy_wizard.cache_sessions).
+# 'signed': keep the few values the views need (SESSION_TOKEN_KEYS) in a compact signed token carried by the
+# client, which saves a cache round trip on every request.
+SESSION_MODE = SECURE_SETTINGS.get('session_mode', 'cache')
+if SESSION_MODE == 'signed':
+    SESSION_ENGINE = 'policy_wizard.sessions'
+else:
+    SESSION_ENGINE = 'policy_wizard.cache_sessions'
+SESSION_TOKEN_KEYS = ['role', 'course_id', 'context_id', 'lis_person_sourcedid', 'lti_authenticated']
+# Query parameter that carries the session key when the session cookie is missing, e.g. in a Canvas iframe
+# where third-party cookies are blocked. None disables it. The key then shows up in URLs and logs, so it is only
+# allowed in the 'signed' session mode, where it is a token that expires after SESSION_URL_MAX_AGE seconds.
+SESSION_URL_PARAMETER = 'lti_session' if SESSION_MODE == 'signed' and SECURE_SETTINGS.get('session_in_url', False) \
+    else None
+SESSION_URL_MAX_AGE = SECURE_SETTINGS.get('session_in_url_max_age_secs', 60 * 60)
 # NOTE: This setting only affects the session cookie, not the expiration of the session
 # being stored in the cache.  The session keys will expire according to the value of
 # SESSION_COOKIE_AGE (https://docs.djangoproject.com/en/1.9/ref/settings/#session-cookie-age),
@@ -110,7 +145,22 @@ CACHES = {
         'BACKEND': 'redis_cache.RedisCache',
         'LOCATION': "redis://%s:%s/0" % (REDIS_HOST, REDIS_PORT),
         'OPTIONS': {
-            'PARSER_CLASS': 'redis.connection.HiredisParser'
+            'PARSER_CLASS': 'redis.connection.HiredisParser',
+            # Each process keeps a bounded pool of connections shared by its threads. When they are all in use,
+            # a thread waits up to 'timeout' seconds for one to be returned rather than opening more, so a
+            # burst of launches cannot exhaust the connections Redis accepts (workers x max_connections in all).
+            'CONNECTION_POOL_CLASS': 'redis.BlockingConnectionPool',
+            'CONNECTION_POOL_CLASS_KWARGS': {
+                'max_connections': SECURE_SETTINGS.get('redis_max_connections', 50),
+                'timeout': 2,
+                # Connections idle for longer are checked with a PING before use, instead of failing the
+                # request they are handed to if Redis or a firewall has closed them
+                'health_check_interval': 30,
+                'retry_on_timeout': True,
+            },
+            # Fail fast rather than hold a request thread when Redis is unreachable
+            'SOCKET_TIMEOUT': 1,
+            'SOCKET_CONNECT_TIMEOUT': 1,
         },
         'KEY_PREFIX': 'academic_integrity_tool_v2',  # Provide a unique value for shared cache
         # See following for default timeout (5 minutes as of 1.7):
@@ -119,6 +169,26 @@ CACHES = {
     },
 }
 
+# Rendered student policy pages are invalidated whenever an instructor publishes, edits or
+# inactivates a policy, so they can stay in the cache much longer than the default timeout
+STUDENT_POLICY_CACHE_TIMEOUT = SECURE_SETTINGS.get('student_policy_cache_timeout_secs', 60 * 60 * 24)
+# Once it expires, a page is still served for this long while a single request re-renders it
+STUDENT_POLICY_STALE_TIMEOUT = SECURE_SETTINGS.get('student_policy_stale_timeout_secs', 60 * 60)
+# Only the request holding a course's lock renders its page; on a miss the others wait for it up to
+# STUDENT_POLICY_LOCK_WAIT seconds before rendering it themselves
+STUDENT_POLICY_LOCK_TIMEOUT = 10
+STUDENT_POLICY_LOCK_WAIT = 2.0
+# Likewise, the policy template catalogue is invalidated whenever an administrator updates a template
+TEMPLATE_CATALOGUE_CACHE_TIMEOUT = SECURE_SETTINGS.get('template_catalogue_cache_timeout_secs', 60 * 60 * 24)
+# The catalogue and the template list panels are also kept in each process. A process checks whether an
+# administrator has changed a template at most this often, in seconds, with one cache read (0 turns it off).
+LOCAL_CACHE_TIMEOUT = SECURE_SETTINGS.get('local_cache_timeout_secs', 30)
+LOCAL_CACHE_MAX_ENTRIES = 256
+# Nonces of verified LTI launches are remembered for this long so replays can be rejected.
+# OAuth itself rejects launches whose timestamp is more than 5 minutes off, so this must be longer than that.
+LTI_NONCE_CACHE_ALIAS = 'default'
+LTI_NONCE_WINDOW_SECS = SECURE_SETTINGS.get('lti_nonce_window_secs', 60 * 10)
+
 # Internationalization
 # https://docs.djangoproject.com/en/1.9/topics/i18n/
 
@@ -145,6 +215,9 @@ USE_TZ = True
 # This directory is being ignored by git
 STATIC_ROOT = os.path.normpath(os.path.join(BASE_DIR, 'http_static'))
 STATIC_URL = '/static/'
+# collectstatic stores every file under a name with a hash of its content, which whitenoise serves with a
+# one year max-age, and writes gzip and brotli variants next to it
+STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
 # Logging
 # https://docs.djangoproject.com/en/1.9/topics/logging/#configuring-logging
@@ -199,9 +272,23 @@ LOGGING = {
         # Make sure that propagate is False so that the root logger doesn't get involved
         # after an app logger handles a log message.
         'django.server': DEFAULT_LOGGING['loggers']['django.server'],
+        # One JSON line per sampled request, see policy_wizard.metrics
+        'policy_wizard.metrics': {
+            'level': logging.INFO,
+            'handlers': ['default'],
+            'propagate': False,
+        },
     },
 }
 
+# Fraction of requests whose view, query count and time, cache hits and misses, template render time and
+# total time are logged and added to the histogram shown at /lti/launch/request_metrics/. 0 turns it off.
+REQUEST_METRICS_SAMPLE_RATE = SECURE_SETTINGS.get('request_metrics_sample_rate', 0.1)
+
+# Token that administrators' scripts send, as "Authorization: Bearer <token>", to call the bulk administration API
+# at /lti/launch/bulk_publish_policies/. Without one the API is switched off.
+BULK_API_TOKEN = SECURE_SETTINGS.get('bulk_api_token')
+
 # Other project specific settings
 LTI_TOOL_CONFIGURATION = {
     'title': 'Academic Integrity Policy',
@@ -16,6 +16,15 @@ if DEBUG_TOOLBAR:
         'INTERCEPT_REDIRECTS': False,
     }
 
+# Remember LTI launch nonces in a bounded in-memory LRU instead of Redis when running locally
+CACHES['lti_nonces'] = {
+    'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    'OPTIONS': {
+        'MAX_ENTRIES': 10000,
+    },
+}
+LTI_NONCE_CACHE_ALIAS = 'lti_nonces'
+
 # For Django Debug Toolbar:
 INTERNAL_IPS = ('127.0.0.1', '10.0.2.2',)
 
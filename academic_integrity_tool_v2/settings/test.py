@@ -21,6 +21,15 @@ CACHES = {
     },
 }
 
+# The tests do not run collectstatic, so there is no manifest of hashed names
+STATICFILES_STORAGE = 'django.contrib.staticfiles.storage.StaticFilesStorage'
+
+# The tests clear the cache between them, which would not clear what each process keeps
+LOCAL_CACHE_TIMEOUT = 0
+
+# Request metrics are switched on by the tests that cover them
+REQUEST_METRICS_SAMPLE_RATE = 0
+
 LOGGING['handlers']['default'] = {
     'level': logging.DEBUG,
     'class': 'logging.StreamHandler',
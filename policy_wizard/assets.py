@@ -0,0 +1,30 @@
+'''
+The TinyMCE editor bundle: tinymce.min.js followed by the theme and only the plugins the editor uses, in one
+file, so the editor loads with a single request instead of one per plugin. Rebuild it with
+`python manage.py build_tinymce_bundle` after changing the plugins, in this module and in tinymce_editor_base.html.
+'''
+import os
+
+TINYMCE_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'tinymce')
+TINYMCE_BUNDLE_PATH = os.path.join(TINYMCE_ROOT, 'tinymce.bundle.min.js')
+
+TINYMCE_THEME = 'modern'
+TINYMCE_PLUGINS = ['textcolor', 'lists', 'table', 'media', 'link', 'image', 'directionality']
+
+def tinymce_bundle_sources():
+    '''
+    :return: the paths, relative to the TinyMCE directory, of the scripts in the bundle, in order
+    '''
+    return (['tinymce.min.js', 'themes/%s/theme.min.js' % TINYMCE_THEME] +
+            ['plugins/%s/plugin.min.js' % plugin for plugin in TINYMCE_PLUGINS])
+
+def build_tinymce_bundle():
+    '''
+    :return: the content of the bundle. Plugins and the theme register themselves as their script runs, so
+    TinyMCE does not fetch them again.
+    '''
+    scripts = []
+    for source in tinymce_bundle_sources():
+        with open(os.path.join(TINYMCE_ROOT, source), encoding='utf-8') as script:
+            scripts.append('// %s\n%s' % (source, script.read().strip()))
+    return ';\n'.join(scripts) + ';\n'
@@ -0,0 +1,512 @@
+'''
+Helpers for the benchmark management commands, which drive the LTI launch flow through the
+Django test client and report latency, query counts and throughput per view, or the weight of the pages
+'''
+import gzip
+import json
+import math
+import os
+import queue
+import re
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+import oauth2
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management import call_command
+from django.db import close_old_connections, connection
+from django.db.backends.signals import connection_created
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, setup_databases, setup_test_environment, \
+    teardown_databases, teardown_test_environment
+from django.urls import reverse
+
+from .models import Policies, PolicyTemplates
+
+LAUNCH_URL = 'http://testserver/lti/launch/'
+STUDENT_ROLES = 'urn:lti:role:ims/lis/Learner,urn:lti:instrole:ims/lis/Student,urn:lti:sysrole:ims/lis/User'
+INSTRUCTOR_ROLES = 'urn:lti:role:ims/lis/Instructor,urn:lti:instrole:ims/lis/Instructor,urn:lti:sysrole:ims/lis/User'
+ADMINISTRATOR_ROLES = 'urn:lti:instrole:ims/lis/Administrator,urn:lti:sysrole:ims/lis/User'
+
+def sign_launch_params(url, params, consumer_key=None, shared_secret=None):
+    '''
+    Signs LTI launch parameters the way Canvas does, with OAuth 1.0 HMAC-SHA1, using the
+    consumer key and secret configured for this tool unless others are given
+    '''
+    consumer = oauth2.Consumer(consumer_key or settings.SECURE_SETTINGS['CONSUMER_KEY'],
+                               shared_secret or settings.SECURE_SETTINGS['LTI_SECRET'])
+    oauth_request = oauth2.Request.from_consumer_and_token(consumer, http_method='POST', http_url=url,
+                                                           parameters=params, is_form_encoded=True)
+    oauth_request.sign_request(oauth2.SignatureMethod_HMAC_SHA1(), consumer, None)
+    # The signature comes back as bytes
+    return {k: v.decode('utf-8') if isinstance(v, bytes) else v for k, v in oauth_request.items()}
+
+def launch_params(course_id, user_id, ext_roles):
+    return sign_launch_params(LAUNCH_URL, {
+        'lti_message_type': 'basic-lti-launch-request',
+        'lti_version': 'LTI-1p0',
+        'resource_link_id': 'resource%d' % course_id,
+        'context_id': 'context%d' % course_id,
+        'custom_canvas_course_id': str(course_id),
+        'lis_person_sourcedid': str(user_id),
+        'user_id': str(user_id),
+        'ext_roles': ext_roles,
+    })
+
+def _round_trip(method):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # Operations like get_many are built on get; count only the outermost call
+        if getattr(CountingLocMemCache._local, 'in_call', False):
+            return method(self, *args, **kwargs)
+        CountingLocMemCache._local.in_call = True
+        try:
+            with CountingLocMemCache._lock:
+                CountingLocMemCache.round_trips += 1
+            if CountingLocMemCache.latency:
+                time.sleep(CountingLocMemCache.latency)
+            return method(self, *args, **kwargs)
+        finally:
+            CountingLocMemCache._local.in_call = False
+    return wrapper
+
+class CountingLocMemCache(LocMemCache):
+    '''
+    An in-process stand-in for the Redis cache that counts the operations that would each have been a
+    network round trip, and optionally makes each take as long as one
+    '''
+    round_trips = 0
+    # Seconds every operation takes, as a round trip to Redis would
+    latency = 0.0
+    _lock = threading.Lock()
+    _local = threading.local()
+
+    add = _round_trip(LocMemCache.add)
+    get = _round_trip(LocMemCache.get)
+    set = _round_trip(LocMemCache.set)
+    touch = _round_trip(LocMemCache.touch)
+    incr = _round_trip(LocMemCache.incr)
+    has_key = _round_trip(LocMemCache.has_key)
+    delete = _round_trip(LocMemCache.delete)
+    clear = _round_trip(LocMemCache.clear)
+    get_many = _round_trip(LocMemCache.get_many)
+    set_many = _round_trip(LocMemCache.set_many)
+    delete_many = _round_trip(LocMemCache.delete_many)
+    # A CachePipeline sends every queued operation in one round trip, as a Redis pipeline does
+    run_pipeline = _round_trip(lambda self, calls: [call() for call in calls])
+
+COUNTING_CACHES = {
+    'default': {
+        'BACKEND': 'policy_wizard.benchmark.CountingLocMemCache',
+        'KEY_PREFIX': 'academic_integrity_tool_v2',
+    },
+}
+
+def percentile(samples, p):
+    '''
+    Nearest-rank percentile of a list of samples
+    '''
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(int(math.ceil(p / 100.0 * len(ordered))), 1)
+    return ordered[rank - 1]
+
+class BenchmarkRecorder(object):
+    '''
+    Collects the latency and the query count of every request made, grouped by view
+    '''
+
+    def __init__(self):
+        self.samples = {}
+
+    @contextmanager
+    def measure(self, view_name):
+        round_trips = CountingLocMemCache.round_trips
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            yield
+            elapsed = time.perf_counter() - started
+        self.samples.setdefault(view_name, []).append(
+            (elapsed, len(queries), CountingLocMemCache.round_trips - round_trips))
+
+    def report(self):
+        '''
+        :return: a dict, keyed on view name, of request count, p50/p95/p99 latency in ms,
+        mean queries per request, mean cache round trips per request (only counted when the cache is
+        a CountingLocMemCache) and throughput in requests per second
+        '''
+        report = {}
+        for view_name, samples in sorted(self.samples.items()):
+            latencies = [elapsed for elapsed, _, _ in samples]
+            report[view_name] = {
+                'requests': len(samples),
+                'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+                'p95_ms': round(percentile(latencies, 95) * 1000, 3),
+                'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+                'queries_per_request': round(sum(n for _, n, _ in samples) / float(len(samples)), 3),
+                'cache_round_trips_per_request': round(sum(n for _, _, n in samples) / float(len(samples)), 3),
+                'requests_per_sec': round(len(samples) / sum(latencies), 1) if sum(latencies) else 0.0,
+            }
+        return report
+
+def seed_courses(number_of_courses):
+    '''
+    Loads the boilerplate policy templates, if missing, and publishes a policy in every course
+    '''
+    if not PolicyTemplates.objects.exists():
+        call_command('loaddata', 'boilerplate_policy_templates.yml', app_label='policy_wizard', verbosity=0)
+    policy_template = PolicyTemplates.objects.order_by('pk').first()
+    Policies.objects.bulk_create(
+        Policies(
+            course_id=course_id,
+            context_id='context%d' % course_id,
+            related_template=policy_template,
+            published_by='instructor%d' % course_id,
+            is_published=True,
+            is_active=True,
+            body=policy_template.body,
+            rendered_body=policy_template.rendered_body,
+            body_hash=policy_template.body_hash,
+        )
+        for course_id in range(1, number_of_courses + 1)
+    )
+
+def run_launch_benchmark(number_of_courses, students_per_course, recorder=None):
+    '''
+    Launches the tool as the instructor and as every student of each course, following the launch
+    redirect to the policy templates list or the student policy page, and records every request
+    '''
+    recorder = recorder or BenchmarkRecorder()
+    seed_courses(number_of_courses)
+    for course_id in range(1, number_of_courses + 1):
+        launches = [('instructor%d' % course_id, INSTRUCTOR_ROLES, 'policy_templates_list')]
+        launches += [('student%d-%d' % (course_id, n), STUDENT_ROLES, 'student_active_policy')
+                     for n in range(students_per_course)]
+        for user_id, ext_roles, landing_view in launches:
+            # A fresh client per user, so each launcher has their own session
+            client = Client()
+            params = launch_params(course_id, user_id, ext_roles)
+            with recorder.measure('process_lti_launch_request'):
+                response = client.post(reverse('process_lti_launch_request'), params)
+            if response.status_code != 302 or response['Location'] != reverse(landing_view):
+                raise AssertionError('Launch of %s in course %d was not redirected to %s' % (
+                    user_id, course_id, landing_view))
+            with recorder.measure(landing_view):
+                response = client.get(response['Location'])
+            if response.status_code != 200:
+                raise AssertionError('%s returned %d' % (landing_view, response.status_code))
+    return recorder
+
+@contextmanager
+def benchmark_databases(keepdb=False):
+    '''
+    Runs the benchmark against throwaway test databases created from the configured ones, as the
+    test runner does, so it is safe to point at a local SQLite or Postgres database
+    '''
+    setup_test_environment()
+    old_config = setup_databases(verbosity=0, interactive=False, keepdb=keepdb)
+    try:
+        yield
+    finally:
+        teardown_databases(old_config, verbosity=0, keepdb=keepdb)
+        teardown_test_environment()
+
+def compare_with_baseline(report, baseline, tolerance):
+    '''
+    :return: a list of human readable regressions: views whose p95 latency grew by more than the
+    tolerance (a fraction) or that now run more queries or cache round trips per request than in the baseline
+    '''
+    regressions = []
+    for view_name, baseline_stats in sorted(baseline.items()):
+        stats = report.get(view_name)
+        if stats is None:
+            continue
+        if stats['queries_per_request'] > baseline_stats['queries_per_request']:
+            regressions.append('%s: %.2f queries per request, baseline %.2f' % (
+                view_name, stats['queries_per_request'], baseline_stats['queries_per_request']))
+        if stats['cache_round_trips_per_request'] > baseline_stats.get('cache_round_trips_per_request', float('inf')):
+            regressions.append('%s: %.2f cache round trips per request, baseline %.2f' % (
+                view_name, stats['cache_round_trips_per_request'], baseline_stats['cache_round_trips_per_request']))
+        if stats['p95_ms'] > baseline_stats['p95_ms'] * (1 + tolerance):
+            regressions.append('%s: p95 %.2fms, baseline %.2fms' % (
+                view_name, stats['p95_ms'], baseline_stats['p95_ms']))
+    return regressions
+
+def static_references(html):
+    '''
+    :return: the paths, relative to STATIC_URL, of the static files a page references, in order and once each.
+    This includes the scripts a page loads from its own scripts, but not the files stylesheets or TinyMCE
+    load in turn, such as fonts and skins.
+    '''
+    paths = []
+    for url in re.findall(r'["\'](%s[^"\'?#]+)' % re.escape(settings.STATIC_URL), html):
+        path = url[len(settings.STATIC_URL):]
+        if path not in paths:
+            paths.append(path)
+    return paths
+
+def page_weight(response):
+    '''
+    :return: a dict of the number of requests it takes to show a page, the number of those that are scripts,
+    and their total size in bytes, both as is and gzipped, as they are served
+    '''
+    html = response.content
+    files = [html]
+    scripts = 0
+    for path in static_references(html.decode(response.charset)):
+        found = finders.find(path)
+        # e.g. a directory, like TinyMCE's base URL
+        if found is None or not isinstance(found, str) or not os.path.isfile(found):
+            continue
+        with open(found, 'rb') as static_file:
+            files.append(static_file.read())
+        if path.endswith('.js'):
+            scripts += 1
+    return {
+        'requests': len(files),
+        'scripts': scripts,
+        'bytes': sum(len(content) for content in files),
+        'gzip_bytes': sum(len(gzip.compress(content, 9)) for content in files),
+    }
+
+def launched_client(course_id, user_id, ext_roles):
+    '''
+    :return: a test client with the session of an LTI launch, and the URL the launch redirected to
+    '''
+    client = Client()
+    response = client.post(reverse('process_lti_launch_request'), launch_params(course_id, user_id, ext_roles))
+    if response.status_code != 302:
+        raise AssertionError('Launch of %s in course %d returned %d' % (user_id, course_id, response.status_code))
+    return client, response['Location']
+
+def run_page_weight_benchmark():
+    '''
+    Launches the tool as a student, an instructor and an administrator and weighs the pages each is shown
+    :return: a dict of page weights, keyed on view name
+    '''
+    seed_courses(1)
+    policy_template = PolicyTemplates.objects.order_by('pk').first()
+    # Course 1 has an active policy, course 2 does not
+    student, student_page = launched_client(1, 'student', STUDENT_ROLES)
+    instructor, _ = launched_client(1, 'instructor', INSTRUCTOR_ROLES)
+    new_instructor, templates_list = launched_client(2, 'new-instructor', INSTRUCTOR_ROLES)
+    administrator, _ = launched_client(1, 'administrator', ADMINISTRATOR_ROLES)
+    active_policy = Policies.objects.get(course_id=1, is_active=True)
+    pages = [
+        ('student_active_policy', student, student_page),
+        ('instructor_level_template_list', new_instructor, templates_list),
+        ('instructor_level_policy_edit', new_instructor,
+         reverse('instructor_level_policy_edit', args=[policy_template.pk])),
+        ('instructor_active_policy', instructor, reverse('instructor_active_policy', args=[active_policy.pk])),
+        ('policy_history', instructor, reverse('policy_history')),
+        ('admin_level_template_list', administrator, reverse('policy_templates_list')),
+        ('admin_level_template_edit', administrator, reverse('admin_level_template_edit', args=[policy_template.pk])),
+    ]
+    report = {}
+    for view_name, client, url in pages:
+        response = client.get(url)
+        if response.status_code != 200:
+            raise AssertionError('%s returned %d' % (view_name, response.status_code))
+        report[view_name] = page_weight(response)
+    return report
+
+def concurrency_benchmark_requests(number_of_courses):
+    '''
+    Launches the students of half the courses, which have a policy, and the instructors of the other half,
+    which have not, so they land on the student policy page and the policy templates list
+    :return: a list of (session cookie, URL) of the landing pages
+    '''
+    with_policies = max(number_of_courses // 2, 1)
+    seed_courses(with_policies)
+    requests = []
+    for course_id in range(1, number_of_courses + 1):
+        if course_id <= with_policies:
+            client, url = launched_client(course_id, 'student%d' % course_id, STUDENT_ROLES)
+        else:
+            client, url = launched_client(course_id, 'instructor%d' % course_id, INSTRUCTOR_ROLES)
+        requests.append((client.cookies[settings.SESSION_COOKIE_NAME].value, url))
+    return requests
+
+def measure_throughput(requests, threads, number_of_requests, round_trip_ms=0.0):
+    '''
+    Serves number_of_requests of the given requests, round robin, from a number of threads, as a gthread worker
+    with that many threads would. With one thread this is a sync worker. Every cache operation and query takes
+    round_trip_ms longer, as a round trip to Redis or Postgres on another host would; this requires the cache to
+    be a CountingLocMemCache.
+    :return: a dict of the number of threads, throughput in requests per second and p50/p95 latency in ms
+    '''
+    pending = queue.Queue()
+    for n in range(number_of_requests):
+        pending.put(requests[n % len(requests)])
+    latencies = []
+    errors = []
+
+    def delayed(execute, sql, params, many, context):
+        time.sleep(round_trip_ms / 1000.0)
+        return execute(sql, params, many, context)
+
+    def serve():
+        client = Client()
+        try:
+            with connection.execute_wrapper(delayed):
+                while True:
+                    try:
+                        session, url = pending.get_nowait()
+                    except queue.Empty:
+                        return
+                    client.cookies[settings.SESSION_COOKIE_NAME] = session
+                    started = time.perf_counter()
+                    response = client.get(url)
+                    latencies.append(time.perf_counter() - started)
+                    if response.status_code != 200:
+                        raise AssertionError('%s returned %d' % (url, response.status_code))
+        except Exception as e:
+            errors.append(e)
+        finally:
+            # Each thread opened its own database connection
+            connection.close()
+
+    CountingLocMemCache.latency = round_trip_ms / 1000.0
+    try:
+        workers = [threading.Thread(target=serve) for _ in range(threads)]
+        started = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - started
+    finally:
+        CountingLocMemCache.latency = 0.0
+    if errors:
+        raise errors[0]
+    return {
+        'threads': threads,
+        'requests': number_of_requests,
+        'requests_per_sec': round(number_of_requests / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 3),
+    }
+
+# How the database connection is managed in each run of the connection benchmark: the settings of
+# DATABASES['default'] to use, and the pool, if any
+CONNECTION_MODES = [
+    ('per-request', {'CONN_MAX_AGE': 0, 'CONN_HEALTH_CHECKS': False}, None),
+    ('persistent', {'CONN_MAX_AGE': 60, 'CONN_HEALTH_CHECKS': False}, None),
+    ('health-checked', {'CONN_MAX_AGE': 60, 'CONN_HEALTH_CHECKS': True}, None),
+    ('pooled', {'CONN_MAX_AGE': 0, 'CONN_HEALTH_CHECKS': True}, {'min_size': 1, 'max_size': 1}),
+]
+
+# No cache, and sessions carried by the client, so every view queries the database, as it does on a cache miss
+UNCACHED_SETTINGS = {
+    'CACHES': {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}},
+    'SESSION_ENGINE': 'policy_wizard.sessions',
+}
+
+class ConnectionBenchmarkRecorder(object):
+    '''
+    Collects the latency and the number of database connections opened of every request made, grouped by view.
+    The test client leaves connections open between requests, so every request closes the connections that are
+    broken or too old as it starts and finishes, as Django's request handler does.
+    '''
+
+    def __init__(self):
+        self.samples = {}
+
+    @contextmanager
+    def measure(self, view_name):
+        connects = []
+
+        def count(sender, connection, **kwargs):
+            connects.append(connection.alias)
+
+        connection_created.connect(count)
+        try:
+            started = time.perf_counter()
+            close_old_connections()
+            yield
+            close_old_connections()
+            elapsed = time.perf_counter() - started
+        finally:
+            connection_created.disconnect(count)
+        self.samples.setdefault(view_name, []).append((elapsed, len(connects)))
+
+    def report(self):
+        '''
+        :return: a dict, keyed on view name, of request count, p50/p95 latency in ms and mean connections opened
+        per request
+        '''
+        report = {}
+        for view_name, samples in sorted(self.samples.items()):
+            latencies = [elapsed for elapsed, _ in samples]
+            report[view_name] = {
+                'requests': len(samples),
+                'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+                'p95_ms': round(percentile(latencies, 95) * 1000, 3),
+                'connects_per_request': round(sum(n for _, n in samples) / float(len(samples)), 3),
+            }
+        return report
+
+def run_connection_benchmark(number_of_courses, students_per_course):
+    '''
+    Runs the launch benchmark once for each of the CONNECTION_MODES. Run it with UNCACHED_SETTINGS for every view
+    to query the database. Pooling needs the policy_wizard.postgresql backend, and is skipped with any other.
+    :return: a dict of ConnectionBenchmarkRecorder reports, keyed on connection mode
+    '''
+    settings_dict = connection.settings_dict
+    saved = {key: settings_dict.get(key) for key in ('CONN_MAX_AGE', 'CONN_HEALTH_CHECKS', 'OPTIONS')}
+    options = {name: value for name, value in settings_dict['OPTIONS'].items() if name != 'pool'}
+    results = {}
+    try:
+        for mode, mode_settings, pool in CONNECTION_MODES:
+            if pool and not hasattr(connection, 'pool_options'):
+                continue
+            connection.close()
+            settings_dict.update(mode_settings)
+            settings_dict['OPTIONS'] = dict(options, pool=pool) if pool else options
+            # Every run publishes its own policies in the same courses
+            Policies.objects.all().delete()
+            recorder = ConnectionBenchmarkRecorder()
+            run_launch_benchmark(number_of_courses, students_per_course, recorder)
+            results[mode] = recorder.report()
+    finally:
+        connection.close()
+        settings_dict.update(saved)
+        if hasattr(connection, 'pool_options'):
+            # The test database cannot be dropped while the pool keeps a connection to it. Only importable
+            # where psycopg2 is installed.
+            from .postgresql.base import close_pools
+            close_pools()
+    return results
+
+def compare_page_weight_with_baseline(report, baseline, tolerance):
+    '''
+    :return: a list of human readable regressions: pages that now take more requests or load more scripts
+    than in the baseline, or whose gzipped size grew by more than the tolerance (a fraction)
+    '''
+    regressions = []
+    for view_name, baseline_weight in sorted(baseline.items()):
+        weight = report.get(view_name)
+        if weight is None:
+            continue
+        for measure in ('requests', 'scripts'):
+            if weight[measure] > baseline_weight[measure]:
+                regressions.append('%s: %d %s, baseline %d' % (
+                    view_name, weight[measure], measure, baseline_weight[measure]))
+        if weight['gzip_bytes'] > baseline_weight['gzip_bytes'] * (1 + tolerance):
+            regressions.append('%s: %d bytes gzipped, baseline %d' % (
+                view_name, weight['gzip_bytes'], baseline_weight['gzip_bytes']))
+    return regressions
+
+def load_baseline(path):
+    with open(path) as baseline_file:
+        return json.load(baseline_file)
+
+def save_baseline(path, report):
+    with open(path, 'w') as baseline_file:
+        json.dump(report, baseline_file, indent=4, sort_keys=True)
+        baseline_file.write('\n')
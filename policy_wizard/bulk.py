@@ -0,0 +1,242 @@
+'''
+Publishes policies in many courses at once, e.g. into the new course shells of a term, from a mapping of course
+ids to either the policy template to publish or the course whose active policy to copy forward.
+
+The mapping is CSV with a header row, or JSON, a list of objects, with the keys:
+
+    course_id   - the Canvas course to publish in
+    context_id  - optional, the LTI context id of the course
+    template_id - the policy template to publish, or
+    copy_from   - the Canvas course whose active policy to copy
+
+Courses are published in chunks, each in a single transaction of a few bulk queries, so thousands of courses
+take seconds. A course's published policy replaces its active policy, as when an instructor publishes one. A chunk
+that keeps clashing with instructors publishing at the same time is left out, and its courses reported as failed,
+so the mapping can safely be published again.
+'''
+import csv
+import io
+import json
+import logging
+from collections import defaultdict
+
+from django.db import IntegrityError, transaction
+
+from .cache import invalidate_student_policy_pages
+from .models import Policies, PolicyTemplates, PolicyVersion, CoursePolicy
+from .usage import add_template_usage_many
+
+logger = logging.getLogger(__name__)
+
+BULK_PUBLISH_CHUNK_SIZE = 500
+# How many times a chunk is attempted when an instructor publishing in one of its courses wins the race
+BULK_PUBLISH_ATTEMPTS = 3
+
+class BulkPublishError(ValueError):
+    '''
+    Raised for a course mapping that cannot be published, before anything is written
+    '''
+
+def parse_course_mapping(content, mapping_format):
+    '''
+    :param content: the mapping, as text
+    :param mapping_format: 'csv' or 'json'
+    :return: the mapping as a list of dicts
+    '''
+    if mapping_format == 'csv':
+        return list(csv.DictReader(io.StringIO(content)))
+    elif mapping_format == 'json':
+        try:
+            rows = json.loads(content)
+        except ValueError as e:
+            raise BulkPublishError('Invalid JSON: %s' % e)
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise BulkPublishError('The JSON mapping must be a list of objects')
+        return rows
+    raise BulkPublishError('Unknown format %r' % mapping_format)
+
+def _optional_int(row, key, line):
+    value = row.get(key)
+    if value in (None, ''):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise BulkPublishError('Row %d: %s must be a number, not %r' % (line, key, value))
+
+def _validate_mapping(rows):
+    courses = []
+    seen = set()
+    for line, row in enumerate(rows, start=1):
+        course_id = _optional_int(row, 'course_id', line)
+        template_id = _optional_int(row, 'template_id', line)
+        copy_from = _optional_int(row, 'copy_from', line)
+        if course_id is None:
+            raise BulkPublishError('Row %d: course_id is missing' % line)
+        if course_id in seen:
+            raise BulkPublishError('Row %d: course %d is listed more than once' % (line, course_id))
+        if (template_id is None) == (copy_from is None):
+            raise BulkPublishError('Row %d: give either template_id or copy_from' % line)
+        seen.add(course_id)
+        courses.append({
+            'course_id': course_id,
+            'context_id': row.get('context_id') or None,
+            'template_id': template_id,
+            'copy_from': copy_from,
+        })
+    return courses
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+def _source_policies(course_ids, chunk_size):
+    '''
+    :return: the active policies of the given courses, keyed on course id
+    '''
+    sources = {}
+    for chunk in _chunks(sorted(course_ids), chunk_size):
+        for policy in Policies.objects.filter(course_id__in=chunk, is_active=True).only(
+                'course_id', 'related_template_id', 'body', 'rendered_body', 'body_hash'):
+            sources[policy.course_id] = policy
+    return sources
+
+def _template_id(source):
+    return source.pk if isinstance(source, PolicyTemplates) else source.related_template_id
+
+def _publish_chunk(courses, published_by, template_hashes):
+    '''
+    Publishes the (course, source) pairs, where a source is the template or policy whose body is published,
+    replacing the active policies of the courses and recording a new version of each
+    '''
+    course_ids = [course['course_id'] for course, _ in courses]
+    with transaction.atomic():
+        replaced_template_ids = list(Policies.objects.select_for_update().filter(
+            course_id__in=course_ids, is_active=True).values_list('related_template_id', flat=True))
+        Policies.objects.filter(course_id__in=course_ids, is_active=True).update(is_active=False)
+        # Bodies are copied already rendered, which bulk_create would not do
+        Policies.objects.bulk_create([
+            Policies(
+                course_id=course['course_id'],
+                context_id=course['context_id'],
+                related_template_id=_template_id(source),
+                published_by=published_by,
+                is_published=True,
+                is_active=True,
+                body=source.body,
+                rendered_body=source.rendered_body,
+                body_hash=source.body_hash,
+            )
+            for course, source in courses
+        ])
+        # Not every database returns the primary keys of bulk inserted rows, but each course now has exactly one
+        # active policy
+        policies = Policies.objects.filter(course_id__in=course_ids, is_active=True).only('pk', 'course_id')
+        policy_ids = {policy.course_id: policy.pk for policy in policies}
+
+        course_policies = CoursePolicy.objects.select_for_update().in_bulk(course_ids)
+        new_course_ids = {course_id for course_id in course_ids if course_id not in course_policies}
+        for course_id in new_course_ids:
+            course_policies[course_id] = CoursePolicy(course_id=course_id)
+        for course_id in course_ids:
+            course_policies[course_id].version_count += 1
+
+        # Many courses usually share a few bodies, so compress each only once
+        compressed_bodies = {}
+        for _, source in courses:
+            if source.body_hash not in compressed_bodies:
+                compressed_bodies[source.body_hash] = PolicyVersion.compress(source.rendered_body)
+        PolicyVersion.objects.bulk_create([
+            PolicyVersion(
+                course_id=course['course_id'],
+                number=course_policies[course['course_id']].version_count,
+                policy_id=policy_ids[course['course_id']],
+                published_by=published_by,
+                compressed_body=compressed_bodies[source.body_hash],
+            )
+            for course, source in courses
+        ])
+        # Each of the new policies has a single version
+        version_ids = dict(PolicyVersion.objects.filter(policy_id__in=policy_ids.values()).values_list('policy_id', 'pk'))
+        for course_id in course_ids:
+            course_policies[course_id].current_version_id = version_ids[policy_ids[course_id]]
+
+        CoursePolicy.objects.bulk_create([course_policies[course_id] for course_id in new_course_ids])
+        CoursePolicy.objects.bulk_update(
+            [course_policies[course_id] for course_id in course_ids if course_id not in new_course_ids],
+            ['current_version', 'version_count'])
+
+        usage = defaultdict(lambda: defaultdict(int))
+        for template_id in replaced_template_ids:
+            usage[template_id]['active_courses'] -= 1
+        for _, source in courses:
+            template_id = _template_id(source)
+            usage[template_id]['active_courses'] += 1
+            usage[template_id]['published'] += 1
+            if template_id is not None and source.body_hash != template_hashes[template_id]:
+                usage[template_id]['published_with_changes'] += 1
+        add_template_usage_many(usage)
+    invalidate_student_policy_pages(course_ids)
+
+def _publish_chunk_with_retries(courses, published_by, template_hashes):
+    '''
+    Publishes a chunk, again if an instructor published in one of its courses in the meantime, which breaks the
+    one active policy per course constraint
+    :return: whether the chunk was published. If not, none of it was.
+    '''
+    for attempt in range(1, BULK_PUBLISH_ATTEMPTS + 1):
+        try:
+            _publish_chunk(courses, published_by, template_hashes)
+            return True
+        except IntegrityError:
+            logger.warning('Bulk publish of courses %d to %d clashed with another publish (attempt %d of %d)',
+                           courses[0][0]['course_id'], courses[-1][0]['course_id'], attempt, BULK_PUBLISH_ATTEMPTS)
+    return False
+
+def bulk_publish_policies(rows, published_by, chunk_size=BULK_PUBLISH_CHUNK_SIZE, progress=None):
+    '''
+    Publishes policies in every course of the mapping, chunk_size courses per transaction.
+
+    :param rows: the course mapping, as returned by parse_course_mapping
+    :param published_by: recorded as the publisher of every policy
+    :param progress: optional callable, called with the number of courses done and the total after each chunk
+    :return: a dict of the number of courses published, the ids of those published, the ids of those that failed
+    because instructors kept publishing in their chunk at the same time, and the ids of those skipped because the
+    course to copy from has no active policy
+    :raises BulkPublishError: if the mapping is invalid or names a template that does not exist, in which
+    case nothing is published
+    '''
+    courses = _validate_mapping(rows)
+    template_ids = {course['template_id'] for course in courses if course['template_id'] is not None}
+    templates = PolicyTemplates.objects.only('body', 'rendered_body', 'body_hash').in_bulk(template_ids)
+    missing_templates = template_ids - set(templates)
+    if missing_templates:
+        raise BulkPublishError('No policy template with id %s' % ', '.join(str(pk) for pk in sorted(missing_templates)))
+    sources = _source_policies({course['copy_from'] for course in courses if course['copy_from'] is not None},
+                               chunk_size)
+
+    to_publish = []
+    skipped = []
+    for course in courses:
+        if course['template_id'] is not None:
+            to_publish.append((course, templates[course['template_id']]))
+        elif course['copy_from'] in sources:
+            to_publish.append((course, sources[course['copy_from']]))
+        else:
+            skipped.append(course['course_id'])
+
+    # The body hash of every template, to tell the policies that were changed from their template
+    template_hashes = dict(PolicyTemplates.objects.filter(
+        pk__in={_template_id(source) for _, source in to_publish}).values_list('pk', 'body_hash'))
+
+    published = []
+    failed = []
+    for chunk in _chunks(to_publish, chunk_size):
+        course_ids = [course['course_id'] for course, _ in chunk]
+        if _publish_chunk_with_retries(chunk, published_by, template_hashes):
+            published += course_ids
+        else:
+            failed += course_ids
+        if progress is not None:
+            progress(len(published) + len(failed), len(to_publish))
+    return {'published': len(published), 'published_course_ids': published, 'failed': failed, 'skipped': skipped}
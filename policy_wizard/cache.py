@@ -0,0 +1,326 @@
+import pickle
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+from .models import Policies
+from .queries import active_policy_for_display, active_policy_validators, active_policies_for_display, \
+    active_policy_hashes, template_catalogue
+from .metrics import record_cache_lookup
+from .local_cache import LocalLRUCache
+
+NO_ACTIVE_POLICY_MESSAGE = "There is no published academic integrity policy in record for this course."
+# ETag of the student policy page of a course without an active policy
+NO_ACTIVE_POLICY_ETAG = 'no-active-policy'
+
+# How often a request waiting for another to render a page looks for it, in seconds
+STUDENT_POLICY_LOCK_POLL = 0.05
+
+TEMPLATE_CATALOGUE_KEY = 'policy_template_catalogue'
+# Changed whenever an administrator saves a template, to tell every process to drop its copy of the catalogue
+TEMPLATES_VERSION_KEY = 'policy_templates_version'
+# The views the template lists link to, one per role, and the button that does so
+TEMPLATE_LIST_LEVELS = {
+    'admin_level_template_edit': 'Update',
+    'instructor_level_policy_edit': 'Choose',
+}
+
+def student_policy_cache_key(course_id):
+    '''
+    Key under which the fully rendered student policy page of a course is cached
+    '''
+    return 'student_active_policy:%s' % course_id
+
+def student_policy_lock_key(course_id):
+    '''
+    Key of the lock held by the request rendering the student policy page of a course
+    '''
+    return 'student_active_policy_lock:%s' % course_id
+
+def student_policy_validators(course_id):
+    '''
+    Returns the ETag and Last-Modified of the student policy page of the course, read with a query that
+    loads neither the policy body nor anything else the page needs
+    '''
+    return active_policy_validators(course_id) or (NO_ACTIVE_POLICY_ETAG, None)
+
+def build_student_policy_page(course_id):
+    '''
+    Renders the page a student of the course sees, i.e. the active policy or, if there is none,
+    a short notice saying so. Returns it as a dict of the page and its ETag and Last-Modified.
+    '''
+    try:
+        # If an active policy exists (there is at most 1)...
+        active_policy = active_policy_for_display(course_id)
+    except Policies.DoesNotExist: #If no active policy exists ...
+        return {'page': NO_ACTIVE_POLICY_MESSAGE, 'etag': NO_ACTIVE_POLICY_ETAG, 'last_modified': None}
+    return _student_policy_page_entry(active_policy)
+
+def _student_policy_page_entry(active_policy):
+    return {
+        'page': render_to_string('student_active_policy.html', {'active_policy': active_policy}),
+        'etag': active_policy.body_hash,
+        'last_modified': active_policy.updated_at,
+    }
+
+def _fresh(entry):
+    '''
+    Stamps a student policy page with the time until which it is served without being re-rendered
+    '''
+    entry['fresh_until'] = time.time() + settings.STUDENT_POLICY_CACHE_TIMEOUT
+    return entry
+
+def _student_policy_cache_timeout():
+    # Entries outlive their freshness so they can be served stale while one request re-renders them
+    return settings.STUDENT_POLICY_CACHE_TIMEOUT + settings.STUDENT_POLICY_STALE_TIMEOUT
+
+def get_cached_student_policy_page(course_id):
+    '''
+    Returns the student policy page of the course, as built by build_student_policy_page, if it is cached,
+    otherwise None. If the cached page is stale, the one request that takes the course's lock re-renders it,
+    while the others are served the stale page.
+    '''
+    entry = cache.get(student_policy_cache_key(course_id))
+    record_cache_lookup(hit=entry is not None)
+    if entry is not None and entry.get('fresh_until', 0) < time.time():
+        if cache.add(student_policy_lock_key(course_id), True, settings.STUDENT_POLICY_LOCK_TIMEOUT):
+            entry = cache_student_policy_page(course_id)
+    return entry
+
+def load_student_policy_page(course_id):
+    '''
+    Renders and caches the student policy page of the course after a miss. Only the request that takes the
+    course's lock renders it; the others wait for that page, for up to STUDENT_POLICY_LOCK_WAIT seconds,
+    and only render it themselves if it has not appeared by then.
+    '''
+    if not cache.add(student_policy_lock_key(course_id), True, settings.STUDENT_POLICY_LOCK_TIMEOUT):
+        deadline = time.time() + settings.STUDENT_POLICY_LOCK_WAIT
+        while time.time() < deadline:
+            time.sleep(STUDENT_POLICY_LOCK_POLL)
+            entry = cache.get(student_policy_cache_key(course_id))
+            if entry is not None:
+                return entry
+    # The lock is not released, but left to expire: by then the page is fresh, and invalidating it drops the lock
+    return cache_student_policy_page(course_id)
+
+def cache_student_policy_page(course_id):
+    '''
+    Renders the student policy page of the course and stores it in the cache, unless the course's policy changed
+    while it was being rendered
+    '''
+    entry = _fresh(build_student_policy_page(course_id))
+    cache.set(student_policy_cache_key(course_id), entry, _student_policy_cache_timeout())
+    discard_outdated_student_policy_pages({course_id: entry['etag']})
+    return entry
+
+def discard_outdated_student_policy_pages(etags):
+    '''
+    Deletes the just stored student policy pages, given as a dict of course id to the ETag of the page, whose
+    course's policy changed while they were being rendered. Such a page was rendered before an instructor
+    published and stored after the publish invalidated the cache, so it would otherwise be served until it
+    expires. Must be called after the pages have been stored.
+    '''
+    # The course ids of sessions are strings
+    hashes = {str(course_id): body_hash for course_id, body_hash in active_policy_hashes(list(etags)).items()}
+    outdated = [course_id for course_id, etag in etags.items()
+                if hashes.get(str(course_id), NO_ACTIVE_POLICY_ETAG) != etag]
+    if outdated:
+        cache.delete_many([student_policy_cache_key(course_id) for course_id in outdated])
+    return outdated
+
+def invalidate_student_policy_page(course_id):
+    '''
+    Drops the cached student policy page of the course, and its lock, so the next request re-renders it at
+    once. Must be called after any change to the course's policies has been written to the database.
+    '''
+    cache.delete_many([student_policy_cache_key(course_id), student_policy_lock_key(course_id)])
+
+def invalidate_student_policy_pages(course_ids):
+    '''
+    Drops the cached student policy pages of many courses at once
+    '''
+    cache.delete_many([key for course_id in course_ids
+                       for key in (student_policy_cache_key(course_id), student_policy_lock_key(course_id))])
+
+_local_cache = LocalLRUCache(settings.LOCAL_CACHE_MAX_ENTRIES)
+
+def reset_local_cache():
+    '''
+    Drops everything this process keeps in front of the cache
+    '''
+    _local_cache.clear()
+
+def _templates_version():
+    '''
+    Returns the version of the policy templates, read from the cache at most once every LOCAL_CACHE_TIMEOUT
+    seconds by each process
+    '''
+    version = _local_cache.get(TEMPLATES_VERSION_KEY)
+    if version is None:
+        version = cache.get(TEMPLATES_VERSION_KEY)
+        if version is None:
+            cache.add(TEMPLATES_VERSION_KEY, uuid.uuid4().hex, None)
+            version = cache.get(TEMPLATES_VERSION_KEY)
+        _local_cache.set(TEMPLATES_VERSION_KEY, version, settings.LOCAL_CACHE_TIMEOUT)
+    return version
+
+def get_template_catalogue():
+    '''
+    Returns every policy template, in a stable order, fetched with a single query and cached
+    until an administrator updates a template. Each process also keeps the catalogue, and serves it without
+    a round trip until it sees that the templates version changed.
+    '''
+    if settings.LOCAL_CACHE_TIMEOUT:
+        local_key = '%s:%s' % (TEMPLATE_CATALOGUE_KEY, _templates_version())
+        catalogue = _local_cache.get(local_key)
+        if catalogue is not None:
+            record_cache_lookup(hit=True)
+            return catalogue
+    # The version is read along with the catalogue, so it is known from before the database is read on a miss
+    cached = cache.get_many([TEMPLATE_CATALOGUE_KEY, TEMPLATES_VERSION_KEY])
+    catalogue = cached.get(TEMPLATE_CATALOGUE_KEY)
+    record_cache_lookup(hit=catalogue is not None)
+    if catalogue is None:
+        catalogue = template_catalogue()
+        cache_template_catalogue(catalogue, cached.get(TEMPLATES_VERSION_KEY))
+    if settings.LOCAL_CACHE_TIMEOUT:
+        _local_cache.set(local_key, catalogue)
+    return catalogue
+
+def cache_template_catalogue(catalogue, version):
+    '''
+    Stores the template catalogue read from the database, unless an administrator saved a template since version,
+    the templates version read from the cache before the catalogue was read. Such a catalogue may have been read
+    before the save and stored after it invalidated the cache, so it would otherwise be served until it expires.
+
+    :return: whether the catalogue was kept
+    '''
+    if not cache.add(TEMPLATE_CATALOGUE_KEY, catalogue, settings.TEMPLATE_CATALOGUE_CACHE_TIMEOUT):
+        return False
+    # invalidate_template_catalogue changes the version before deleting the catalogue, so either it deletes
+    # this one or the version has already changed
+    if cache.get(TEMPLATES_VERSION_KEY) != version:
+        cache.delete(TEMPLATE_CATALOGUE_KEY)
+        return False
+    return True
+
+def invalidate_template_catalogue():
+    '''
+    Drops the cached template catalogue, here and, within LOCAL_CACHE_TIMEOUT seconds, in every other process.
+    Must be called after a template has been saved.
+    '''
+    cache.set(TEMPLATES_VERSION_KEY, uuid.uuid4().hex, None)
+    cache.delete(TEMPLATE_CATALOGUE_KEY)
+    _local_cache.clear()
+
+def template_panel_cache_key(pk, updated_at, list_level):
+    '''
+    Key under which the panel of a version of a policy template, as shown in the list of the given level, is cached
+    '''
+    return 'policy_template_panel:%s:%s:%s' % (pk, updated_at.isoformat(), list_level)
+
+def get_template_panels(policy_templates, list_level):
+    '''
+    Returns the rendered panels of the policy templates, as shown in the list of the given level. The panels
+    are fetched from the cache with a single round trip, and any that are missing rendered and cached with another.
+    '''
+    if not policy_templates:
+        return []
+    keys = [template_panel_cache_key(policy_template.pk, policy_template.updated_at, list_level)
+            for policy_template in policy_templates]
+    panels = {}
+    if settings.LOCAL_CACHE_TIMEOUT:
+        # A panel's key names the version of the template it shows, so the copies kept here never go stale
+        for key in keys:
+            panel = _local_cache.get(key)
+            if panel is not None:
+                panels[key] = panel
+    local_panels = set(panels)
+    if len(panels) < len(keys):
+        panels.update(cache.get_many([key for key in keys if key not in panels]))
+    record_cache_lookup(hit=len(panels) == len(keys))
+    missing = {}
+    for key, policy_template in zip(keys, policy_templates):
+        if key not in panels:
+            missing[key] = render_to_string('policy_template_panel.html', {
+                'policy_template': policy_template,
+                'list_level': list_level,
+                'button_text': TEMPLATE_LIST_LEVELS[list_level],
+            })
+    if missing:
+        cache.set_many(missing, settings.TEMPLATE_CATALOGUE_CACHE_TIMEOUT)
+        panels.update(missing)
+    if settings.LOCAL_CACHE_TIMEOUT:
+        for key in keys:
+            if key not in local_panels:
+                _local_cache.set(key, panels[key])
+    return [mark_safe(panels[key]) for key in keys]
+
+def invalidate_template_panels(pk, updated_at):
+    '''
+    Drops the cached panels of a version of a policy template. Panels are cached per version, so a saved
+    template is never shown from its old panels; this only frees them.
+    '''
+    cache.delete_many([template_panel_cache_key(pk, updated_at, list_level) for list_level in TEMPLATE_LIST_LEVELS])
+
+def warm_policy_cache(batch_size=500, after_course_id=None, force=False, progress=None):
+    '''
+    Caches the template catalogue, unless it is cached already or a template was saved while it was read, the
+    panels of the template lists and the student policy page of every course with an active policy, e.g. before
+    the start of term. Active policies are read a batch at a time in course
+    order; each batch takes one round trip to find the pages already cached, unless force is given, and one to
+    set_many the rest, after which the pages of courses an instructor published in meanwhile are deleted again.
+    Since cached pages are skipped, running it again is cheap.
+
+    :param after_course_id: optional, to resume after the last course a previous run reported
+    :param progress: optional callable, called with the last course id of each batch, and the stats so far
+    :return: a dict of the number of keys written and skipped, the bytes written and the seconds taken
+    '''
+    started = time.perf_counter()
+    stats = {'keys': 0, 'skipped': 0, 'bytes': 0}
+
+    def write(entries, timeout):
+        cache.set_many(entries, timeout)
+        stats['keys'] += len(entries)
+        # As Redis stores them
+        stats['bytes'] += sum(len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL)) for value in entries.values())
+
+    version = cache.get(TEMPLATES_VERSION_KEY)
+    catalogue = template_catalogue()
+    # Not kept if an administrator saved a template while it was being read, like a catalogue read on a miss
+    if cache_template_catalogue(catalogue, version):
+        stats['keys'] += 1
+        stats['bytes'] += len(pickle.dumps(catalogue, pickle.HIGHEST_PROTOCOL))
+    entries = {}
+    for list_level, button_text in TEMPLATE_LIST_LEVELS.items():
+        for policy_template in catalogue:
+            entries[template_panel_cache_key(policy_template.pk, policy_template.updated_at, list_level)] = \
+                render_to_string('policy_template_panel.html', {
+                    'policy_template': policy_template,
+                    'list_level': list_level,
+                    'button_text': button_text,
+                })
+    write(entries, settings.TEMPLATE_CATALOGUE_CACHE_TIMEOUT)
+
+    while True:
+        policies = active_policies_for_display(after_course_id, batch_size)
+        if not policies:
+            break
+        keys = {student_policy_cache_key(policy.course_id): policy for policy in policies}
+        cached = set() if force else set(cache.get_many(list(keys)))
+        stats['skipped'] += len(cached)
+        entries = {key: _fresh(_student_policy_page_entry(policy)) for key, policy in keys.items() if key not in cached}
+        if entries:
+            write(entries, _student_policy_cache_timeout())
+            # Instructors may have published in some of the courses since the batch was read
+            stats['keys'] -= len(discard_outdated_student_policy_pages(
+                {keys[key].course_id: entry['etag'] for key, entry in entries.items()}))
+        after_course_id = policies[-1].course_id
+        if progress is not None:
+            progress(after_course_id, stats)
+
+    stats['seconds'] = round(time.perf_counter() - started, 3)
+    return stats
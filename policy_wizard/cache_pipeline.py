@@ -0,0 +1,78 @@
+'''
+A thin facade over the cache that queues reads and writes and sends them in one round trip: a Redis pipeline
+with the django-redis-cache backend. Other backends run the operations one at a time, unless they provide a
+run_pipeline method that takes the queued operations as callables, as the benchmark's stand-in for Redis does.
+'''
+from django.core.cache import cache as default_cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+class CachePipeline(object):
+
+    def __init__(self, cache=None):
+        self.cache = cache if cache is not None else default_cache
+        self.operations = []
+
+    def get(self, key):
+        self.operations.append(('get', key, None, None))
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT):
+        self.operations.append(('add', key, value, timeout))
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT):
+        self.operations.append(('set', key, value, timeout))
+
+    def execute(self):
+        '''
+        Sends the queued operations and clears the queue
+        :return: the result of each operation, in the order they were queued: the value, or None, for get, and
+        whether the value was stored for add and set
+        '''
+        operations, self.operations = self.operations, []
+        if not operations:
+            return []
+        if getattr(self.cache, 'master_client', None) is not None:
+            return self._execute_on_redis(operations)
+        calls = [self._call(operation) for operation in operations]
+        run_pipeline = getattr(self.cache, 'run_pipeline', None)
+        if run_pipeline is not None:
+            return run_pipeline(calls)
+        return [call() for call in calls]
+
+    def _call(self, operation):
+        command, key, value, timeout = operation
+        if command == 'get':
+            return lambda: self.cache.get(key)
+        elif command == 'add':
+            return lambda: self.cache.add(key, value, timeout)
+        # Django's backends return None from set
+        return lambda: self.cache.set(key, value, timeout) is not False
+
+    def _execute_on_redis(self, operations):
+        # The same steps django-redis-cache takes for each operation, queued on a pipeline instead of sent
+        pipeline = self.cache.master_client.pipeline(transaction=False)
+        queued = []
+        for command, key, value, timeout in operations:
+            versioned_key = self.cache.make_key(key)
+            if command == 'get':
+                pipeline.get(versioned_key)
+            else:
+                timeout = self.cache.get_timeout(timeout)
+                if timeout is not None and timeout < 0:
+                    # Not sent at all, as django-redis-cache does
+                    queued.append(False)
+                    continue
+                self.cache._set(pipeline, versioned_key, self.cache.prep_value(value), timeout,
+                                _add_only=command == 'add')
+            queued.append(True)
+        replies = iter(pipeline.execute())
+        results = []
+        for (command, _, _, _), sent in zip(operations, queued):
+            if not sent:
+                results.append(False)
+                continue
+            result = next(replies)
+            if command == 'get':
+                results.append(None if result is None else self.cache.get_value(result))
+            else:
+                results.append(bool(result))
+        return results
@@ -0,0 +1,46 @@
+'''
+Django's cache session engine, writing new sessions without first looking their key up, and able to write a
+session as part of a CachePipeline, so a launch can save it in the same round trip as other cache operations.
+
+Enable it with SESSION_ENGINE = 'policy_wizard.cache_sessions' (the 'cache' session mode in settings).
+'''
+from django.contrib.sessions.backends import cache
+from django.contrib.sessions.backends.base import VALID_KEY_CHARS, CreateError
+from django.utils.crypto import get_random_string
+
+class SessionStore(cache.SessionStore):
+
+    def __init__(self, session_key=None):
+        super(SessionStore, self).__init__(session_key)
+        self._saved_in_pipeline = False
+
+    def _get_new_session_key(self):
+        # New sessions are written with add, which fails for a key in use, so there is no need to look it up first
+        return get_random_string(32, VALID_KEY_CHARS)
+
+    def queue_save(self, pipeline):
+        '''
+        Queues writing the session on the pipeline, creating it if it has no key yet. Once the pipeline has been
+        executed, pass the result of the write to saved_in_pipeline.
+        '''
+        if self.session_key is None:
+            self._session_key = self._get_new_session_key()
+            pipeline.add(self.cache_key, self._get_session(no_load=True), self.get_expiry_age())
+        else:
+            pipeline.set(self.cache_key, self._get_session(), self.get_expiry_age())
+
+    def saved_in_pipeline(self, saved):
+        '''
+        Records the result of the write queued by queue_save, so the session middleware does not write the
+        session again. If it failed, e.g. because the new key was taken, the middleware saves it as usual.
+        '''
+        if saved:
+            self._saved_in_pipeline = True
+        else:
+            self._session_key = None
+
+    def save(self, must_create=False):
+        if self._saved_in_pipeline and not must_create:
+            self._saved_in_pipeline = False
+            return
+        super(SessionStore, self).save(must_create)
@@ -1,5 +1,8 @@
 from functools import wraps
+from django.conf import settings
 from django.core.exceptions import PermissionDenied
+from django.utils.crypto import constant_time_compare
+from django.views.decorators.csrf import csrf_exempt
 from . import roles
 
 def require_role(permitted_role):
@@ -19,3 +22,19 @@ def require_role(permitted_role):
 require_role_administrator = require_role(roles.ADMINISTRATOR)
 require_role_instructor = require_role(roles.INSTRUCTOR)
 require_role_student = require_role(roles.STUDENT)
+
+def require_api_token(view_function):
+    '''
+    Lets through only requests that carry BULK_API_TOKEN as "Authorization: Bearer <token>". They come from
+    scripts rather than from a launched session, so there is no CSRF token to check.
+    '''
+    @csrf_exempt
+    @wraps(view_function)
+    def wrapper(request, *args, **kwargs):
+        scheme, _, token = request.META.get('HTTP_AUTHORIZATION', '').partition(' ')
+        if not settings.BULK_API_TOKEN or scheme.lower() != 'bearer' \
+                or not constant_time_compare(token.strip(), settings.BULK_API_TOKEN):
+            raise PermissionDenied
+        return view_function(request, *args, **kwargs)
+
+    return wrapper
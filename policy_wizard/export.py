@@ -0,0 +1,90 @@
+'''
+Exports the active policy of every course, with who published it and the template it came from, for compliance
+audits. Rows are read with a database cursor a chunk at a time and written out as they are read, so memory use
+stays flat however many policies there are.
+'''
+import csv
+import json
+
+from django.utils.dateparse import parse_date
+
+from .models import Policies
+
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_COLUMNS = [
+    ('course_id', 'course_id'),
+    ('context_id', 'context_id'),
+    ('published_by', 'published_by'),
+    ('related_template_id', 'related_template_id'),
+    ('related_template__name', 'related_template_name'),
+    ('created_at', 'created_at'),
+    ('updated_at', 'updated_at'),
+    ('body_hash', 'body_hash'),
+    ('rendered_body', 'body'),
+]
+EXPORT_FIELDS = [field for field, _ in EXPORT_COLUMNS]
+EXPORT_HEADER = [column for _, column in EXPORT_COLUMNS]
+
+def export_policies(since=None, until=None, template_id=None):
+    '''
+    :param since: optional date, the first on which a policy was last published or edited
+    :param until: optional date, the last on which a policy was last published or edited
+    :param template_id: optional, only policies made from this template
+    :return: an iterator over the active policies, as tuples of values in EXPORT_HEADER order
+    '''
+    policies = Policies.objects.filter(is_active=True)
+    if since is not None:
+        policies = policies.filter(updated_at__date__gte=since)
+    if until is not None:
+        policies = policies.filter(updated_at__date__lte=until)
+    if template_id is not None:
+        policies = policies.filter(related_template_id=template_id)
+    return policies.order_by('course_id').values_list(*EXPORT_FIELDS).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+def parse_export_filters(since=None, until=None, template_id=None):
+    '''
+    Parses the filters of export_policies given as text, e.g. in query parameters, where empty means no filter
+    :raises ValueError: if a date is not YYYY-MM-DD or the template id is not a number
+    '''
+    filters = {}
+    for name, value in (('since', since), ('until', until)):
+        if value:
+            filters[name] = parse_date(value)
+            if filters[name] is None:
+                raise ValueError('%s must be a date, YYYY-MM-DD' % name)
+    if template_id:
+        if not str(template_id).isdigit():
+            raise ValueError('template_id must be a number')
+        filters['template_id'] = int(template_id)
+    return filters
+
+class _Echo(object):
+    '''
+    A file-like object that hands back what is written to it, so csv.writer can format one row at a time
+    '''
+
+    def write(self, value):
+        return value
+
+def csv_lines(rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_HEADER)
+    for row in rows:
+        yield writer.writerow(row)
+
+def json_lines(rows):
+    '''
+    Yields a JSON array of objects, one object per line
+    '''
+    yield '[\n'
+    separator = ''
+    for row in rows:
+        yield separator + json.dumps(dict(zip(EXPORT_HEADER, row)), default=str)
+        separator = ',\n'
+    yield '\n]\n'
+
+EXPORT_FORMATS = {
+    'csv': (csv_lines, 'text/csv'),
+    'json': (json_lines, 'application/json'),
+}
@@ -0,0 +1,49 @@
+'''
+A small least-recently-used cache held in each process, in front of the configured cache, for lookups that
+rarely change, such as the policy template catalogue. A hit costs no network round trip. Values are shared by
+every thread of the process, not copied, so callers must not modify them.
+'''
+import threading
+import time
+from collections import OrderedDict
+
+class LocalLRUCache(object):
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        '''
+        :return: the value cached under key, or None if there is none or it expired
+        '''
+        with self._lock:
+            try:
+                value, expires_at = self._entries[key]
+            except KeyError:
+                return None
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout=None):
+        '''
+        Caches value under key for timeout seconds, or until it is evicted if timeout is None, evicting the
+        least recently used entry if the cache is full
+        '''
+        expires_at = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
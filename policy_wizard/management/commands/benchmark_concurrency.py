@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from policy_wizard.benchmark import COUNTING_CACHES, benchmark_databases, concurrency_benchmark_requests, \
+    measure_throughput
+
+class Command(BaseCommand):
+    help = (
+        'Serves the student policy page and the policy templates list from one thread, as a sync worker does, '
+        'and from a pool of threads, as a gthread worker does, with every cache operation and query taking as '
+        'long as a network round trip, and reports the throughput and latency of each. Runs against throwaway '
+        'test databases and an in-process cache.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, nargs='+', default=[1, 8],
+                            help='Numbers of threads per worker to compare (default: %(default)s)')
+        parser.add_argument('--requests', type=int, default=1000, help='Requests to serve with each')
+        parser.add_argument('--courses', type=int, default=20, help='Number of courses to launch in')
+        parser.add_argument('--round-trip-ms', type=float, default=1.0,
+                            help='Time each cache operation and query waits on the network (default: %(default)s)')
+
+    def handle(self, *args, **options):
+        with override_settings(CACHES=COUNTING_CACHES):
+            with benchmark_databases():
+                requests = concurrency_benchmark_requests(options['courses'])
+                results = [measure_throughput(requests, threads, options['requests'], options['round_trip_ms'])
+                           for threads in options['threads']]
+
+        row = '{:>8} {:>9} {:>9} {:>9}'
+        self.stdout.write(row.format('threads', 'req/s', 'p50 ms', 'p95 ms'))
+        for result in results:
+            self.stdout.write(row.format(result['threads'], result['requests_per_sec'], result['p50_ms'],
+                                         result['p95_ms']))
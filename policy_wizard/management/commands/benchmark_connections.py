@@ -0,0 +1,35 @@
+import json
+
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from policy_wizard.benchmark import UNCACHED_SETTINGS, benchmark_databases, run_connection_benchmark
+
+class Command(BaseCommand):
+    help = (
+        'Runs the launch benchmark with the database connection opened for every request, kept between requests, '
+        'kept and health checked, and taken from a pool, and reports the latency and connections opened per '
+        'request of each view. The cache is switched off, so every view queries the database. Runs against '
+        'throwaway test databases; point it at a local Postgres to measure the cost of connecting.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--courses', type=int, default=10, help='Number of courses to launch in')
+        parser.add_argument('--students', type=int, default=10, help='Number of students launching per course')
+        parser.add_argument('--keepdb', action='store_true', help='Preserve the test database between runs')
+        parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+
+    def handle(self, *args, **options):
+        with override_settings(**UNCACHED_SETTINGS):
+            with benchmark_databases(keepdb=options['keepdb']):
+                results = run_connection_benchmark(options['courses'], options['students'])
+
+        if options['json']:
+            self.stdout.write(json.dumps(results, indent=4, sort_keys=True))
+            return
+        row = '{:<16} {:<28} {:>9} {:>9} {:>9} {:>12}'
+        self.stdout.write(row.format('mode', 'view', 'requests', 'p50 ms', 'p95 ms', 'connects'))
+        for mode, report in results.items():
+            for view_name, stats in report.items():
+                self.stdout.write(row.format(mode, view_name, stats['requests'], stats['p50_ms'], stats['p95_ms'],
+                                             stats['connects_per_request']))
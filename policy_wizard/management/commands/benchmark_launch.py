@@ -0,0 +1,81 @@
+import json
+import os
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+
+from policy_wizard.benchmark import COUNTING_CACHES, BenchmarkRecorder, benchmark_databases, compare_with_baseline, \
+    load_baseline, run_launch_benchmark, save_baseline
+
+DEFAULT_BASELINE = os.path.join(settings.BASE_DIR, 'benchmarks', 'launch_baseline.json')
+
+SESSION_ENGINES = {
+    'cache': 'policy_wizard.cache_sessions',
+    'signed': 'policy_wizard.sessions',
+}
+
+class Command(BaseCommand):
+    help = (
+        'Sends signed LTI launches for the instructor and the students of a number of courses, follows them to '
+        'the policy templates list and the student policy page, and reports p50/p95/p99 latency, queries per '
+        'request and throughput per view. Runs against throwaway test databases and fails if a view regressed '
+        'against the stored baseline.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--courses', type=int, default=20, help='Number of courses to launch in')
+        parser.add_argument('--students', type=int, default=25, help='Number of students launching per course')
+        parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                            help='Baseline to compare against, if it exists (default: %(default)s)')
+        parser.add_argument('--save-baseline', action='store_true', help='Store this run as the new baseline')
+        parser.add_argument('--tolerance', type=float, default=1.0,
+                            help='Allowed relative growth of p95 latency over the baseline (default: %(default)s)')
+        parser.add_argument('--locmem-cache', action='store_true',
+                            help='Use an in-process stand-in for the configured cache, e.g. when Redis is not running. '
+                                 'It counts the cache round trips each request would make.')
+        parser.add_argument('--session-mode', choices=sorted(SESSION_ENGINES),
+                            help='Session mode to benchmark (default: the configured SESSION_ENGINE)')
+        parser.add_argument('--keepdb', action='store_true', help='Preserve the test database between runs')
+        parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+
+    def handle(self, *args, **options):
+        recorder = BenchmarkRecorder()
+        started = time.perf_counter()
+        overrides = {}
+        if options['locmem_cache']:
+            overrides['CACHES'] = COUNTING_CACHES
+        if options['session_mode']:
+            overrides['SESSION_ENGINE'] = SESSION_ENGINES[options['session_mode']]
+        with override_settings(**overrides):
+            with benchmark_databases(keepdb=options['keepdb']):
+                run_launch_benchmark(options['courses'], options['students'], recorder)
+        elapsed = time.perf_counter() - started
+        report = recorder.report()
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=4, sort_keys=True))
+        else:
+            self.write_table(report)
+            total_requests = sum(stats['requests'] for stats in report.values())
+            self.stdout.write('%d requests in %.2fs' % (total_requests, elapsed))
+
+        if options['save_baseline']:
+            save_baseline(options['baseline'], report)
+            self.stdout.write(self.style.SUCCESS('Saved baseline to %s' % options['baseline']))
+        elif os.path.exists(options['baseline']):
+            regressions = compare_with_baseline(report, load_baseline(options['baseline']), options['tolerance'])
+            if regressions:
+                raise CommandError('Performance regressed against %s:\n  %s' % (
+                    options['baseline'], '\n  '.join(regressions)))
+            self.stdout.write(self.style.SUCCESS('No regressions against %s' % options['baseline']))
+
+    def write_table(self, report):
+        row = '{:<28} {:>8} {:>9} {:>9} {:>9} {:>9} {:>12} {:>9}'
+        self.stdout.write(row.format('view', 'requests', 'p50 ms', 'p95 ms', 'p99 ms', 'queries', 'cache trips',
+                                     'req/s'))
+        for view_name, stats in report.items():
+            self.stdout.write(row.format(
+                view_name, stats['requests'], stats['p50_ms'], stats['p95_ms'], stats['p99_ms'],
+                stats['queries_per_request'], stats['cache_round_trips_per_request'], stats['requests_per_sec']))
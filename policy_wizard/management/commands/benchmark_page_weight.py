@@ -0,0 +1,54 @@
+import json
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+
+from policy_wizard.benchmark import COUNTING_CACHES, benchmark_databases, compare_page_weight_with_baseline, \
+    load_baseline, run_page_weight_benchmark, save_baseline
+
+DEFAULT_BASELINE = os.path.join(settings.BASE_DIR, 'benchmarks', 'page_weight_baseline.json')
+
+class Command(BaseCommand):
+    help = (
+        'Launches the tool as a student, an instructor and an administrator and reports, for every page they are '
+        'shown, the number of requests and scripts it takes and its size, as is and gzipped. Runs against '
+        'throwaway test databases and fails if a page got heavier than in the stored baseline.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                            help='Baseline to compare against, if it exists (default: %(default)s)')
+        parser.add_argument('--save-baseline', action='store_true', help='Store this run as the new baseline')
+        parser.add_argument('--tolerance', type=float, default=0.05,
+                            help='Allowed relative growth of the gzipped size of a page (default: %(default)s)')
+        parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+
+    def handle(self, *args, **options):
+        # Pages are weighed from the source static files, which collectstatic only renames
+        with override_settings(CACHES=COUNTING_CACHES,
+                               STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage'):
+            with benchmark_databases():
+                report = run_page_weight_benchmark()
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=4, sort_keys=True))
+        else:
+            row = '{:<32} {:>8} {:>8} {:>10} {:>10}'
+            self.stdout.write(row.format('view', 'requests', 'scripts', 'KB', 'gzip KB'))
+            for view_name, weight in sorted(report.items()):
+                self.stdout.write(row.format(view_name, weight['requests'], weight['scripts'],
+                                             '%.1f' % (weight['bytes'] / 1024.0),
+                                             '%.1f' % (weight['gzip_bytes'] / 1024.0)))
+
+        if options['save_baseline']:
+            save_baseline(options['baseline'], report)
+            self.stdout.write(self.style.SUCCESS('Saved baseline to %s' % options['baseline']))
+        elif os.path.exists(options['baseline']):
+            regressions = compare_page_weight_with_baseline(report, load_baseline(options['baseline']),
+                                                            options['tolerance'])
+            if regressions:
+                raise CommandError('Pages got heavier than in %s:\n  %s' % (
+                    options['baseline'], '\n  '.join(regressions)))
+            self.stdout.write(self.style.SUCCESS('No regressions against %s' % options['baseline']))
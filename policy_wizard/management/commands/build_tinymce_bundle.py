@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from policy_wizard.assets import TINYMCE_BUNDLE_PATH, build_tinymce_bundle, tinymce_bundle_sources
+
+class Command(BaseCommand):
+    help = 'Concatenates TinyMCE, its theme and the plugins the editor uses into static/tinymce/tinymce.bundle.min.js.'
+
+    def handle(self, *args, **options):
+        bundle = build_tinymce_bundle()
+        with open(TINYMCE_BUNDLE_PATH, 'w', encoding='utf-8') as bundle_file:
+            bundle_file.write(bundle)
+        self.stdout.write(self.style.SUCCESS('Wrote %s (%d bytes) from %s' % (
+            TINYMCE_BUNDLE_PATH, len(bundle.encode('utf-8')), ', '.join(tinymce_bundle_sources()))))
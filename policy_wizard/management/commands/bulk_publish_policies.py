@@ -0,0 +1,55 @@
+import os
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from policy_wizard.bulk import BULK_PUBLISH_CHUNK_SIZE, BulkPublishError, bulk_publish_policies, parse_course_mapping
+
+class Command(BaseCommand):
+    help = (
+        'Publishes policies in many courses at once, e.g. at term rollover, from a CSV or JSON mapping of course '
+        'ids to the policy template to publish (template_id) or the course whose active policy to copy forward '
+        '(copy_from). Each course\'s active policy is replaced.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('mapping', help='CSV or JSON course mapping, or - to read it from stdin')
+        parser.add_argument('--format', choices=['csv', 'json'],
+                            help='Format of the mapping (default: from the file extension, or JSON for stdin)')
+        parser.add_argument('--published-by', default='bulk_publish_policies',
+                            help='Publisher recorded on every policy (default: %(default)s)')
+        parser.add_argument('--chunk-size', type=int, default=BULK_PUBLISH_CHUNK_SIZE,
+                            help='Courses published per transaction (default: %(default)s)')
+
+    def handle(self, *args, **options):
+        mapping_format = options['format']
+        if options['mapping'] == '-':
+            content = sys.stdin.read()
+        else:
+            if not os.path.exists(options['mapping']):
+                raise CommandError('%s does not exist' % options['mapping'])
+            with open(options['mapping'], encoding='utf-8') as mapping_file:
+                content = mapping_file.read()
+            mapping_format = mapping_format or ('csv' if options['mapping'].lower().endswith('.csv') else 'json')
+
+        started = time.perf_counter()
+        try:
+            result = bulk_publish_policies(parse_course_mapping(content, mapping_format or 'json'), options['published_by'],
+                                           chunk_size=options['chunk_size'], progress=self.write_progress)
+        except BulkPublishError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(self.style.SUCCESS('Published policies in %d courses in %.2fs' % (
+            result['published'], time.perf_counter() - started)))
+        if result['skipped']:
+            self.stdout.write(self.style.WARNING('Skipped %d courses whose course to copy from has no active policy: %s' % (
+                len(result['skipped']), ', '.join(str(course_id) for course_id in result['skipped']))))
+        if result['failed']:
+            # Publishing the same mapping again replaces the policies published now, so it is safe to re-run
+            raise CommandError('Failed to publish in %d courses, as policies were being published in them at the '
+                               'same time. Publish these again: %s' % (
+                                   len(result['failed']), ', '.join(str(course_id) for course_id in result['failed'])))
+
+    def write_progress(self, done, total):
+        self.stdout.write('%d/%d courses done' % (done, total))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from policy_wizard.cache import warm_policy_cache
+
+class Command(BaseCommand):
+    help = (
+        'Caches the policy template catalogue and the student policy page of every course with an active policy, '
+        'e.g. before the start of term or as a periodic job. Pages already cached are skipped, so it is cheap to '
+        'run repeatedly, and an interrupted run can be resumed with --after.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='Active policies to read and cache at a time (default: %(default)s)')
+        parser.add_argument('--after', type=int, help='Resume after this course id, as reported by a previous run')
+        parser.add_argument('--force', action='store_true', help='Re-render and cache pages that are already cached')
+
+    def handle(self, *args, **options):
+        def report_progress(course_id, stats):
+            if options['verbosity'] > 0:
+                self.stdout.write('Cached up to course %d: %d keys, %d skipped' % (
+                    course_id, stats['keys'], stats['skipped']))
+
+        stats = warm_policy_cache(options['batch_size'], options['after'], options['force'], report_progress)
+        self.stdout.write(self.style.SUCCESS('Wrote %d keys, %d bytes, in %.2fs; %d pages were already cached' % (
+            stats['keys'], stats['bytes'], stats['seconds'], stats['skipped'])))
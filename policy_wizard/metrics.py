@@ -0,0 +1,156 @@
+'''
+Per-request instrumentation: for a sample of requests, records the resolved view name, the number and duration
+of database queries, cache hits and misses, template render time and total time. Each sampled request is logged
+as a JSON line and added to an in-process histogram, which administrators can read at `request_metrics/`.
+'''
+import json
+import logging
+import random
+import threading
+import time
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.template.backends.django import DjangoTemplates
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds, in milliseconds, of the buckets of the request time histogram
+HISTOGRAM_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, float('inf')]
+
+_local = threading.local()
+_histogram_lock = threading.Lock()
+_histograms = {}
+
+class RequestMetrics(object):
+
+    def __init__(self):
+        self.queries = 0
+        self.query_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.template_time = 0.0
+
+    def record_query(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.query_time += time.perf_counter() - started
+
+def current_metrics():
+    '''
+    :return: the RequestMetrics of the request being handled by this thread, or None if it is not sampled
+    '''
+    return getattr(_local, 'metrics', None)
+
+def record_cache_lookup(hit):
+    metrics = current_metrics()
+    if metrics is not None:
+        if hit:
+            metrics.cache_hits += 1
+        else:
+            metrics.cache_misses += 1
+
+def record_request(view_name, total_ms):
+    bucket = next(i for i, upper_bound in enumerate(HISTOGRAM_BUCKETS_MS) if total_ms <= upper_bound)
+    with _histogram_lock:
+        histogram = _histograms.setdefault(view_name, {
+            'count': 0,
+            'total_ms': 0.0,
+            'buckets': [0] * len(HISTOGRAM_BUCKETS_MS),
+        })
+        histogram['count'] += 1
+        histogram['total_ms'] += total_ms
+        histogram['buckets'][bucket] += 1
+
+def histogram_snapshot():
+    '''
+    :return: a copy of the request time histogram of this process, keyed on view name
+    '''
+    bucket_labels = ['le_%s' % ('inf' if upper_bound == float('inf') else upper_bound)
+                     for upper_bound in HISTOGRAM_BUCKETS_MS]
+    with _histogram_lock:
+        return {
+            view_name: {
+                'count': histogram['count'],
+                'mean_ms': round(histogram['total_ms'] / histogram['count'], 3),
+                'buckets': dict(zip(bucket_labels, histogram['buckets'])),
+            }
+            for view_name, histogram in _histograms.items()
+        }
+
+def reset_histograms():
+    with _histogram_lock:
+        _histograms.clear()
+
+class RequestMetricsMiddleware(object):
+    '''
+    Instruments the fraction settings.REQUEST_METRICS_SAMPLE_RATE of requests. Unsampled requests only cost a
+    call to random(), and with a sample rate of 0 the middleware removes itself altogether.
+    '''
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = settings.REQUEST_METRICS_SAMPLE_RATE
+        if self.sample_rate <= 0:
+            raise MiddlewareNotUsed
+
+    def __call__(self, request):
+        if random.random() >= self.sample_rate:
+            return self.get_response(request)
+
+        metrics = _local.metrics = RequestMetrics()
+        started = time.perf_counter()
+        try:
+            with connection.execute_wrapper(metrics.record_query):
+                response = self.get_response(request)
+        finally:
+            _local.metrics = None
+        total_ms = (time.perf_counter() - started) * 1000
+
+        resolver_match = getattr(request, 'resolver_match', None)
+        view_name = resolver_match.view_name if resolver_match else 'unresolved'
+        record_request(view_name, total_ms)
+        logger.info(json.dumps({
+            'view': view_name,
+            'status': response.status_code,
+            'total_ms': round(total_ms, 3),
+            'db_queries': metrics.queries,
+            'db_ms': round(metrics.query_time * 1000, 3),
+            'cache_hits': metrics.cache_hits,
+            'cache_misses': metrics.cache_misses,
+            'template_ms': round(metrics.template_time * 1000, 3),
+        }, sort_keys=True))
+        return response
+
+class InstrumentedDjangoTemplates(DjangoTemplates):
+    '''
+    The Django template backend, timing every template rendered for a sampled request
+    '''
+
+    def from_string(self, template_code):
+        return _TimedTemplate(super(InstrumentedDjangoTemplates, self).from_string(template_code))
+
+    def get_template(self, template_name):
+        return _TimedTemplate(super(InstrumentedDjangoTemplates, self).get_template(template_name))
+
+class _TimedTemplate(object):
+
+    def __init__(self, template):
+        self.template = template
+
+    def __getattr__(self, name):
+        return getattr(self.template, name)
+
+    def render(self, context=None, request=None):
+        metrics = current_metrics()
+        if metrics is None:
+            return self.template.render(context, request)
+        started = time.perf_counter()
+        try:
+            return self.template.render(context, request)
+        finally:
+            metrics.template_time += time.perf_counter() - started
@@ -0,0 +1,22 @@
+# Generated by Django 2.2.28 on 2026-10-17 10:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('policy_wizard', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='policies',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name='policies',
+            index=models.Index(fields=['course_id', 'is_active'], name='policies_course_active_idx'),
+        ),
+    ]
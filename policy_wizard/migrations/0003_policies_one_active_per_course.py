@@ -0,0 +1,37 @@
+# Generated by Django 2.2.28 on 2026-10-17 10:33
+
+from django.db import migrations, models
+
+
+def inactivate_duplicate_active_policies(apps, schema_editor):
+    '''
+    Before a course can be limited to one active policy, keep only the latest of any concurrently published
+    active policies, which is the one the views were already showing
+    '''
+    Policies = apps.get_model('policy_wizard', 'Policies')
+    courses_with_duplicates = (Policies.objects.filter(is_active=1).values('course_id')
+                               .annotate(active=models.Count('pk')).filter(active__gt=1)
+                               .values_list('course_id', flat=True))
+    for course_id in courses_with_duplicates:
+        active_policies = Policies.objects.filter(course_id=course_id, is_active=1)
+        latest = active_policies.latest('created_at')
+        active_policies.exclude(pk=latest.pk).update(is_active=0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('policy_wizard', '0002_policies_course_active_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(inactivate_duplicate_active_policies, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='policies',
+            constraint=models.UniqueConstraint(condition=models.Q(is_active=1), fields=('course_id',), name='policies_one_active_per_course'),
+        ),
+        migrations.RemoveIndex(
+            model_name='policies',
+            name='policies_course_active_idx',
+        ),
+    ]
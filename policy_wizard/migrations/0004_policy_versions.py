@@ -0,0 +1,76 @@
+# Generated by Django 2.2.28 on 2026-10-17 10:34
+
+import zlib
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def record_existing_policies(apps, schema_editor):
+    '''
+    Records every existing policy as a version of its course, in publishing order, and points each course at
+    the version of its active policy. Edits made before versions were recorded are not recoverable.
+    '''
+    Policies = apps.get_model('policy_wizard', 'Policies')
+    PolicyVersion = apps.get_model('policy_wizard', 'PolicyVersion')
+    CoursePolicy = apps.get_model('policy_wizard', 'CoursePolicy')
+
+    versions = []
+    version_counts = {}
+    for policy in Policies.objects.exclude(course_id=None).order_by('course_id', 'created_at', 'pk').iterator():
+        version_counts[policy.course_id] = version_counts.get(policy.course_id, 0) + 1
+        versions.append(PolicyVersion(
+            course_id=policy.course_id,
+            number=version_counts[policy.course_id],
+            policy_id=policy.pk,
+            published_by=policy.published_by,
+            compressed_body=zlib.compress(policy.body.encode('utf-8')),
+        ))
+        if len(versions) == 500:
+            PolicyVersion.objects.bulk_create(versions)
+            versions = []
+    PolicyVersion.objects.bulk_create(versions)
+    # created_at is set on insert, so date the versions after the fact
+    PolicyVersion.objects.update(created_at=models.Subquery(
+        Policies.objects.filter(pk=models.OuterRef('policy_id')).values('updated_at')[:1]))
+
+    current_versions = dict(PolicyVersion.objects.filter(policy__is_active=1).values_list('course_id', 'pk'))
+    CoursePolicy.objects.bulk_create([
+        CoursePolicy(course_id=course_id, version_count=version_count, current_version_id=current_versions.get(course_id))
+        for course_id, version_count in version_counts.items()
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('policy_wizard', '0003_policies_one_active_per_course'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PolicyVersion',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('course_id', models.IntegerField(null=True)),
+                ('number', models.PositiveIntegerField()),
+                ('published_by', models.CharField(max_length=255)),
+                ('compressed_body', models.BinaryField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('policy', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='versions', to='policy_wizard.Policies')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CoursePolicy',
+            fields=[
+                ('course_id', models.IntegerField(primary_key=True, serialize=False)),
+                ('version_count', models.PositiveIntegerField(default=0)),
+                ('current_version', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='policy_wizard.PolicyVersion')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='policyversion',
+            constraint=models.UniqueConstraint(fields=('course_id', 'number'), name='policy_versions_course_number'),
+        ),
+        migrations.RunPython(record_existing_policies, migrations.RunPython.noop),
+    ]
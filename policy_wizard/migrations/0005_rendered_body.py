@@ -0,0 +1,66 @@
+# Generated by Django 2.2.28 on 2026-10-17 10:38
+
+import zlib
+
+from django.db import migrations, models
+
+from policy_wizard.migrations._sanitizer_0005 import body_hash, sanitize_policy_html
+
+
+def render_existing_bodies(apps, schema_editor):
+    '''
+    Sanitizes the bodies of existing templates and policies, and the snapshots of their versions
+    '''
+    for model_name in ('PolicyTemplates', 'Policies'):
+        model = apps.get_model('policy_wizard', model_name)
+        rendered = []
+        for instance in model.objects.only('pk', 'body').iterator():
+            instance.rendered_body = sanitize_policy_html(instance.body)
+            instance.body_hash = body_hash(instance.rendered_body)
+            rendered.append(instance)
+            if len(rendered) == 500:
+                model.objects.bulk_update(rendered, ['rendered_body', 'body_hash'])
+                rendered = []
+        model.objects.bulk_update(rendered, ['rendered_body', 'body_hash'])
+
+    PolicyVersion = apps.get_model('policy_wizard', 'PolicyVersion')
+    versions = []
+    for version in PolicyVersion.objects.only('pk', 'compressed_body').iterator():
+        body = zlib.decompress(version.compressed_body).decode('utf-8')
+        version.compressed_body = zlib.compress(sanitize_policy_html(body).encode('utf-8'))
+        versions.append(version)
+        if len(versions) == 500:
+            PolicyVersion.objects.bulk_update(versions, ['compressed_body'])
+            versions = []
+    PolicyVersion.objects.bulk_update(versions, ['compressed_body'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('policy_wizard', '0004_policy_versions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='policies',
+            name='body_hash',
+            field=models.CharField(default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='policies',
+            name='rendered_body',
+            field=models.TextField(default=''),
+        ),
+        migrations.AddField(
+            model_name='policytemplates',
+            name='body_hash',
+            field=models.CharField(default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='policytemplates',
+            name='rendered_body',
+            field=models.TextField(default=''),
+        ),
+        migrations.RunPython(render_existing_bodies, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 2.2.28 on 2026-10-17 10:46
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def count_existing_usage(apps, schema_editor):
+    '''
+    Counts, once, the use made so far of every template. Policies are compared with the templates as they are
+    now, and every version of a policy after its first is counted as an edit.
+    '''
+    PolicyTemplates = apps.get_model('policy_wizard', 'PolicyTemplates')
+    Policies = apps.get_model('policy_wizard', 'Policies')
+    PolicyVersion = apps.get_model('policy_wizard', 'PolicyVersion')
+    TemplateUsage = apps.get_model('policy_wizard', 'TemplateUsage')
+
+    def counts(queryset, template_field):
+        return dict(queryset.values_list(template_field).annotate(count=models.Count('pk')).order_by())
+
+    active_courses = counts(Policies.objects.filter(is_active=1), 'related_template_id')
+    published = counts(Policies.objects.all(), 'related_template_id')
+    published_with_changes = counts(
+        Policies.objects.exclude(body_hash=models.F('related_template__body_hash')), 'related_template_id')
+    versions = counts(PolicyVersion.objects.all(), 'policy__related_template_id')
+    TemplateUsage.objects.bulk_create([
+        TemplateUsage(
+            template_id=template_id,
+            active_courses=active_courses.get(template_id, 0),
+            published=published.get(template_id, 0),
+            published_with_changes=published_with_changes.get(template_id, 0),
+            edits=max(versions.get(template_id, 0) - published.get(template_id, 0), 0),
+        )
+        for template_id in PolicyTemplates.objects.values_list('pk', flat=True)
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('policy_wizard', '0005_rendered_body'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TemplateUsage',
+            fields=[
+                ('template', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='usage', serialize=False, to='policy_wizard.PolicyTemplates')),
+                ('active_courses', models.IntegerField(default=0)),
+                ('published', models.IntegerField(default=0)),
+                ('published_with_changes', models.IntegerField(default=0)),
+                ('edits', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(count_existing_usage, migrations.RunPython.noop),
+    ]
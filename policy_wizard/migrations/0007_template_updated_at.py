@@ -0,0 +1,18 @@
+# Generated by Django 2.2.28 on 2026-10-17 10:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('policy_wizard', '0006_template_usage'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='policytemplates',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
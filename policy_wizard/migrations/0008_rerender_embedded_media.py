@@ -0,0 +1,35 @@
+from django.db import migrations
+
+from policy_wizard.migrations._sanitizer_0008 import body_hash, sanitize_policy_html
+
+
+def rerender_bodies(apps, schema_editor):
+    '''
+    Renders the bodies of templates and policies again, now that font sizes, text direction, table borders and
+    embedded videos are kept. The snapshots of past versions were stored rendered, so stay as they are.
+    '''
+    for model_name in ('PolicyTemplates', 'Policies'):
+        model = apps.get_model('policy_wizard', model_name)
+        rendered = []
+        for instance in model.objects.only('pk', 'body', 'body_hash').iterator():
+            rendered_body = sanitize_policy_html(instance.body)
+            if body_hash(rendered_body) == instance.body_hash:
+                continue
+            instance.rendered_body = rendered_body
+            instance.body_hash = body_hash(rendered_body)
+            rendered.append(instance)
+            if len(rendered) == 500:
+                model.objects.bulk_update(rendered, ['rendered_body', 'body_hash'])
+                rendered = []
+        model.objects.bulk_update(rendered, ['rendered_body', 'body_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('policy_wizard', '0007_template_updated_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(rerender_bodies, migrations.RunPython.noop),
+    ]
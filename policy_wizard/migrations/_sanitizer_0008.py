@@ -0,0 +1,156 @@
+'''
+A frozen copy of policy_wizard.sanitizer as it was when migration 0008_rerender_embedded_media was written,
+so the migration renders bodies the same way whatever later happens to the sanitizer. It must never change.
+'''
+import hashlib
+import re
+from html import escape
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+ALLOWED_TAGS = {
+    'a', 'abbr', 'b', 'blockquote', 'br', 'caption', 'code', 'col', 'colgroup', 'dd', 'div', 'dl', 'dt', 'em',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'hr', 'i', 'img', 'li', 'ol', 'p', 'pre', 's', 'span', 'strong', 'sub',
+    'sup', 'table', 'tbody', 'td', 'tfoot', 'th', 'thead', 'tr', 'u', 'ul', 'iframe', 'video', 'source',
+}
+VOID_TAGS = {'br', 'col', 'hr', 'img', 'source'}
+# Elements whose end tag may be left out when the next sibling starts
+IMPLIED_END_TAGS = {'dd', 'dt', 'li', 'p', 'td', 'th', 'tr'}
+# Elements whose content is dropped along with the element, except iframes embedding a video from EMBED_HOSTS
+DROPPED_CONTENT_TAGS = {'script', 'style', 'iframe', 'object', 'embed', 'noscript', 'template', 'textarea', 'title'}
+
+ALLOWED_ATTRIBUTES = {
+    '*': {'title', 'style', 'dir'},
+    'a': {'href', 'target', 'rel'},
+    'img': {'src', 'alt', 'width', 'height'},
+    'table': {'border', 'cellpadding', 'cellspacing', 'width', 'height'},
+    'td': {'colspan', 'rowspan'},
+    'th': {'colspan', 'rowspan', 'scope'},
+    'ol': {'start', 'type'},
+    'iframe': {'src', 'width', 'height', 'allowfullscreen', 'frameborder'},
+    'video': {'src', 'poster', 'width', 'height', 'controls'},
+    'source': {'src', 'type'},
+}
+URL_ATTRIBUTES = {'href', 'src', 'poster'}
+ALLOWED_URL_SCHEMES = {'http', 'https', 'mailto'}
+ALLOWED_STYLES = {
+    'text-align', 'text-decoration', 'color', 'background-color', 'font-weight', 'font-style',
+    'padding-left', 'margin-left', 'width', 'height', 'border', 'border-collapse', 'font-size',
+}
+# The hosts of the videos the media button embeds
+EMBED_HOSTS = {
+    'www.youtube.com', 'youtube.com', 'www.youtube-nocookie.com', 'player.vimeo.com', 'www.dailymotion.com',
+}
+
+_whitespace = re.compile(r'\s+')
+_url_scheme = re.compile(r'^([a-zA-Z][a-zA-Z0-9+.-]*):')
+
+def _is_allowed_url(url):
+    # Browsers ignore control characters and whitespace in schemes, e.g. "java\tscript:"
+    match = _url_scheme.match(re.sub(r'[\x00-\x20]', '', url))
+    return match is None or match.group(1).lower() in ALLOWED_URL_SCHEMES
+
+def _is_allowed_embed(url):
+    # The media button writes protocol relative URLs, e.g. //www.youtube.com/embed/...
+    parts = urlsplit(re.sub(r'[\x00-\x20]', '', url))
+    return parts.scheme in ('', 'https') and parts.hostname in EMBED_HOSTS
+
+def _clean_style(style):
+    declarations = []
+    for declaration in style.split(';'):
+        prop, _, value = declaration.partition(':')
+        prop, value = prop.strip().lower(), value.strip()
+        if prop in ALLOWED_STYLES and value and not re.search(r'url\(|expression\(|[<>\\]', value, re.I):
+            declarations.append('%s: %s' % (prop, value))
+    return '; '.join(declarations)
+
+class _PolicySanitizer(HTMLParser):
+
+    def __init__(self):
+        super(_PolicySanitizer, self).__init__(convert_charrefs=True)
+        self.output = []
+        self.open_tags = []
+        self.dropping = 0
+        self.preformatted = 0
+
+    def handle_starttag(self, tag, attrs):
+        embedded_video = tag == 'iframe' and not self.dropping and _is_allowed_embed(dict(attrs).get('src') or '')
+        if tag in DROPPED_CONTENT_TAGS and not embedded_video:
+            self.dropping += 1
+            return
+        if self.dropping or tag not in ALLOWED_TAGS:
+            return
+        if tag in IMPLIED_END_TAGS and self.open_tags and self.open_tags[-1] == tag:
+            self.handle_endtag(tag)
+        allowed = ALLOWED_ATTRIBUTES['*'] | ALLOWED_ATTRIBUTES.get(tag, set())
+        cleaned = []
+        for name, value in attrs:
+            value = value or ''
+            if name not in allowed:
+                continue
+            if name in URL_ATTRIBUTES and not _is_allowed_url(value):
+                continue
+            if name == 'style':
+                value = _clean_style(value)
+                if not value:
+                    continue
+            cleaned.append(' %s="%s"' % (name, escape(value)))
+        if tag == 'a' and any(name == 'target' for name, _ in attrs):
+            # Links opened in a new window must not get a handle on the tool's window
+            cleaned = [attr for attr in cleaned if not attr.startswith(' rel=')] + [' rel="noopener noreferrer"']
+        self.output.append('<%s%s>' % (tag, ''.join(cleaned)))
+        if tag not in VOID_TAGS:
+            self.open_tags.append(tag)
+            if tag == 'pre':
+                self.preformatted += 1
+
+    def handle_startendtag(self, tag, attrs):
+        dropping = self.dropping
+        self.handle_starttag(tag, attrs)
+        if self.dropping > dropping:
+            # A self-closing element has no content to drop, e.g. <script/>, and no end tag would stop dropping
+            self.dropping = dropping
+        elif tag not in VOID_TAGS and not self.dropping and tag in ALLOWED_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in DROPPED_CONTENT_TAGS and (self.dropping or tag not in self.open_tags):
+            self.dropping = max(self.dropping - 1, 0)
+            return
+        if self.dropping or tag not in self.open_tags:
+            return
+        # Close any elements left open inside this one
+        while self.open_tags:
+            open_tag = self.open_tags.pop()
+            self.output.append('</%s>' % open_tag)
+            if open_tag == 'pre':
+                self.preformatted -= 1
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if self.dropping:
+            return
+        if not self.preformatted:
+            data = _whitespace.sub(' ', data)
+        self.output.append(escape(data, quote=False))
+
+    def close(self):
+        super(_PolicySanitizer, self).close()
+        while self.open_tags:
+            self.output.append('</%s>' % self.open_tags.pop())
+        return ''.join(self.output)
+
+def sanitize_policy_html(body):
+    '''
+    :return: body with everything but the formatting TinyMCE produces removed, and whitespace collapsed
+    '''
+    sanitizer = _PolicySanitizer()
+    sanitizer.feed(body or '')
+    return sanitizer.close().strip()
+
+def body_hash(rendered_body):
+    '''
+    :return: the hex SHA-256 digest of a rendered body, which identifies its content
+    '''
+    return hashlib.sha256(rendered_body.encode('utf-8')).hexdigest()
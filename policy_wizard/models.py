@@ -1,14 +1,27 @@
+import zlib
+
 from django.db import models
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
 from tinymce import models as tinymce_models
 
+from .sanitizer import body_hash, sanitize_policy_html
+
 # Create your models here.
 
+# Name of the template instructors start from when writing a policy from scratch
+CUSTOM_POLICY_TEMPLATE_NAME = "Custom Policy"
+
 #Policy Templates
 class PolicyTemplates(models.Model):
     name = models.CharField(max_length=255)
     body = models.TextField()
+    # Sanitized body, the one shown to users, and its SHA-256
+    rendered_body = models.TextField(default='')
+    body_hash = models.CharField(max_length=64, default='')
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now_add=True)
+    # Changes on every save, so it versions the cached panels of the template list
+    updated_at = models.DateTimeField(auto_now=True)
 
 #Published policies
 class Policies(models.Model):
@@ -19,6 +32,75 @@ class Policies(models.Model):
     published_by = models.CharField(max_length=255)
     is_active = models.SmallIntegerField()
     body = tinymce_models.HTMLField()
+    # Sanitized body, the one shown to users, and its SHA-256
+    rendered_body = models.TextField(default='')
+    body_hash = models.CharField(max_length=64, default='')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        constraints = [
+            # A course has at most one active policy. The partial unique index behind this constraint also
+            # serves the "active policy for course" lookup made on every launch.
+            models.UniqueConstraint(fields=['course_id'], condition=models.Q(is_active=1),
+                                    name='policies_one_active_per_course'),
+        ]
+
+
+@receiver(pre_save, sender=PolicyTemplates)
+@receiver(pre_save, sender=Policies)
+def render_body(sender, instance, **kwargs):
+    '''
+    Stores the sanitized body of a policy or a template, and its hash, alongside the body as it was written.
+    Runs on every save, fixtures included, but not on bulk_create or update.
+    '''
+    instance.rendered_body = sanitize_policy_html(instance.body)
+    instance.body_hash = body_hash(instance.rendered_body)
+
+#Append-only history of every published policy body, numbered per course
+class PolicyVersion(models.Model):
+    course_id = models.IntegerField(null=True)
+    number = models.PositiveIntegerField()
+    policy = models.ForeignKey(Policies, on_delete=models.CASCADE, related_name="versions")
+    published_by = models.CharField(max_length=255)
+    # zlib-compressed snapshot of the rendered policy body
+    compressed_body = models.BinaryField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            # Also serves the paginated history of a course, a range scan on (course_id, number)
+            models.UniqueConstraint(fields=['course_id', 'number'], name='policy_versions_course_number'),
+        ]
+
+    @staticmethod
+    def compress(body):
+        return zlib.compress(body.encode('utf-8'))
+
+    @property
+    def body(self):
+        return zlib.decompress(self.compressed_body).decode('utf-8')
+
+#Pointer to the current policy version of each course
+class CoursePolicy(models.Model):
+    course_id = models.IntegerField(primary_key=True)
+    # None when the course has no active policy
+    current_version = models.ForeignKey(PolicyVersion, null=True, on_delete=models.SET_NULL, related_name="+")
+    # Number of versions published in the course so far
+    version_count = models.PositiveIntegerField(default=0)
+
+#Usage counters of each policy template, kept up to date as policies are published, edited and inactivated
+class TemplateUsage(models.Model):
+    template = models.OneToOneField(PolicyTemplates, primary_key=True, on_delete=models.CASCADE, related_name="usage")
+    # Courses whose active policy was made from the template
+    active_courses = models.IntegerField(default=0)
+    # Policies published from the template, and how many of them were changed from it before publishing
+    published = models.IntegerField(default=0)
+    published_with_changes = models.IntegerField(default=0)
+    # Edits made to published policies made from the template
+    edits = models.IntegerField(default=0)
+
+@receiver(post_save, sender=PolicyTemplates)
+def create_template_usage(sender, instance, created, **kwargs):
+    if created:
+        TemplateUsage.objects.get_or_create(template=instance)
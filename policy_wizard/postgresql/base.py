@@ -0,0 +1,142 @@
+'''
+Django's PostgreSQL backend with two additions for long-lived connections:
+
+- With 'CONN_HEALTH_CHECKS': True in the database settings, a connection kept from an earlier request (see
+  CONN_MAX_AGE) is checked with a "SELECT 1" before the first query of a request, and replaced if Postgres or a
+  firewall closed it while it was idle, instead of failing the request. Django adds the same setting in 4.1.
+- With a 'pool' in OPTIONS, e.g. {'min_size': 4, 'max_size': 8, 'timeout': 5}, connections are taken from a
+  pool kept by the process and handed back to it, instead of being opened and closed. At most max_size
+  connections are open at once, and min_size of them are kept open while unused. When all max_size are in use,
+  e.g. held by streaming exports, a request waits up to timeout seconds for one to be handed back, and then fails
+  with a database error. Connections from the pool are health checked as above, and broken ones are closed
+  rather than handed back.
+
+Enable it with 'ENGINE': 'policy_wizard.postgresql'.
+'''
+import threading
+
+from django.db.backends.postgresql import base
+from psycopg2 import pool as psycopg2_pool
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+class BlockingConnectionPool(object):
+    '''
+    A psycopg2 ThreadedConnectionPool, which fails at once when all its connections are in use, that instead makes
+    the thread wait up to timeout seconds for one to be handed back
+    '''
+
+    def __init__(self, min_size, max_size, timeout, **conn_params):
+        self.pool = psycopg2_pool.ThreadedConnectionPool(min_size, max_size, **conn_params)
+        self.slots = threading.BoundedSemaphore(max_size)
+        self.timeout = timeout
+
+    def getconn(self):
+        if not self.slots.acquire(timeout=self.timeout):
+            raise psycopg2_pool.PoolError('No database connection was handed back within %ss' % self.timeout)
+        try:
+            return self.pool.getconn()
+        except Exception:
+            self.slots.release()
+            raise
+
+    def putconn(self, connection, close=False):
+        try:
+            self.pool.putconn(connection, close=close)
+        finally:
+            self.slots.release()
+
+    def closeall(self):
+        self.pool.closeall()
+
+def _get_pool(alias, pool_options, conn_params):
+    '''
+    :return: the process's pool of connections made with conn_params, created on first use
+    '''
+    # The test runner points a connection at another database, which needs a pool of its own
+    key = (alias, tuple(sorted((name, str(value)) for name, value in conn_params.items())))
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = BlockingConnectionPool(pool_options.get('min_size', 1), pool_options.get('max_size', 10),
+                                                 pool_options.get('timeout', 5), **conn_params)
+        return _pools[key]
+
+def close_pools():
+    '''
+    Closes every connection of every pool, e.g. when a worker exits
+    '''
+    with _pools_lock:
+        for connection_pool in _pools.values():
+            connection_pool.closeall()
+        _pools.clear()
+
+class DatabaseWrapper(base.DatabaseWrapper):
+
+    def __init__(self, *args, **kwargs):
+        super(DatabaseWrapper, self).__init__(*args, **kwargs)
+        self.health_check_done = False
+        # The pool the open connection was taken from
+        self.connection_pool = None
+        # Whether the open connection failed its last health check
+        self.connection_broken = False
+
+    @property
+    def health_checks_enabled(self):
+        return self.settings_dict.get('CONN_HEALTH_CHECKS', False)
+
+    @property
+    def pool_options(self):
+        return self.settings_dict['OPTIONS'].get('pool')
+
+    def get_connection_params(self):
+        conn_params = super(DatabaseWrapper, self).get_connection_params()
+        conn_params.pop('pool', None)
+        return conn_params
+
+    def get_new_connection(self, conn_params):
+        if not self.pool_options:
+            return super(DatabaseWrapper, self).get_new_connection(conn_params)
+        self.connection_pool = _get_pool(self.alias, self.pool_options, conn_params)
+        connection = self.connection_pool.getconn()
+        # As Django does for a new connection
+        options = self.settings_dict['OPTIONS']
+        self.isolation_level = options.get('isolation_level', connection.isolation_level)
+        if self.isolation_level != connection.isolation_level:
+            connection.set_session(isolation_level=self.isolation_level)
+        return connection
+
+    def connect(self):
+        # Connecting sets the connection up through ensure_connection, which must not check it halfway
+        self.health_check_done = True
+        super(DatabaseWrapper, self).connect()
+        # A new connection has just proved it works, but one from the pool may have been idle for a while
+        self.health_check_done = not self.pool_options
+
+    def is_usable(self):
+        self.connection_broken = not super(DatabaseWrapper, self).is_usable()
+        return not self.connection_broken
+
+    def _close(self):
+        if self.connection is not None and self.connection_pool is not None:
+            broken, self.connection_broken = self.connection_broken, False
+            with self.wrap_database_errors:
+                # The pool rolls back an open transaction, and closes the connection if more than min_size
+                # connections would be kept. A broken connection must not go back in at all.
+                return self.connection_pool.putconn(self.connection, close=broken or bool(self.connection.closed))
+        return super(DatabaseWrapper, self)._close()
+
+    def close_if_unusable_or_obsolete(self):
+        # Called as every request starts and finishes
+        super(DatabaseWrapper, self).close_if_unusable_or_obsolete()
+        if self.connection is not None:
+            self.health_check_done = False
+
+    def ensure_connection(self):
+        super(DatabaseWrapper, self).ensure_connection()
+        if self.health_checks_enabled and not self.health_check_done and not self.in_atomic_block:
+            self.health_check_done = True
+            if not self.is_usable():
+                self.close()
+                super(DatabaseWrapper, self).ensure_connection()
+                self.health_check_done = True
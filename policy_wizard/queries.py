@@ -0,0 +1,115 @@
+'''
+The reads the views make of policies and templates. Each loads only the columns its caller uses: the body as
+written, which can be large, is only loaded to prefill an editor, and the body as rendered only to display it.
+Anything that is saved afterwards is loaded in full, since saving an instance with deferred fields would skip them.
+'''
+from django.shortcuts import get_object_or_404
+from .models import Policies, PolicyTemplates, PolicyVersion, CoursePolicy, TemplateUsage
+
+def active_policy_for_display(course_id):
+    '''
+    :return: the active policy of the course, without its editable body
+    :raises Policies.DoesNotExist: if the course has no active policy
+    '''
+    return Policies.objects.defer('body').get(course_id=course_id, is_active=True)
+
+def active_policy_validators(course_id):
+    '''
+    :return: the (body_hash, updated_at) of the active policy of the course, or None if there is none
+    '''
+    return Policies.objects.filter(course_id=course_id, is_active=True).values_list('body_hash', 'updated_at').first()
+
+def active_policies_for_display(after_course_id, batch_size):
+    '''
+    :return: up to batch_size active policies of the courses with ids above after_course_id (if given), in course
+    order, with only what the student policy page shows loaded. Keyset pagination on the course id makes every
+    batch an index range scan.
+    '''
+    policies = Policies.objects.filter(is_active=True).order_by('course_id')
+    if after_course_id is not None:
+        policies = policies.filter(course_id__gt=after_course_id)
+    return list(policies.only('course_id', 'rendered_body', 'body_hash', 'updated_at')[:batch_size])
+
+def active_policy_hashes(course_ids):
+    '''
+    :return: the body hash of the active policy of each of the courses that has one, keyed on course id
+    '''
+    return dict(Policies.objects.filter(course_id__in=course_ids, is_active=True).values_list('course_id', 'body_hash'))
+
+def policy_for_display(pk):
+    '''
+    :return: the policy, without its editable body
+    '''
+    return Policies.objects.defer('body').get(pk=pk)
+
+def policy_validators(pk):
+    '''
+    :return: the (body_hash, updated_at) of the policy, or None if it does not exist
+    '''
+    return Policies.objects.filter(pk=pk).values_list('body_hash', 'updated_at').first()
+
+def editable_policy(pk):
+    '''
+    :return: the policy with only its editable body loaded
+    '''
+    return Policies.objects.only('pk', 'body').get(pk=pk)
+
+def policy_for_update(pk):
+    '''
+    :return: the policy, loaded in full so it can be saved
+    '''
+    return Policies.objects.get(pk=pk)
+
+def policy_history_page(course_id, before, page_size):
+    '''
+    :return: up to page_size versions of the course's policy numbered below before (if given), newest first.
+    Keyset pagination on the version number makes every page an index range scan.
+    '''
+    versions = PolicyVersion.objects.filter(course_id=course_id).order_by('-number')
+    if before is not None:
+        versions = versions.filter(number__lt=before)
+    return list(versions[:page_size])
+
+def current_version_id(course_id):
+    '''
+    :return: the primary key of the course's current policy version, or None
+    '''
+    return CoursePolicy.objects.filter(pk=course_id).values_list('current_version_id', flat=True).first()
+
+def template_catalogue():
+    '''
+    :return: every policy template, in a stable order, without their editable bodies
+    '''
+    return list(PolicyTemplates.objects.defer('body').order_by('pk'))
+
+def template_for_display(pk):
+    '''
+    :return: the policy template, without its editable body
+    '''
+    return PolicyTemplates.objects.defer('body').get(pk=pk)
+
+def template_for_update(pk):
+    '''
+    :return: the policy template, loaded in full so it can be saved
+    '''
+    return get_object_or_404(PolicyTemplates, pk=pk)
+
+def template_reference(pk):
+    '''
+    :return: the policy template with only its primary key and body hash loaded, e.g. to relate a policy to it
+    '''
+    return get_object_or_404(PolicyTemplates.objects.only('pk', 'body_hash'), pk=pk)
+
+def editable_template(pk):
+    '''
+    :return: the policy template with only its name and editable body loaded
+    '''
+    return get_object_or_404(PolicyTemplates.objects.only('pk', 'name', 'body'), pk=pk)
+
+def template_usage():
+    '''
+    :return: the usage counters of every policy template, most used first, with the template's name
+    '''
+    return list(TemplateUsage.objects.select_related('template').only(
+        'active_courses', 'published', 'published_with_changes', 'edits', 'template__name'
+    ).order_by('-active_courses', 'template__name'))
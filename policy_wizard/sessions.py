@@ -0,0 +1,85 @@
+'''
+A session mode for LTI launches that needs no server-side storage: the handful of values the views read
+from the session travel with the browser as a compact signed token, in the session cookie or, where the
+Canvas iframe cannot keep third-party cookies, in the URL.
+
+Enable it with SESSION_ENGINE = 'policy_wizard.sessions' (the 'signed' session mode in settings). The token
+is signed, not encrypted: the launcher can read, but not alter, their own role and course. It cannot be revoked,
+so a token taken from a URL is only accepted for settings.SESSION_URL_MAX_AGE seconds after it was issued.
+'''
+from urllib.parse import urlencode, urlsplit, urlunsplit
+
+from django.conf import settings
+from django.contrib.sessions.backends import signed_cookies
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.core import signing
+from django.core.exceptions import ImproperlyConfigured
+
+class SessionStore(signed_cookies.SessionStore):
+    '''
+    Signed cookie sessions that keep only the keys listed in settings.SESSION_TOKEN_KEYS, so the token stays
+    small however many LTI launch parameters get copied into the session
+    '''
+
+    def __init__(self, session_key=None, max_age=None):
+        super(SessionStore, self).__init__(session_key)
+        # How long after it was issued the token is accepted, by default as long as the cookie
+        self.max_age = max_age if max_age is not None else settings.SESSION_COOKIE_AGE
+
+    def load(self):
+        try:
+            return signing.loads(
+                self.session_key,
+                serializer=self.serializer,
+                max_age=self.max_age,
+                salt='django.contrib.sessions.backends.signed_cookies',
+            )
+        except Exception:
+            # As Django's signed cookie sessions do for a bad or expired token, start a new session
+            self.create()
+        return {}
+
+    def _get_session_key(self):
+        token_keys = settings.SESSION_TOKEN_KEYS
+        return signing.dumps(
+            {k: v for k, v in self._session.items() if k in token_keys}, compress=True,
+            salt='django.contrib.sessions.backends.signed_cookies',
+            serializer=self.serializer,
+        )
+
+class LTISessionMiddleware(SessionMiddleware):
+    '''
+    Django's SessionMiddleware, which, when settings.SESSION_URL_PARAMETER is set, also accepts the session key
+    from that query parameter if there is no session cookie, and adds it to the URL of every redirect. Only the
+    signed session mode may carry sessions in URLs, where a key leaks into logs and Referer headers: a token
+    taken from a URL expires after settings.SESSION_URL_MAX_AGE seconds, a cache session key would not.
+    '''
+
+    def __init__(self, get_response=None):
+        super(LTISessionMiddleware, self).__init__(get_response)
+        if settings.SESSION_URL_PARAMETER and not issubclass(self.SessionStore, SessionStore):
+            raise ImproperlyConfigured('SESSION_URL_PARAMETER needs SESSION_ENGINE = %r, not %r' % (
+                __name__, settings.SESSION_ENGINE))
+
+    def process_request(self, request):
+        session_key = request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+        if session_key is None and settings.SESSION_URL_PARAMETER:
+            session_key = request.GET.get(settings.SESSION_URL_PARAMETER)
+            if session_key is not None:
+                request.session = self.SessionStore(session_key, max_age=settings.SESSION_URL_MAX_AGE)
+                return
+        request.session = self.SessionStore(session_key)
+
+    def process_response(self, request, response):
+        response = super(LTISessionMiddleware, self).process_response(request, response)
+        session = getattr(request, 'session', None)
+        if settings.SESSION_URL_PARAMETER and session is not None and session.session_key \
+                and response.has_header('Location'):
+            response['Location'] = with_session_parameter(response['Location'], session.session_key)
+        return response
+
+def with_session_parameter(url, session_key):
+    scheme, netloc, path, query, fragment = urlsplit(url)
+    parameter = urlencode({settings.SESSION_URL_PARAMETER: session_key})
+    query = '%s&%s' % (query, parameter) if query else parameter
+    return urlunsplit((scheme, netloc, path, query, fragment))
@@ -1 +0,0 @@
-!function(){var a={},b=function(b){for(var c=a[b],e=c.deps,f=c.defn,g=e.length,h=new Array(g),i=0;i<g;++i)h[i]=d(e[i]);var j=f.apply(null,h);if(void 0===j)throw"module ["+b+"] returned undefined";c.instance=j},c=function(b,c,d){if("string"!=typeof b)throw"module id must be a string";if(void 0===c)throw"no dependencies for "+b;if(void 0===d)throw"no definition function for "+b;a[b]={deps:c,defn:d,instance:void 0}},d=function(c){var d=a[c];if(void 0===d)throw"module ["+c+"] was undefined";return void 0===d.instance&&b(c),d.instance},e=function(a,b){for(var c=a.length,e=new Array(c),f=0;f<c;++f)e[f]=d(a[f]);b.apply(null,e)},f={};f.bolt={module:{api:{define:c,require:e,demand:d}}};var g=c,h=function(a,b){g(a,[],function(){return b})};g("1",[],function(){var a=function(b){var c=b,d=function(){return c},e=function(a){c=a},f=function(){return a(d())};return{get:d,set:e,clone:f}};return a}),h("5",tinymce.util.Tools.resolve),g("2",["5"],function(a){return a("tinymce.PluginManager")}),g("6",["5"],function(a){return a("tinymce.Env")}),g("7",["5"],function(a){return a("tinymce.util.Delay")}),g("8",[],function(){var a=function(a){return parseInt(a.getParam("autoresize_min_height",a.getElement().offsetHeight),10)},b=function(a){return parseInt(a.getParam("autoresize_max_height",0),10)},c=function(a){return a.getParam("autoresize_overflow_padding",1)},d=function(a){return a.getParam("autoresize_bottom_margin",50)},e=function(a){return a.getParam("autoresize_on_init",!0)};return{getAutoResizeMinHeight:a,getAutoResizeMaxHeight:b,getAutoResizeOverflowPadding:c,getAutoResizeBottomMargin:d,shouldAutoResizeOnInit:e}}),g("4",["6","7","8"],function(a,b,c){var d=function(a){return a.plugins.fullscreen&&a.plugins.fullscreen.isFullscreen()},e=function(a,c,d,f,h){b.setEditorTimeout(a,function(){g(a,c),d--?e(a,c,d,f,h):h&&h()},f)},f=function(a,b){var c=a.getBody();c&&(c.style.overflowY=b?"":"hidden",b||(c.scrollTop=0))},g=function(b,e){var h,i,j,k,l,m,n,o,p,q,r,s=b.dom;if(i=b.getDoc()){if(d(b))return void f(b,!0);j=i.body,k=c.getAutoResizeMinHeight(b),m=s.getStyle(j,"margin-top",!0),n=s.getStyle(j,"margin-bottom",!0),o=s.getStyle(j,"padding-top",!0),p=s.getStyle(j,"padding-bottom",!0),q=s.getStyle(j,"border-top-width",!0),r=s.getStyle(j,"border-bottom-width",!0),l=j.offsetHeight+parseInt(m,10)+parseInt(n,10)+parseInt(o,10)+parseInt(p,10)+parseInt(q,10)+parseInt(r,10),(isNaN(l)||l<=0)&&(l=a.ie?j.scrollHeight:a.webkit&&0===j.clientHeight?0:j.offsetHeight),l>c.getAutoResizeMinHeight(b)&&(k=l);var t=c.getAutoResizeMaxHeight(b);t&&l>t?(k=t,f(b,!0)):f(b,!1),k!==e.get()&&(h=k-e.get(),s.setStyle(b.iframeElement,"height",k+"px"),e.set(k),a.webKit&&h<0&&g(b))}},h=function(a,b){a.on("init",function(){var b,d,e=a.dom;b=c.getAutoResizeOverflowPadding(a),d=c.getAutoResizeBottomMargin(a),b!==!1&&e.setStyles(a.getBody(),{paddingLeft:b,paddingRight:b}),d!==!1&&e.setStyles(a.getBody(),{paddingBottom:d})}),a.on("nodechange setcontent keyup FullscreenStateChanged",function(c){g(a,b)}),c.shouldAutoResizeOnInit(a)&&a.on("init",function(){e(a,b,20,100,function(){e(a,b,5,1e3)})})};return{setup:h,resize:g}}),g("3",["4"],function(a){var b=function(b,c){b.addCommand("mceAutoResize",function(){a.resize(b,c)})};return{register:b}}),g("0",["1","2","3","4"],function(a,b,c,d){return b.add("autoresize",function(b){if(!b.inline){var e=a(0);c.register(b,e),d.setup(b,e)}}),function(){}}),d("0")()}();
\ No newline at end of file
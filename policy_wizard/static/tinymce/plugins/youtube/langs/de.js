@@ -1,3 +0,0 @@
-tinyMCE.addI18n('de.youtube',{
-	desc : 'Einfügen von YouTube-Videos'
-});
@@ -1,3 +0,0 @@
-tinyMCE.addI18n('en.youtube',{
-	desc : 'Insert YouTube video'
-});
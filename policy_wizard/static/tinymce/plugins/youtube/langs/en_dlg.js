@@ -1,12 +0,0 @@
-tinyMCE.addI18n('en.youtube_dlg',{
-    title : "Insert a YouTube Video",
-    instr : "Link format for sharing : <br /> http://youtu.be/xxxxxxxx <br /> or <br /> http://www.youtube.com/watch?v=xxxxxxxx",
-    ytID : "Link Sharing",
-    ytW : "Width",
-    ytH : "Height",
-    autoplay: "Autoplay",
-    relvideo: "Related videos",
-    hd:"Watch in HD",
-    yes:"Yes",
-    no:"No"
-});
\ No newline at end of file
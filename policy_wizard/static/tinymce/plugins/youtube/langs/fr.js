@@ -1,3 +0,0 @@
-tinyMCE.addI18n('fr.youtube',{
-	desc : 'Insérer une vidéo YouTube'
-});
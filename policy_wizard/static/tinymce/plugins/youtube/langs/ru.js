@@ -1,3 +0,0 @@
-tinyMCE.addI18n('ru.youtube',{
-	desc : 'Вставить видео YouTube'
-});
@@ -1,11 +1,47 @@
-from django.test import TestCase, RequestFactory
+from django.test import TestCase, TransactionTestCase, RequestFactory, Client, override_settings
 from django.shortcuts import reverse
 from django.contrib.sessions.middleware import SessionMiddleware
-from django.core.exceptions import PermissionDenied
-from .models import Policies, PolicyTemplates
+from django.core.exceptions import PermissionDenied, ImproperlyConfigured
+from django.core.cache import cache
+from django.db import connection, IntegrityError, transaction
+from django.conf import settings
+from django.test.utils import CaptureQueriesContext
+from django.core.cache.backends.locmem import LocMemCache
+from django.core import signing
+from django.core.management import call_command
+from django.template.loader import render_to_string
+from lti_provider.lti import LTIException
+from .models import Policies, PolicyTemplates, PolicyVersion, CoursePolicy, TemplateUsage
+from .utils import LaunchValidator, role_identifier, publish_policy
+from . import utils
+from .benchmark import sign_launch_params, launch_params, run_launch_benchmark, compare_with_baseline, \
+    STUDENT_ROLES, run_page_weight_benchmark, compare_page_weight_with_baseline, COUNTING_CACHES, \
+    concurrency_benchmark_requests, measure_throughput, CountingLocMemCache, run_connection_benchmark, \
+    UNCACHED_SETTINGS
 from . import views
+from . import metrics
+from . import bulk
+from . import assets
+from . import cache as cache_module
+from .sanitizer import sanitize_policy_html, body_hash
+from .cache import NO_ACTIVE_POLICY_ETAG, student_policy_cache_key, template_panel_cache_key, warm_policy_cache, student_policy_lock_key, \
+    get_cached_student_policy_page, load_student_policy_page, invalidate_student_policy_page, reset_local_cache, \
+    get_template_catalogue, get_template_panels, invalidate_template_catalogue, TEMPLATE_CATALOGUE_KEY
+from .local_cache import LocalLRUCache
+from .cache_pipeline import CachePipeline
+from .postgresql import base as postgresql_base
 
+import csv
+import datetime
+import io
+import json
 import mock
+import os
+import psycopg2
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 
 def annotate_request_with_session(request, params=None):
@@ -380,3 +416,1289 @@ class StudentRoleTests(TestCase):
         response = views.student_active_policy_view(request)
         self.assertEquals(response.status_code, 200)
         self.assertInHTML('There is no published academic integrity policy in record for this course.', response.content.decode("utf-8"))
+
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+}
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class StudentPolicyCacheTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.policy_templates = create_default_policy_templates()
+        self.studentSession = {
+            'context_id': 'context123',
+            'role': 'Student',
+            'course_id': 1
+        }
+        self.instructorSession = {
+            'context_id': 'context123',
+            'lis_person_sourcedid': '123456789',
+            'role': 'Instructor',
+            'course_id': 1
+        }
+        self.active_policy = Policies.objects.create(
+            context_id='context123',
+            published_by='123456789',
+            is_published=True,
+            is_active=True,
+            body='this is an important policy. please read!',
+            course_id=1
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def studentView(self):
+        request = self.factory.get('student_active_policy')
+        annotate_request_with_session(request, self.studentSession)
+        return views.student_active_policy_view(request)
+
+    def testWarmStudentViewRunsNoQueries(self):
+        self.studentView()
+        with self.assertNumQueries(0):
+            response = self.studentView()
+        self.assertInHTML(self.active_policy.body, response.content.decode("utf-8"))
+
+    def testPublishInvalidatesStudentView(self):
+        self.studentView()
+        request = self.factory.post('instructor_level_policy_edit', {'body': 'A freshly published policy'})
+        annotate_request_with_session(request, self.instructorSession)
+        views.instructor_level_policy_edit_view(request, self.policy_templates[0].pk)
+        self.assertInHTML('A freshly published policy', self.studentView().content.decode("utf-8"))
+
+    def testEditInvalidatesStudentView(self):
+        self.studentView()
+        request = self.factory.post('edit_active_policy', {'body': 'An edited policy'})
+        annotate_request_with_session(request, self.instructorSession)
+        views.edit_active_policy(request, self.active_policy.pk)
+        self.assertInHTML('An edited policy', self.studentView().content.decode("utf-8"))
+
+    def testPageRenderedBeforeAPublishIsNotKept(self):
+        real_build = cache_module.build_student_policy_page
+        def build_then_publish(course_id):
+            entry = real_build(course_id)
+            # Publishing invalidates the page before it is stored
+            publish_policy(course_id, context_id='context123', body='<p>New policy</p>', published_by='123456789',
+                           is_published=True)
+            return entry
+
+        with mock.patch.object(cache_module, 'build_student_policy_page', side_effect=build_then_publish):
+            self.assertEquals(load_student_policy_page(1)['etag'], self.active_policy.body_hash)
+        self.assertIsNone(cache.get(student_policy_cache_key(1)))
+        self.assertInHTML('<p>New policy</p>', self.studentView().content.decode("utf-8"))
+
+    def testInactivateInvalidatesStudentView(self):
+        self.studentView()
+        request = self.factory.get('instructor_inactivate_policies')
+        annotate_request_with_session(request, self.instructorSession)
+        views.instructor_inactivate_policies_view(request)
+        self.assertInHTML('There is no published academic integrity policy in record for this course.',
+                          self.studentView().content.decode("utf-8"))
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class StudentPolicySingleFlightTests(TestCase):
+    '''
+    Simulates many students of a course loading its page at once, from a pool of threads, with the page
+    taking a while to render
+    '''
+    STUDENTS = 20
+
+    def setUp(self):
+        cache.clear()
+        self.renders = 0
+        self.lock = threading.Lock()
+
+    def tearDown(self):
+        cache.clear()
+
+    def slowBuild(self, course_id):
+        with self.lock:
+            self.renders += 1
+            page = 'Page %d of course %d' % (self.renders, course_id)
+        time.sleep(0.2)
+        # Course 1 has no policy
+        return {'page': page, 'etag': NO_ACTIVE_POLICY_ETAG, 'last_modified': None}
+
+    def concurrently(self, load):
+        with mock.patch('policy_wizard.cache.build_student_policy_page', side_effect=self.slowBuild):
+            with ThreadPoolExecutor(max_workers=self.STUDENTS) as executor:
+                return [entry['page'] for entry in executor.map(lambda _: load(1), range(self.STUDENTS))]
+
+    def testOneRequestRendersAMissedPage(self):
+        pages = self.concurrently(load_student_policy_page)
+        self.assertEquals(self.renders, 1)
+        self.assertEquals(set(pages), {'Page 1 of course 1'})
+
+    def testStalePageIsServedWhileOneRequestRerendersIt(self):
+        cache.set(student_policy_cache_key(1), {'page': 'Stale page', 'etag': 'stale', 'last_modified': None,
+                                                'fresh_until': time.time() - 1})
+        pages = self.concurrently(get_cached_student_policy_page)
+        self.assertEquals(self.renders, 1)
+        self.assertEquals(pages.count('Page 1 of course 1'), 1)
+        self.assertEquals(pages.count('Stale page'), self.STUDENTS - 1)
+        self.assertEquals(get_cached_student_policy_page(1)['page'], 'Page 1 of course 1')
+
+    @override_settings(STUDENT_POLICY_LOCK_WAIT=0.1)
+    def testWaitingRequestsRenderThePageIfItDoesNotAppear(self):
+        cache.add(student_policy_lock_key(1), True)
+        with mock.patch('policy_wizard.cache.build_student_policy_page', side_effect=self.slowBuild):
+            self.assertEquals(load_student_policy_page(1)['page'], 'Page 1 of course 1')
+
+    def testInvalidationDropsTheLock(self):
+        with mock.patch('policy_wizard.cache.build_student_policy_page', side_effect=self.slowBuild):
+            load_student_policy_page(1)
+        invalidate_student_policy_page(1)
+        self.assertIsNone(cache.get(student_policy_lock_key(1)))
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class WarmPolicyCacheTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        create_default_policy_templates()
+        for course_id in range(1, 6):
+            Policies.objects.create(course_id=course_id, context_id='context%d' % course_id, published_by='instructor',
+                                    is_published=True, is_active=True, body='<p>Policy of course %d</p>' % course_id)
+
+    def tearDown(self):
+        cache.clear()
+
+    def studentView(self, course_id):
+        request = self.factory.get('student_active_policy')
+        annotate_request_with_session(request, {'role': 'Student', 'course_id': course_id})
+        return views.student_active_policy_view(request)
+
+    def testWarmedPagesAreServedWithoutQueries(self):
+        stats = warm_policy_cache(batch_size=2)
+        # 5 pages, the catalogue and a panel of each of 4 templates per list level
+        self.assertEquals(stats['keys'], 5 + 1 + 4 * 2)
+        self.assertGreater(stats['bytes'], 0)
+        with self.assertNumQueries(0):
+            response = self.studentView(3)
+        self.assertInHTML('<p>Policy of course 3</p>', response.content.decode('utf-8'))
+
+    def testCachedPagesAreSkipped(self):
+        self.studentView(1)
+        stats = warm_policy_cache()
+        self.assertEquals(stats['skipped'], 1)
+        self.assertEquals(warm_policy_cache()['skipped'], 5)
+        self.assertEquals(warm_policy_cache(force=True)['skipped'], 0)
+
+    def testPageOfPolicyPublishedWhileRenderingIsDiscarded(self):
+        real_active_policies = cache_module.active_policies_for_display
+        def publish_after_read(*args):
+            policies = real_active_policies(*args)
+            if policies and policies[0].course_id == 1:
+                publish_policy(2, context_id='context2', body='<p>New policy of course 2</p>', published_by='instructor',
+                               is_published=True)
+            return policies
+
+        with mock.patch.object(cache_module, 'active_policies_for_display', side_effect=publish_after_read):
+            stats = warm_policy_cache(batch_size=2)
+        self.assertIsNone(cache.get(student_policy_cache_key(2)))
+        self.assertEquals(stats['keys'], 4 + 1 + 4 * 2)
+        self.assertInHTML('<p>New policy of course 2</p>', self.studentView(2).content.decode('utf-8'))
+
+    def testCatalogueReadBeforeATemplateIsSavedIsNotKept(self):
+        real_template_catalogue = cache_module.template_catalogue
+        def save_after_read():
+            catalogue = real_template_catalogue()
+            PolicyTemplates.objects.filter(name='Custom Policy').update(name='Renamed')
+            invalidate_template_catalogue()
+            return catalogue
+
+        with mock.patch.object(cache_module, 'template_catalogue', side_effect=save_after_read):
+            stats = warm_policy_cache()
+        self.assertIsNone(cache.get(TEMPLATE_CATALOGUE_KEY))
+        self.assertEquals(stats['keys'], 5 + 4 * 2)
+        self.assertIn('Renamed', [policy_template.name for policy_template in get_template_catalogue()])
+
+    def testResumesAfterCourse(self):
+        progress = []
+        warm_policy_cache(batch_size=2, after_course_id=3, progress=lambda course_id, _: progress.append(course_id))
+        self.assertEquals(progress, [5])
+        self.assertIsNone(cache.get(student_policy_cache_key(3)))
+        self.assertIsNotNone(cache.get(student_policy_cache_key(4)))
+
+    def testCommandReportsWhatItWrote(self):
+        output = io.StringIO()
+        call_command('warm_policy_cache', batch_size=2, stdout=output)
+        self.assertIn('Cached up to course 4', output.getvalue())
+        self.assertIn('Wrote 14 keys', output.getvalue())
+
+class ActivePolicyIndexTests(TestCase):
+    '''
+    Seeds a large synthetic Policies table and checks that the hot lookups are planned as index scans
+    '''
+    NUMBER_OF_COURSES = 2000
+    POLICIES_PER_COURSE = 10
+
+    @classmethod
+    def setUpTestData(cls):
+        Policies.objects.bulk_create(
+            Policies(
+                course_id=course_id,
+                context_id='context%d' % course_id,
+                published_by='123456789',
+                is_published=True,
+                # Only the most recent publish of each course is active
+                is_active=(n == cls.POLICIES_PER_COURSE - 1),
+                body='policy %d of course %d' % (n, course_id),
+            )
+            for course_id in range(cls.NUMBER_OF_COURSES)
+            for n in range(cls.POLICIES_PER_COURSE)
+        )
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def assertUsesActivePolicyIndex(self, queryset):
+        plan = queryset.explain()
+        self.assertIn('policies_one_active_per_course', plan)
+
+    def testStudentLookupUsesIndex(self):
+        self.assertUsesActivePolicyIndex(Policies.objects.filter(course_id=1234, is_active=True))
+
+    def testInstructorLookupUsesIndex(self):
+        self.assertUsesActivePolicyIndex(
+            Policies.objects.filter(course_id=1234, is_active=True).order_by('-created_at'))
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TemplateCatalogueTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.policy_templates = create_default_policy_templates()
+        self.administratorSession = {
+            'context_id': 'context123',
+            'role': 'Administrator',
+            'course_id': 1
+        }
+
+    def tearDown(self):
+        cache.clear()
+
+    def templatesListView(self):
+        request = self.factory.get('policy_templates_list')
+        annotate_request_with_session(request, self.administratorSession)
+        return views.policy_templates_list_view(request)
+
+    def testCatalogueIsLoadedInOneQuery(self):
+        # Plus one query, for administrators, of the template usage counters
+        with self.assertNumQueries(2):
+            self.templatesListView()
+        with self.assertNumQueries(1):
+            self.templatesListView()
+
+    def testAnyNumberOfTemplatesIsListed(self):
+        PolicyTemplates.objects.create(name="Collaboration Permitted: Lab Reports", body="Baz")
+        response = self.templatesListView()
+        self.assertEquals(response.status_code, 200)
+        self.assertIn("Collaboration Permitted: Lab Reports", response.content.decode("utf-8"))
+
+    def testUpdatingTemplateRefreshesCatalogue(self):
+        self.templatesListView()
+        request = self.factory.post('admin_level_template_edit', {'body': 'An updated template body'})
+        annotate_request_with_session(request, self.administratorSession)
+        views.admin_level_template_edit_view(request, self.policy_templates[0].pk)
+        self.assertIn('An updated template body', self.templatesListView().content.decode("utf-8"))
+
+    def testTemplatePanelsAreRenderedOnce(self):
+        # Every template but the Custom Policy has a panel
+        panels = len(self.policy_templates) - 1
+        with mock.patch('policy_wizard.cache.render_to_string', wraps=render_to_string) as render:
+            first = self.templatesListView().content
+            self.assertEquals(render.call_count, panels)
+            second = self.templatesListView().content
+            self.assertEquals(render.call_count, panels)
+        self.assertEquals(first, second)
+
+    def testTemplatePanelsArePerRole(self):
+        admin_content = self.templatesListView().content.decode("utf-8")
+        self.administratorSession['role'] = 'Instructor'
+        self.administratorSession['course_id'] = 2
+        instructor_content = self.templatesListView().content.decode("utf-8")
+        policy_template = self.policy_templates[0]
+        self.assertIn(reverse('admin_level_template_edit', args=[policy_template.pk]), admin_content)
+        self.assertIn('Update Template', admin_content)
+        self.assertIn(reverse('instructor_level_policy_edit', args=[policy_template.pk]), instructor_content)
+        self.assertIn('Choose Template', instructor_content)
+
+    def testUpdatingTemplateDropsItsPanels(self):
+        self.templatesListView()
+        policy_template = PolicyTemplates.objects.get(pk=self.policy_templates[0].pk)
+        stale_key = template_panel_cache_key(policy_template.pk, policy_template.updated_at, 'admin_level_template_edit')
+        self.assertIsNotNone(cache.get(stale_key))
+        request = self.factory.post('admin_level_template_edit', {'body': 'An updated template body'})
+        annotate_request_with_session(request, self.administratorSession)
+        views.admin_level_template_edit_view(request, policy_template.pk)
+        self.assertIsNone(cache.get(stale_key))
+        self.assertGreater(PolicyTemplates.objects.get(pk=policy_template.pk).updated_at, policy_template.updated_at)
+
+
+class LocalLRUCacheTests(TestCase):
+
+    def testLeastRecentlyUsedEntryIsEvicted(self):
+        local_cache = LocalLRUCache(max_entries=2)
+        local_cache.set('a', 1)
+        local_cache.set('b', 2)
+        local_cache.get('a')
+        local_cache.set('c', 3)
+        self.assertEquals((local_cache.get('a'), local_cache.get('b'), local_cache.get('c')), (1, None, 3))
+
+    def testEntriesExpire(self):
+        local_cache = LocalLRUCache(max_entries=2)
+        with mock.patch('policy_wizard.local_cache.time.monotonic', return_value=100.0):
+            local_cache.set('a', 1, timeout=30)
+        with mock.patch('policy_wizard.local_cache.time.monotonic', return_value=129.0):
+            self.assertEquals(local_cache.get('a'), 1)
+        with mock.patch('policy_wizard.local_cache.time.monotonic', return_value=130.0):
+            self.assertIsNone(local_cache.get('a'))
+        self.assertEquals(len(local_cache), 0)
+
+@override_settings(CACHES=COUNTING_CACHES, LOCAL_CACHE_TIMEOUT=30)
+class TwoTierTemplateCacheTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        reset_local_cache()
+        self.policy_templates = create_default_policy_templates()
+
+    def tearDown(self):
+        cache.clear()
+        reset_local_cache()
+
+    def templatesList(self):
+        catalogue = get_template_catalogue()
+        return catalogue, get_template_panels(catalogue, 'instructor_level_policy_edit')
+
+    def roundTrips(self, function):
+        before = CountingLocMemCache.round_trips
+        result = function()
+        return result, CountingLocMemCache.round_trips - before
+
+    def testHotReadsMakeNoRoundTrips(self):
+        self.templatesList()
+        with self.assertNumQueries(0):
+            _, round_trips = self.roundTrips(self.templatesList)
+        self.assertEquals(round_trips, 0)
+
+    def testSavingATemplateRefreshesThisProcessAtOnce(self):
+        self.templatesList()
+        PolicyTemplates.objects.filter(pk=self.policy_templates[0].pk).update(name='Renamed')
+        invalidate_template_catalogue()
+        catalogue, _ = self.templatesList()
+        self.assertEquals(catalogue[0].name, 'Renamed')
+
+    def testOtherProcessesSeeTheNewVersionAfterTheTimeout(self):
+        self.templatesList()
+        PolicyTemplates.objects.filter(pk=self.policy_templates[0].pk).update(name='Renamed')
+        # Another process saved the template: only the shared cache is changed
+        with mock.patch('policy_wizard.cache._local_cache.clear'):
+            invalidate_template_catalogue()
+        self.assertNotEquals(get_template_catalogue()[0].name, 'Renamed')
+        with mock.patch('policy_wizard.local_cache.time.monotonic', return_value=time.monotonic() + 31):
+            (catalogue, _), round_trips = self.roundTrips(self.templatesList)
+        self.assertEquals(catalogue[0].name, 'Renamed')
+        # Reading the version, then reading the catalogue, storing it and checking the version has not changed
+        self.assertEquals(round_trips, 4)
+
+    def testCatalogueReadBeforeATemplateIsSavedIsNotKept(self):
+        real_template_catalogue = cache_module.template_catalogue
+        def save_after_read():
+            catalogue = real_template_catalogue()
+            PolicyTemplates.objects.filter(pk=self.policy_templates[0].pk).update(name='Renamed')
+            # In another process, so this one's copy is only dropped once it sees the new version
+            with mock.patch('policy_wizard.cache._local_cache.clear'):
+                invalidate_template_catalogue()
+            return catalogue
+
+        with mock.patch.object(cache_module, 'template_catalogue', side_effect=save_after_read):
+            self.assertNotEquals(get_template_catalogue()[0].name, 'Renamed')
+        self.assertIsNone(cache.get(TEMPLATE_CATALOGUE_KEY))
+        with mock.patch('policy_wizard.local_cache.time.monotonic', return_value=time.monotonic() + 31):
+            self.assertEquals(get_template_catalogue()[0].name, 'Renamed')
+
+class LaunchValidatorTests(TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.validator = LaunchValidator(
+            settings.SECURE_SETTINGS['CONSUMER_KEY'],
+            settings.SECURE_SETTINGS['LTI_SECRET'],
+            LocMemCache('lti_nonces', {}),
+            600,
+        )
+        self.signed_params = sign_launch_params('http://testserver/lti/launch/', {
+            'lti_message_type': 'basic-lti-launch-request',
+            'context_id': 'abcd1234',
+        })
+
+    def launchRequest(self, params):
+        request = self.factory.post('/lti/launch/', params)
+        return annotate_request_with_session(request)
+
+    def testSignedLaunchIsValid(self):
+        self.assertTrue(self.validator.verify(self.launchRequest(self.signed_params)))
+
+    def testReplayedLaunchIsRejected(self):
+        self.validator.verify(self.launchRequest(self.signed_params))
+        with self.assertRaises(LTIException):
+            self.validator.verify(self.launchRequest(self.signed_params))
+
+    def testTamperedLaunchIsRejected(self):
+        self.signed_params['context_id'] = 'efgh5678'
+        with self.assertRaises(LTIException):
+            self.validator.verify(self.launchRequest(self.signed_params))
+
+    def testMissingConsumerKeyIsImproperlyConfigured(self):
+        with self.assertRaises(ImproperlyConfigured):
+            LaunchValidator(None, 'secret', LocMemCache('lti_nonces', {}), 600)
+
+
+@override_settings(CACHES=COUNTING_CACHES, SESSION_ENGINE='policy_wizard.cache_sessions')
+class PipelinedLaunchTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.params = launch_params(1, 'student', STUDENT_ROLES)
+
+    def tearDown(self):
+        cache.clear()
+
+    def testPipelineReturnsTheResultOfEachOperation(self):
+        pipeline = CachePipeline(cache)
+        pipeline.add('key', 1)
+        pipeline.add('key', 2)
+        pipeline.set('other', 3)
+        pipeline.get('key')
+        before = CountingLocMemCache.round_trips
+        self.assertEquals(pipeline.execute(), [True, False, True, 1])
+        self.assertEquals(CountingLocMemCache.round_trips - before, 1)
+        self.assertEquals(pipeline.execute(), [])
+
+    def testLaunchMakesOneRoundTrip(self):
+        client = Client()
+        before = CountingLocMemCache.round_trips
+        response = client.post(reverse('process_lti_launch_request'), self.params)
+        self.assertEquals(response['Location'], reverse('student_active_policy'))
+        # The nonce and the new session are written together
+        self.assertEquals(CountingLocMemCache.round_trips - before, 1)
+        self.assertEquals(client.session['role'], 'Student')
+        self.assertEquals(client.session['course_id'], '1')
+
+    def testReplayedLaunchIsRejected(self):
+        Client().post(reverse('process_lti_launch_request'), self.params)
+        client = Client()
+        response = client.post(reverse('process_lti_launch_request'), self.params)
+        self.assertEquals(response['Location'], reverse('lti_exception_view'))
+        # The session written along with the nonce is discarded
+        self.assertNotIn(settings.SESSION_COOKIE_NAME, response.cookies)
+
+
+class RoleIdentifierTests(TestCase):
+
+    def testContextRoleWinsOverInstitutionalRole(self):
+        self.assertEquals(role_identifier(
+            'urn:lti:role:ims/lis/Instructor,urn:lti:instrole:ims/lis/Administrator,urn:lti:sysrole:ims/lis/User'),
+            'Instructor')
+
+    def testTeachingAssistantIsInstructor(self):
+        self.assertEquals(role_identifier('urn:lti:role:ims/lis/TeachingAssistant'), 'Instructor')
+        self.assertEquals(role_identifier('urn:lti:role:ims/lis/TeachingAssistant/Grader'), 'Instructor')
+
+    def testRolesMustMatchExactly(self):
+        # 'Instructor' is a sub-role of Learner, which does not make the launcher an instructor
+        self.assertEquals(role_identifier('urn:lti:role:ims/lis/Learner/Instructor'), 'Student')
+        self.assertEquals(role_identifier('urn:lti:role:ims/lis/Learner,urn:lti:role:ims/lis/NotAnInstructor'), 'Student')
+
+    def testInstitutionalAdministratorWithoutContextRole(self):
+        self.assertEquals(role_identifier('urn:lti:instrole:ims/lis/Administrator,urn:lti:instrole:ims/lis/Student'),
+                          'Administrator')
+        self.assertEquals(role_identifier('urn:lti:instrole:ims/lis/Instructor'), 'Student')
+
+    def testLti13RoleClaim(self):
+        self.assertEquals(role_identifier([
+            'http://purl.imsglobal.org/vocab/lis/v2/membership#Learner',
+            'http://purl.imsglobal.org/vocab/lis/v2/membership/Instructor#TeachingAssistant',
+            'http://purl.imsglobal.org/vocab/lis/v2/institution/person#Student',
+        ]), 'Instructor')
+        self.assertEquals(role_identifier([
+            'http://purl.imsglobal.org/vocab/lis/v2/institution/person#Administrator',
+        ]), 'Administrator')
+
+    def testMissingRolesIsStudent(self):
+        self.assertEquals(role_identifier(None), 'Student')
+        self.assertEquals(role_identifier(''), 'Student')
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class LaunchBenchmarkTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def testBenchmarkReportsEveryView(self):
+        report = run_launch_benchmark(number_of_courses=2, students_per_course=3).report()
+        self.assertEquals(report['process_lti_launch_request']['requests'], 8)
+        self.assertEquals(report['student_active_policy']['requests'], 6)
+        self.assertEquals(report['policy_templates_list']['requests'], 2)
+        # Only the first student of each course misses the rendered page cache, which reads the policy and checks
+        # it did not change while the page rendered
+        self.assertEquals(report['student_active_policy']['queries_per_request'], round(4 / 6.0, 3))
+
+    def testRegressionsAgainstBaseline(self):
+        baseline = {'student_active_policy': {'p95_ms': 1.0, 'queries_per_request': 0.0,
+                                              'cache_round_trips_per_request': 1.0}}
+        report = {'student_active_policy': {'p95_ms': 1.2, 'queries_per_request': 1.0,
+                                            'cache_round_trips_per_request': 1.0}}
+        self.assertEquals(len(compare_with_baseline(report, baseline, tolerance=0.5)), 1)
+        report['student_active_policy']['p95_ms'] = 2.0
+        report['student_active_policy']['cache_round_trips_per_request'] = 2.0
+        self.assertEquals(len(compare_with_baseline(report, baseline, tolerance=0.5)), 3)
+
+def client_with_session(session_params):
+    client = Client()
+    session = client.session
+    for k, v in session_params.items():
+        session[k] = v
+    session.save()
+    client.cookies[settings.SESSION_COOKIE_NAME] = session.session_key
+    return client
+
+@override_settings(CACHES=LOCMEM_CACHES, REQUEST_METRICS_SAMPLE_RATE=1.0)
+class RequestMetricsTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        metrics.reset_histograms()
+        create_default_policy_templates()
+        Policies.objects.create(
+            context_id='context123',
+            published_by='123456789',
+            is_published=True,
+            is_active=True,
+            body='this is an important policy. please read!',
+            course_id=1
+        )
+
+    def tearDown(self):
+        cache.clear()
+        metrics.reset_histograms()
+
+    def testSampledRequestIsLoggedAndCounted(self):
+        client = client_with_session({'role': 'Student', 'course_id': 1})
+        with self.assertLogs('policy_wizard.metrics', level='INFO') as logs:
+            client.get(reverse('student_active_policy'))
+        logged = json.loads(logs.records[0].getMessage())
+        self.assertEquals(logged['view'], 'student_active_policy')
+        # Reading the policy, and checking it did not change while the page rendered
+        self.assertEquals(logged['db_queries'], 2)
+        self.assertEquals(logged['cache_misses'], 1)
+        self.assertGreater(logged['template_ms'], 0)
+        self.assertEquals(metrics.histogram_snapshot()['student_active_policy']['count'], 1)
+
+    def testAdministratorCanReadHistogram(self):
+        client = client_with_session({'role': 'Administrator', 'course_id': 1})
+        client.get(reverse('policy_templates_list'))
+        response = client.get(reverse('request_metrics'))
+        self.assertEquals(response.status_code, 200)
+        self.assertEquals(response.json()['policy_templates_list']['count'], 1)
+
+    def testStudentCannotReadHistogram(self):
+        client = client_with_session({'role': 'Student', 'course_id': 1})
+        response = client.get(reverse('request_metrics'))
+        self.assertEquals(response.status_code, 403)
+
+    @override_settings(REQUEST_METRICS_SAMPLE_RATE=0)
+    def testUnsampledRequestIsNotCounted(self):
+        client = client_with_session({'role': 'Student', 'course_id': 1})
+        client.get(reverse('student_active_policy'))
+        self.assertEquals(metrics.histogram_snapshot(), {})
+
+@override_settings(CACHES=LOCMEM_CACHES, SESSION_ENGINE='policy_wizard.sessions')
+class SignedSessionTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        create_default_policy_templates()
+        Policies.objects.create(
+            context_id='context1',
+            published_by='123456789',
+            is_published=True,
+            is_active=True,
+            body='this is an important policy. please read!',
+            course_id=1
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def launch(self, client):
+        return client.post(reverse('process_lti_launch_request'),
+                           launch_params(1, 'student1', STUDENT_ROLES))
+
+    def testSessionIsCarriedInSignedCookie(self):
+        client = Client()
+        response = self.launch(client)
+        token = response.cookies[settings.SESSION_COOKIE_NAME].value
+        # Only the values the views need are kept, however many launch parameters pylti stores
+        self.assertEquals(set(signing.loads(token, salt='django.contrib.sessions.backends.signed_cookies')),
+                          {'role', 'course_id', 'context_id', 'lis_person_sourcedid', 'lti_authenticated'})
+        response = client.get(response['Location'])
+        self.assertInHTML('this is an important policy. please read!', response.content.decode("utf-8"))
+
+    def testStudentViewMakesNoSessionCacheRoundTrip(self):
+        client = Client()
+        response = self.launch(client)
+        cache.clear()
+        with mock.patch.object(cache, 'get', wraps=cache.get) as cache_get:
+            client.get(response['Location'])
+        # The only cache lookup left is the rendered policy page
+        cache_get.assert_called_once()
+
+    @override_settings(SESSION_URL_PARAMETER='lti_session')
+    def testSessionIsCarriedInUrlWithoutCookies(self):
+        response = self.launch(Client())
+        self.assertIn('lti_session=', response['Location'])
+        # A client that never got the cookie, like a Canvas iframe blocking third-party cookies
+        response = Client().get(response['Location'])
+        self.assertEquals(response.status_code, 200)
+        self.assertInHTML('this is an important policy. please read!', response.content.decode("utf-8"))
+
+    @override_settings(SESSION_URL_PARAMETER='lti_session', SESSION_URL_MAX_AGE=60)
+    def testSessionInUrlExpiresSooner(self):
+        issued = time.time()
+        client = Client()
+        url = self.launch(client)['Location']
+        with mock.patch('time.time', return_value=issued + 120):
+            # The cookie is still good for as long as a cookie session
+            self.assertEquals(client.get(reverse('student_active_policy')).status_code, 200)
+            self.assertEquals(Client().get(url).status_code, 403)
+
+    @override_settings(SESSION_URL_PARAMETER='lti_session', SESSION_ENGINE='policy_wizard.cache_sessions')
+    def testSessionInUrlNeedsSignedSessions(self):
+        with self.assertRaises(ImproperlyConfigured):
+            Client().get(reverse('student_active_policy'))
+
+
+class SingleActivePolicyTests(TestCase):
+
+    def setUp(self):
+        self.policy_template = PolicyTemplates.objects.create(name="Custom Policy", body="Bar")
+        self.first_policy = publish_policy(1, context_id='context1', body='first', related_template=self.policy_template,
+                                           published_by='123456789', is_published=True)
+
+    def testDatabaseRejectsSecondActivePolicy(self):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Policies.objects.create(course_id=1, context_id='context1', body='second', published_by='123456789',
+                                    is_published=True, is_active=True)
+
+    def testPublishReplacesActivePolicy(self):
+        second_policy = publish_policy(1, context_id='context1', body='second', related_template=self.policy_template,
+                                       published_by='123456789', is_published=True)
+        self.assertEquals(Policies.objects.get(course_id=1, is_active=True).pk, second_policy.pk)
+
+    def testPublishRetriesWhenConcurrentPublishWins(self):
+        # On the first attempt, simulate a co-instructor's policy that was committed after the lock was taken
+        real_inactivate = utils._inactivate_course_policies
+        calls = []
+        def racing_inactivate(course_id):
+            calls.append(course_id)
+            if len(calls) > 1:
+                real_inactivate(course_id)
+        with mock.patch('policy_wizard.utils._inactivate_course_policies', side_effect=racing_inactivate):
+            second_policy = publish_policy(1, context_id='context1', body='second',
+                                           related_template=self.policy_template, published_by='123456789',
+                                           is_published=True)
+        self.assertEquals(len(calls), 2)
+        self.assertEquals(list(Policies.objects.filter(course_id=1, is_active=True)), [second_policy])
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def testPublishWithoutACourseIsDenied(self):
+        with mock.patch('policy_wizard.utils._lock_active_policies') as lock, self.assertRaises(PermissionDenied):
+            publish_policy(None, context_id='context1', body='second', published_by='123456789', is_published=True)
+        lock.assert_not_called()
+        # Launched from outside a Canvas course
+        client = client_with_session({'role': 'Instructor', 'course_id': None, 'context_id': 'context1',
+                                      'lis_person_sourcedid': '123456789'})
+        response = client.post(reverse('instructor_level_policy_edit', args=[self.policy_template.pk]),
+                               {'body': 'second'})
+        self.assertEquals(response.status_code, 403)
+        self.assertEquals(Policies.objects.count(), 1)
+
+class PolicyVersionTests(TestCase):
+
+    def setUp(self):
+        self.policy_template = PolicyTemplates.objects.create(name="Custom Policy", body="Bar")
+        self.policy = publish_policy(1, context_id='context1', body='first', related_template=self.policy_template,
+                                     published_by='123456789', is_published=True)
+
+    def testPublishAndEditAppendVersions(self):
+        utils.activate_policy(self.policy, 'first, edited', '987654321')
+        versions = list(PolicyVersion.objects.filter(course_id=1).order_by('number'))
+        self.assertEquals([(v.number, v.body, v.published_by) for v in versions],
+                          [(1, 'first', '123456789'), (2, 'first, edited', '987654321')])
+        self.assertEquals(CoursePolicy.objects.get(pk=1).current_version, versions[-1])
+
+    def testCompressedBodyRoundTrips(self):
+        body = '<p>%s</p>' % ('Do your own work. ' * 200)
+        compressed = PolicyVersion.compress(body)
+        self.assertLess(len(compressed), len(body))
+        self.assertEquals(PolicyVersion(compressed_body=compressed).body, body)
+
+    def testInactivateClearsCurrentVersion(self):
+        request = annotate_request_with_session(RequestFactory().post('/'), {'course_id': 1})
+        utils.inactivate_active_policies(request)
+        self.assertIsNone(CoursePolicy.objects.get(pk=1).current_version)
+        self.assertEquals(PolicyVersion.objects.filter(course_id=1).count(), 1)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def testHistoryIsPaginatedNewestFirst(self):
+        for n in range(2, 25):
+            utils.activate_policy(self.policy, 'version %d' % n, '123456789')
+        client = client_with_session({'course_id': 1, 'role': 'Instructor'})
+
+        response = client.get(reverse('policy_history'))
+        self.assertEquals([v.number for v in response.context['versions']], list(range(24, 4, -1)))
+        self.assertEquals(response.context['current_version_id'], CoursePolicy.objects.get(pk=1).current_version_id)
+
+        response = client.get(reverse('policy_history'), {'before': response.context['next_before']})
+        self.assertEquals([v.number for v in response.context['versions']], [4, 3, 2, 1])
+        self.assertIsNone(response.context['next_before'])
+
+class PolicySanitizerTests(TestCase):
+
+    def testKeepsEditorFormatting(self):
+        body = '<p style="text-align: center;">Do <strong>your</strong> own <a href="https://example.com" target="_blank">work</a></p>'
+        self.assertEquals(sanitize_policy_html(body),
+                          '<p style="text-align: center">Do <strong>your</strong> own '
+                          '<a href="https://example.com" target="_blank" rel="noopener noreferrer">work</a></p>')
+
+    def testKeepsWhatEveryEditorButtonProduces(self):
+        # As TinyMCE writes them, with the trailing semicolons it puts in styles removed
+        bodies = [
+            # fontsizeselect
+            '<p><span style="font-size: 14pt">Bigger</span></p>',
+            # ltr, rtl
+            '<p style="text-align: right" dir="rtl">\u05e9\u05dc\u05d5\u05dd</p><p dir="ltr">Hello</p>',
+            # table
+            '<table style="border-collapse: collapse; width: 100%" border="1" cellpadding="2" cellspacing="0">'
+            '<tbody><tr><td style="width: 50%">a</td><td style="width: 50%">b</td></tr></tbody></table>',
+            # media, a YouTube link and a video file
+            '<p><iframe src="//www.youtube.com/embed/dQw4w9WgXcQ" width="560" height="314" '
+            'allowfullscreen="allowfullscreen"></iframe></p>',
+            '<p><video width="300" height="150" controls="controls">'
+            '<source src="https://example.com/lecture.mp4" type="video/mp4"></video></p>',
+            # forecolor, backcolor, superscript
+            '<p><span style="color: #ff0000; background-color: #ffff00">Note</span><sup>1</sup></p>',
+        ]
+        for body in bodies:
+            self.assertEquals(sanitize_policy_html(body), body)
+
+    def testStripsEmbedsFromOtherHosts(self):
+        body = ('<p>a<iframe src="https://evil.example.com/x">fallback</iframe>b</p>'
+                '<iframe src="//www.youtube.com.evil.example.com/embed/x"></iframe>'
+                '<iframe src="http://www.youtube.com/embed/x"></iframe>')
+        self.assertEquals(sanitize_policy_html(body), '<p>ab</p>')
+
+    def testSelfClosingDroppedTagsKeepWhatFollows(self):
+        self.assertEquals(sanitize_policy_html('<p>a</p><script/><p>kept</p>'), '<p>a</p><p>kept</p>')
+        self.assertEquals(sanitize_policy_html('<p>a</p><iframe src="https://evil.example.com"/><p>kept</p>'),
+                          '<p>a</p><p>kept</p>')
+        self.assertEquals(sanitize_policy_html('<p>a<iframe src="https://www.youtube.com/embed/x"/>b</p>'),
+                          '<p>a<iframe src="https://www.youtube.com/embed/x"></iframe>b</p>')
+
+    def testStripsScriptsAndEventHandlers(self):
+        body = ('<p onclick="steal()">Hi<script>steal()</script></p><iframe src="https://evil"></iframe>'
+                '<a href=" javascript:steal()">x</a><span style="background: url(https://evil)">y</span>')
+        self.assertEquals(sanitize_policy_html(body), '<p>Hi</p><a>x</a><span>y</span>')
+
+    def testCollapsesWhitespaceAndClosesTags(self):
+        self.assertEquals(sanitize_policy_html('\n  <ul>\n  <li>one\n\n  <li>two</ul>  <pre>a\n  b</pre>'),
+                          '<ul> <li>one </li><li>two</li></ul> <pre>a\n  b</pre>')
+
+    def testSavingStoresRenderedBodyAndHash(self):
+        policy_template = PolicyTemplates.objects.create(name="Custom Policy", body='<p>Bar<script>x</script></p>')
+        policy = publish_policy(1, context_id='context1', body='<p>Foo<img src=x onerror=alert(1)></p>',
+                                related_template=policy_template, published_by='123456789', is_published=True)
+        self.assertEquals(policy_template.rendered_body, '<p>Bar</p>')
+        self.assertEquals(policy_template.body_hash, body_hash('<p>Bar</p>'))
+        self.assertEquals(Policies.objects.get(pk=policy.pk).rendered_body, '<p>Foo<img src="x"></p>')
+        self.assertEquals(PolicyVersion.objects.get(policy=policy).body, '<p>Foo<img src="x"></p>')
+
+class ConditionalGetTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.studentSession = {'context_id': 'context123', 'role': 'Student', 'course_id': 1}
+        self.instructorSession = {'context_id': 'context123', 'lis_person_sourcedid': '123456789',
+                                  'role': 'Instructor', 'course_id': 1}
+        self.policy_template = PolicyTemplates.objects.create(name="Custom Policy", body="Bar")
+        self.active_policy = publish_policy(1, context_id='context123', body='this is an important policy',
+                                            related_template=self.policy_template, published_by='123456789',
+                                            is_published=True)
+
+    def tearDown(self):
+        cache.clear()
+
+    def get(self, view, session, headers=None, **kwargs):
+        request = self.factory.get('/', **(headers or {}))
+        annotate_request_with_session(request, session)
+        return view(request, **kwargs)
+
+    def assertBodyNotLoaded(self, queries):
+        for query in queries:
+            self.assertNotIn('."body"', query['sql'])
+            self.assertNotIn('."rendered_body"', query['sql'])
+
+    def testStudentRepeatRequestIsNotModified(self):
+        response = self.get(views.student_active_policy_view, self.studentSession)
+        self.assertEquals(response.status_code, 200)
+        self.assertEquals(response['ETag'], '"%s"' % self.active_policy.body_hash)
+        self.assertIn('private', response['Cache-Control'])
+
+        # The test cache is a dummy, so the validators come from the database
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get(views.student_active_policy_view, self.studentSession,
+                                {'HTTP_IF_NONE_MATCH': response['ETag']})
+        self.assertEquals(response.status_code, 304)
+        self.assertEquals(len(queries), 1)
+        self.assertBodyNotLoaded(queries)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def testStudentRepeatRequestIsAnsweredFromCache(self):
+        response = self.get(views.student_active_policy_view, self.studentSession)
+        with self.assertNumQueries(0):
+            response = self.get(views.student_active_policy_view, self.studentSession,
+                                {'HTTP_IF_MODIFIED_SINCE': response['Last-Modified']})
+        self.assertEquals(response.status_code, 304)
+
+    def testStudentGetsNewlyPublishedPolicy(self):
+        etag = self.get(views.student_active_policy_view, self.studentSession)['ETag']
+        publish_policy(1, context_id='context123', body='a new policy', related_template=self.policy_template,
+                       published_by='123456789', is_published=True)
+        response = self.get(views.student_active_policy_view, self.studentSession, {'HTTP_IF_NONE_MATCH': etag})
+        self.assertEquals(response.status_code, 200)
+        self.assertInHTML('a new policy', response.content.decode('utf-8'))
+        self.assertNotEquals(response['ETag'], etag)
+
+    def testInstructorRepeatRequestIsNotModified(self):
+        response = self.get(views.instructor_active_policy, self.instructorSession, pk=self.active_policy.pk)
+        self.assertEquals(response.status_code, 200)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get(views.instructor_active_policy, self.instructorSession,
+                                {'HTTP_IF_NONE_MATCH': response['ETag']}, pk=self.active_policy.pk)
+        self.assertEquals(response.status_code, 304)
+        self.assertBodyNotLoaded(queries)
+
+def bytes_fetched(queries):
+    '''
+    Re-runs the SELECTs among the captured queries and adds up the size of every value they return
+    '''
+    fetched = 0
+    with connection.cursor() as cursor:
+        for query in queries:
+            if query['sql'].startswith('SELECT'):
+                cursor.execute(query['sql'])
+                for row in cursor.fetchall():
+                    fetched += sum(len(value) if isinstance(value, (str, bytes)) else 8 for value in row if value is not None)
+    return fetched
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class BodyColumnLoadingTests(TestCase):
+    '''
+    With a large policy and a large template, every view fetches at most one copy of the body it shows or edits
+    '''
+    body = '<p>%s</p>' % ('Do your own work. ' * 10000)
+
+    def setUp(self):
+        cache.clear()
+        self.policy_template = PolicyTemplates.objects.create(name="Custom Policy", body=self.body)
+        self.policy = publish_policy(1, context_id='context123', body=self.body, related_template=self.policy_template,
+                                     published_by='123456789', is_published=True)
+        self.session = {'context_id': 'context123', 'lis_person_sourcedid': '123456789', 'course_id': 1}
+
+    def tearDown(self):
+        cache.clear()
+
+    def assertFetchesOneBody(self, role, url_name, *args):
+        client = client_with_session(dict(self.session, role=role))
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(reverse(url_name, args=args))
+        self.assertEquals(response.status_code, 200)
+        self.assertLess(bytes_fetched(queries), len(self.body) + 1024, url_name)
+
+    def testPolicyViews(self):
+        self.assertFetchesOneBody('Instructor', 'policy_templates_list')
+        self.assertFetchesOneBody('Instructor', 'instructor_active_policy', self.policy.pk)
+        self.assertFetchesOneBody('Instructor', 'edit_active_policy', self.policy.pk)
+        self.assertFetchesOneBody('Student', 'student_active_policy')
+
+    def testTemplateViews(self):
+        self.assertFetchesOneBody('Administrator', 'policy_templates_list')
+        self.assertFetchesOneBody('Administrator', 'admin_updated_template', self.policy_template.pk)
+        self.assertFetchesOneBody('Administrator', 'admin_level_template_edit', self.policy_template.pk)
+        self.assertFetchesOneBody('Instructor', 'instructor_level_policy_edit', self.policy_template.pk)
+
+    def testPolicyValidatorsFetchNoBody(self):
+        client = client_with_session(dict(self.session, role='Student'))
+        etag = client.get(reverse('student_active_policy'))['ETag']
+        cache.delete(student_policy_cache_key(1))
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(reverse('student_active_policy'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEquals(response.status_code, 304)
+        self.assertLess(bytes_fetched(queries), 1024)
+
+class BulkPublishTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.policy_template = PolicyTemplates.objects.create(name="Collaboration Prohibited", body="<p>Alone</p>")
+        self.old_policy = publish_policy(1, context_id='context1', body='<p>Last term</p>',
+                                         related_template=self.policy_template, published_by='123456789',
+                                         is_published=True)
+
+    def tearDown(self):
+        cache.clear()
+
+    def testPublishesTemplatesAndCopiesPoliciesForward(self):
+        rows = [{'course_id': course_id, 'template_id': self.policy_template.pk} for course_id in range(100, 150)]
+        rows += [{'course_id': 2, 'copy_from': 1, 'context_id': 'context2'}, {'course_id': 3, 'copy_from': 99},
+                 {'course_id': 1, 'template_id': self.policy_template.pk}]
+        progress = []
+        with CaptureQueriesContext(connection) as queries:
+            result = bulk.bulk_publish_policies(rows, 'admin', chunk_size=20, progress=lambda *p: progress.append(p))
+        self.assertEquals(result, {'published': 52, 'published_course_ids': list(range(100, 150)) + [2, 1],
+                                   'failed': [], 'skipped': [3]})
+        self.assertEquals(progress, [(20, 52), (40, 52), (52, 52)])
+        # A fixed number of queries per chunk, not per course
+        self.assertLess(len(queries), 50)
+
+        copied = Policies.objects.get(course_id=2, is_active=True)
+        self.assertEquals((copied.context_id, copied.rendered_body, copied.body_hash),
+                          ('context2', self.old_policy.rendered_body, self.old_policy.body_hash))
+        replaced = Policies.objects.get(course_id=1, is_active=True)
+        self.assertEquals(replaced.rendered_body, '<p>Alone</p>')
+        self.assertFalse(Policies.objects.get(pk=self.old_policy.pk).is_active)
+        self.assertEquals(Policies.objects.filter(course_id__gte=100, is_active=True).count(), 50)
+
+        course_policy = CoursePolicy.objects.select_related('current_version').get(pk=1)
+        self.assertEquals((course_policy.version_count, course_policy.current_version.number), (2, 2))
+        self.assertEquals(course_policy.current_version.policy_id, replaced.pk)
+        self.assertEquals(CoursePolicy.objects.get(pk=120).current_version.body, '<p>Alone</p>')
+
+    def testChunkClashingWithAnotherPublishIsRetriedThenReported(self):
+        rows = [{'course_id': course_id, 'template_id': self.policy_template.pk} for course_id in range(100, 106)]
+        real_publish_chunk = bulk._publish_chunk
+        calls = []
+        def racing_publish_chunk(courses, *args):
+            first_course_id = courses[0][0]['course_id']
+            calls.append(first_course_id)
+            # The first chunk clashes once, the second every time
+            if first_course_id == 102 or (first_course_id == 100 and calls.count(100) == 1):
+                raise IntegrityError('duplicate key value violates unique constraint')
+            real_publish_chunk(courses, *args)
+
+        with mock.patch.object(bulk, '_publish_chunk', side_effect=racing_publish_chunk):
+            result = bulk.bulk_publish_policies(rows, 'admin', chunk_size=2)
+        self.assertEquals(calls, [100, 100, 102, 102, 102, 104])
+        self.assertEquals(result, {'published': 4, 'published_course_ids': [100, 101, 104, 105],
+                                   'failed': [102, 103], 'skipped': []})
+        self.assertFalse(Policies.objects.filter(course_id__in=[102, 103]).exists())
+        self.assertEquals(Policies.objects.filter(course_id=100).count(), 1)
+
+    def testInvalidMappingPublishesNothing(self):
+        for rows in ([{'course_id': 5}], [{'course_id': 5, 'template_id': 999}],
+                     [{'course_id': 'five', 'template_id': self.policy_template.pk}],
+                     [{'course_id': 5, 'copy_from': 1}, {'course_id': 5, 'copy_from': 1}]):
+            with self.assertRaises(bulk.BulkPublishError):
+                bulk.bulk_publish_policies(rows, 'admin')
+        self.assertFalse(Policies.objects.filter(course_id=5).exists())
+
+    def testCommandReadsCsv(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.csv') as mapping:
+            mapping.write('course_id,context_id,template_id,copy_from\n7,context7,%d,\n8,,,1\n' % self.policy_template.pk)
+            mapping.flush()
+            out = io.StringIO()
+            call_command('bulk_publish_policies', mapping.name, published_by='admin', stdout=out)
+        self.assertIn('Published policies in 2 courses', out.getvalue())
+        self.assertEquals(Policies.objects.get(course_id=8, is_active=True).published_by, 'admin')
+
+    @override_settings(BULK_API_TOKEN='bulk-token')
+    def testApiTakesATokenInsteadOfASession(self):
+        mapping = json.dumps([{'course_id': 9, 'template_id': self.policy_template.pk}])
+        url = reverse('bulk_publish_policies') + '?published_by=admin'
+        # A script has neither a session nor a CSRF token
+        client = Client(enforce_csrf_checks=True)
+        response = client.post(url, mapping, content_type='application/json', HTTP_AUTHORIZATION='Bearer bulk-token')
+        self.assertEquals(response.json(), {'published': 1, 'published_course_ids': [9], 'failed': [], 'skipped': []})
+        self.assertEquals(Policies.objects.get(course_id=9, is_active=True).published_by, 'admin')
+        response = client.post(url, 'course_id\n10\n', content_type='text/csv', HTTP_AUTHORIZATION='Bearer bulk-token')
+        self.assertEquals(response.status_code, 400)
+        response = client.post(reverse('bulk_publish_policies'), mapping, content_type='application/json',
+                               HTTP_AUTHORIZATION='Bearer bulk-token')
+        self.assertEquals(response.status_code, 400)
+
+    @override_settings(CACHES=LOCMEM_CACHES, BULK_API_TOKEN='bulk-token')
+    def testApiRejectsRequestsWithoutTheToken(self):
+        mapping = json.dumps([{'course_id': 9, 'template_id': self.policy_template.pk}])
+        url = reverse('bulk_publish_policies') + '?published_by=admin'
+        client = client_with_session({'role': 'Administrator', 'course_id': 1, 'lis_person_sourcedid': 'admin'})
+        self.assertEquals(client.post(url, mapping, content_type='application/json').status_code, 403)
+        response = client.post(url, mapping, content_type='application/json', HTTP_AUTHORIZATION='Bearer wrong')
+        self.assertEquals(response.status_code, 403)
+        with self.settings(BULK_API_TOKEN=None):
+            response = client.post(url, mapping, content_type='application/json', HTTP_AUTHORIZATION='Bearer ')
+            self.assertEquals(response.status_code, 403)
+        self.assertFalse(Policies.objects.filter(course_id=9).exists())
+
+class PolicyExportTests(TestCase):
+
+    def setUp(self):
+        self.first_template = PolicyTemplates.objects.create(name="Collaboration Prohibited", body="<p>Alone</p>")
+        self.second_template = PolicyTemplates.objects.create(name="Custom Policy", body="<p>Custom</p>")
+        for course_id, policy_template in ((1, self.first_template), (2, self.second_template), (3, self.first_template)):
+            publish_policy(course_id, context_id='context%d' % course_id, body=policy_template.body,
+                           related_template=policy_template, published_by='instructor%d' % course_id,
+                           is_published=True)
+        # Replaced, so not exported
+        publish_policy(3, context_id='context3', body='<p>Together, "with" commas</p>', related_template=self.second_template,
+                       published_by='instructor3', is_published=True)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def testAdministratorStreamsCsv(self):
+        client = client_with_session({'role': 'Administrator', 'course_id': 1})
+        response = client.get(reverse('export_policies'))
+        self.assertTrue(response.streaming)
+        rows = list(csv.DictReader(io.StringIO(b''.join(response.streaming_content).decode('utf-8'))))
+        self.assertEquals([(row['course_id'], row['published_by'], row['related_template_name'], row['body'])
+                           for row in rows],
+                          [('1', 'instructor1', 'Collaboration Prohibited', '<p>Alone</p>'),
+                           ('2', 'instructor2', 'Custom Policy', '<p>Custom</p>'),
+                           ('3', 'instructor3', 'Custom Policy', '<p>Together, "with" commas</p>')])
+
+        response = client.get(reverse('export_policies'), {'format': 'json', 'template_id': self.first_template.pk})
+        exported = json.loads(b''.join(response.streaming_content).decode('utf-8'))
+        self.assertEquals([policy['course_id'] for policy in exported], [1])
+
+        self.assertEquals(client.get(reverse('export_policies'), {'since': 'yesterday'}).status_code, 400)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def testExportIsForAdministrators(self):
+        client = client_with_session({'role': 'Instructor', 'course_id': 1})
+        self.assertEquals(client.get(reverse('export_policies')).status_code, 403)
+
+    def testCommandFiltersByDate(self):
+        Policies.objects.filter(course_id=2).update(updated_at=datetime.datetime(2020, 1, 15, tzinfo=datetime.timezone.utc))
+        out = io.StringIO()
+        call_command('export_policies', format='json', until='2020-01-31', stdout=out)
+        self.assertEquals([policy['course_id'] for policy in json.loads(out.getvalue())], [2])
+        out = io.StringIO()
+        call_command('export_policies', since='2020-02-01', stdout=out)
+        self.assertEquals([row['course_id'] for row in csv.DictReader(io.StringIO(out.getvalue()))], ['1', '3'])
+
+class TemplateUsageTests(TestCase):
+
+    def setUp(self):
+        self.first_template = PolicyTemplates.objects.create(name="Collaboration Prohibited", body="<p>Alone</p>")
+        self.second_template = PolicyTemplates.objects.create(name="Custom Policy", body="<p>Custom</p>")
+
+    def usage(self, policy_template):
+        usage = TemplateUsage.objects.get(template=policy_template)
+        return (usage.active_courses, usage.published, usage.published_with_changes, usage.edits)
+
+    def testCountersFollowPublishEditAndInactivate(self):
+        first = publish_policy(1, context_id='context1', body='<p>Alone</p>', related_template=self.first_template,
+                               published_by='123456789', is_published=True)
+        publish_policy(2, context_id='context2', body='<p>Alone, mostly</p>', related_template=self.first_template,
+                       published_by='123456789', is_published=True)
+        self.assertEquals(self.usage(self.first_template), (2, 2, 1, 0))
+
+        publish_policy(1, context_id='context1', body='<p>Custom</p>', related_template=self.second_template,
+                       published_by='123456789', is_published=True)
+        self.assertEquals(self.usage(self.first_template), (1, 2, 1, 0))
+        self.assertEquals(self.usage(self.second_template), (1, 1, 0, 0))
+
+        utils.activate_policy(first, '<p>Alone, again</p>', '123456789')
+        self.assertEquals(self.usage(self.first_template), (2, 2, 1, 1))
+        self.assertEquals(self.usage(self.second_template), (0, 1, 0, 0))
+
+        utils.inactivate_active_policies(annotate_request_with_session(RequestFactory().post('/'), {'course_id': 1}))
+        self.assertEquals(self.usage(self.first_template), (1, 2, 1, 1))
+
+    def testBulkPublishCountsUsage(self):
+        publish_policy(1, context_id='context1', body='<p>Custom</p>', related_template=self.second_template,
+                       published_by='123456789', is_published=True)
+        bulk.bulk_publish_policies([{'course_id': 1, 'template_id': self.first_template.pk},
+                                    {'course_id': 2, 'template_id': self.first_template.pk},
+                                    {'course_id': 3, 'copy_from': 1}], 'admin')
+        # Course 3 copies the policy course 1 had before the bulk publish
+        self.assertEquals(self.usage(self.first_template), (2, 2, 0, 0))
+        self.assertEquals(self.usage(self.second_template), (1, 2, 0, 0))
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def testDashboardNeedsNoPolicyScan(self):
+        publish_policy(1, context_id='context1', body='<p>Alone</p>', related_template=self.first_template,
+                       published_by='123456789', is_published=True)
+        client = client_with_session({'role': 'Administrator', 'course_id': 1})
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(reverse('policy_templates_list'))
+        self.assertNotIn('policy_wizard_policies', ' '.join(query['sql'] for query in queries))
+        self.assertEquals([(usage.template.name, usage.active_courses) for usage in response.context['template_usage']],
+                          [('Collaboration Prohibited', 1), ('Custom Policy', 0)])
+
+class StaticAssetTests(TestCase):
+
+    def testTinymceBundleIsUpToDate(self):
+        with open(assets.TINYMCE_BUNDLE_PATH, encoding='utf-8') as bundle:
+            self.assertEquals(bundle.read(), assets.build_tinymce_bundle(),
+                              'Run python manage.py build_tinymce_bundle')
+
+    def testEditorUsesTheBundledPlugins(self):
+        with open(os.path.join(settings.BASE_DIR, 'templates', 'tinymce_editor_base.html')) as editor_template:
+            self.assertIn("plugins: '%s'" % ' '.join(assets.TINYMCE_PLUGINS), editor_template.read())
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def testPagesLoadNothingFromExternalHosts(self):
+        policy_template = PolicyTemplates.objects.create(name="Custom Policy", body="<p>Bar</p>")
+        client = client_with_session({'role': 'Instructor', 'course_id': 1})
+        for url in (reverse('policy_templates_list'), reverse('instructor_level_policy_edit', args=[policy_template.pk])):
+            content = client.get(url).content.decode('utf-8')
+            self.assertNotRegex(content, r'<(script src|link href)="(https?:)?//')
+            self.assertIn(settings.STATIC_URL, content)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class PageWeightTests(TestCase):
+
+    def testReadOnlyPagesShipNoScripts(self):
+        report = run_page_weight_benchmark()
+        for view_name in ('student_active_policy', 'instructor_level_template_list', 'admin_level_template_list',
+                          'policy_history'):
+            self.assertEquals(report[view_name]['scripts'], 0, view_name)
+        # The page and its two stylesheets
+        self.assertEquals(report['student_active_policy']['requests'], 3)
+        # Only the editor bundle
+        self.assertEquals(report['instructor_level_policy_edit']['scripts'], 1)
+        self.assertEquals(report['admin_level_template_edit']['scripts'], 1)
+
+    def testEditorLoadsTinymceAfterThePage(self):
+        policy_template = PolicyTemplates.objects.create(name="Custom Policy", body="<p>Bar</p>")
+        client = client_with_session({'role': 'Instructor', 'course_id': 1})
+        content = client.get(reverse('instructor_level_policy_edit', args=[policy_template.pk])).content.decode('utf-8')
+        self.assertIn("script.src = '%stinymce/tinymce.bundle.min.js'" % settings.STATIC_URL, content)
+        self.assertNotRegex(content, r'<script[^>]* src="[^"]*tinymce')
+
+    def testRegressionsAgainstBaseline(self):
+        baseline = {'student_active_policy': {'requests': 3, 'scripts': 0, 'bytes': 1000, 'gzip_bytes': 100}}
+        report = {'student_active_policy': {'requests': 3, 'scripts': 0, 'bytes': 2000, 'gzip_bytes': 104}}
+        self.assertEquals(compare_page_weight_with_baseline(report, baseline, tolerance=0.05), [])
+        report['student_active_policy'].update(requests=5, scripts=2, gzip_bytes=200)
+        self.assertEquals(len(compare_page_weight_with_baseline(report, baseline, tolerance=0.05)), 3)
+
+
+# The threads serving the requests use their own database connections, so the data must be committed
+@override_settings(CACHES=COUNTING_CACHES)
+class ConcurrencyBenchmarkTests(TransactionTestCase):
+
+    def tearDown(self):
+        cache.clear()
+
+    def testThreadsServeEveryRequest(self):
+        requests = concurrency_benchmark_requests(number_of_courses=4)
+        self.assertEquals(sorted(url for _, url in requests), [reverse('policy_templates_list')] * 2 +
+                          [reverse('student_active_policy')] * 2)
+        result = measure_throughput(requests, threads=3, number_of_requests=30, round_trip_ms=1)
+        self.assertEquals(result['threads'], 3)
+        self.assertEquals(result['requests'], 30)
+        # Every request made at least a cache round trip, for its session
+        self.assertGreater(result['p50_ms'], 1)
+
+@override_settings(**UNCACHED_SETTINGS)
+class ConnectionBenchmarkTests(TestCase):
+
+    def testEveryModeLaunchesEveryView(self):
+        results = run_connection_benchmark(number_of_courses=1, students_per_course=2)
+        # Pooling needs Postgres
+        self.assertEquals(sorted(results), ['health-checked', 'per-request', 'persistent'])
+        for report in results.values():
+            self.assertEquals(report['student_active_policy']['requests'], 2)
+            self.assertEquals(report['policy_templates_list']['requests'], 1)
+        self.assertEquals(connection.settings_dict['CONN_MAX_AGE'], 0)
+
+class PostgresBackendTests(TestCase):
+
+    def wrapper(self, **settings_dict):
+        return postgresql_base.DatabaseWrapper(dict(
+            connection.settings_dict, ENGINE='policy_wizard.postgresql', NAME='policies', USER='policies',
+            PASSWORD='', HOST='db', PORT=5432, CONN_MAX_AGE=60, CONN_HEALTH_CHECKS=True, **settings_dict), 'default')
+
+    def connectionMock(self, usable=True):
+        def execute(sql, params=None):
+            if sql == 'SELECT 1' and not usable:
+                raise psycopg2.OperationalError('server closed the connection unexpectedly')
+        database_connection = mock.MagicMock(isolation_level=None, closed=0)
+        database_connection.cursor.return_value.execute.side_effect = execute
+        return database_connection
+
+    def testStaleConnectionIsReplaced(self):
+        stale, fresh = self.connectionMock(usable=False), self.connectionMock()
+        wrapper = self.wrapper(OPTIONS={})
+        with mock.patch('django.db.backends.postgresql.base.Database.connect', side_effect=[stale, fresh]):
+            wrapper.ensure_connection()
+            # A new request starts, and the kept connection is checked before its first query
+            wrapper.close_if_unusable_or_obsolete()
+            wrapper.ensure_connection()
+        self.assertIs(wrapper.connection, fresh)
+        stale.close.assert_called_once_with()
+
+    def testPooledConnectionIsHandedBack(self):
+        wrapper = self.wrapper(OPTIONS={'pool': {'min_size': 2, 'max_size': 4}})
+        self.assertNotIn('pool', wrapper.get_connection_params())
+        with mock.patch.object(postgresql_base.psycopg2_pool, 'ThreadedConnectionPool') as pool_class:
+            pooled = self.connectionMock()
+            pool_class.return_value.getconn.return_value = pooled
+            try:
+                wrapper.ensure_connection()
+                wrapper.close()
+            finally:
+                postgresql_base.close_pools()
+        self.assertEquals(pool_class.call_args[0], (2, 4))
+        pool_class.return_value.putconn.assert_called_once_with(pooled, close=False)
+        pooled.close.assert_not_called()
+
+    def testBrokenPooledConnectionIsClosed(self):
+        wrapper = self.wrapper(OPTIONS={'pool': {'max_size': 4}})
+        with mock.patch.object(postgresql_base.psycopg2_pool, 'ThreadedConnectionPool') as pool_class:
+            broken, fresh = self.connectionMock(usable=False), self.connectionMock()
+            pool_class.return_value.getconn.side_effect = [broken, fresh]
+            try:
+                wrapper.ensure_connection()
+            finally:
+                postgresql_base.close_pools()
+        self.assertIs(wrapper.connection, fresh)
+        pool_class.return_value.putconn.assert_called_once_with(broken, close=True)
+
+    def testExhaustedPoolWaitsForAConnection(self):
+        with mock.patch.object(postgresql_base.psycopg2_pool, 'ThreadedConnectionPool') as pool_class:
+            connection_pool = postgresql_base.BlockingConnectionPool(1, 1, 0.05)
+            held = connection_pool.getconn()
+            # No connection is handed back in time
+            with self.assertRaises(postgresql_base.psycopg2_pool.PoolError):
+                connection_pool.getconn()
+            # One is handed back while another thread waits
+            threading.Timer(0.01, connection_pool.putconn, [held]).start()
+            self.assertIs(connection_pool.getconn(), pool_class.return_value.getconn.return_value)
+        self.assertEquals(pool_class.return_value.getconn.call_count, 2)
+
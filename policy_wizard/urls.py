@@ -13,5 +13,9 @@ urlpatterns = [
     path('policy/<int:pk>/edit/', views.instructor_level_policy_edit_view, name='instructor_level_policy_edit'),
     path('active_policy/<int:pk>/', views.instructor_active_policy, name='instructor_active_policy'),
     path('edit_active_policy/<int:pk>/', views.edit_active_policy, name='edit_active_policy'),
+    path('policy_history/', views.policy_history_view, name='policy_history'),
     path('instructor_inactivate_policies/', views.instructor_inactivate_policies_view, name='instructor_inactivate_policies'),
+    path('request_metrics/', views.request_metrics_view, name='request_metrics'),
+    path('bulk_publish_policies/', views.bulk_publish_policies_view, name='bulk_publish_policies'),
+    path('export_policies/', views.export_policies_view, name='export_policies'),
 ]
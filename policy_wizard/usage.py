@@ -0,0 +1,24 @@
+'''
+Keeps the usage counters of the policy templates up to date as policies are published, edited and inactivated,
+with an increment of the template's row in the same transaction, so the dashboard never has to count policies
+'''
+from django.db.models import F
+
+from .models import TemplateUsage
+
+def add_template_usage(template_id, **deltas):
+    '''
+    Adds the deltas to the named counters of the template, if the policy was made from one
+    '''
+    if template_id is not None:
+        TemplateUsage.objects.filter(template_id=template_id).update(
+            **{counter: F(counter) + delta for counter, delta in deltas.items()})
+
+def add_template_usage_many(deltas_by_template):
+    '''
+    :param deltas_by_template: a dict of template id to a dict of counter name to delta, e.g. for a bulk publish
+    '''
+    for template_id, deltas in deltas_by_template.items():
+        deltas = {counter: delta for counter, delta in deltas.items() if delta}
+        if deltas:
+            add_template_usage(template_id, **deltas)
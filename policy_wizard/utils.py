@@ -1,72 +1,356 @@
+import logging
+import time
+from calendar import timegm
+from collections import Counter
+from functools import lru_cache
+
 from django.conf import settings
+from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
 from django.core.exceptions import PermissionDenied
+from django.db import IntegrityError, transaction
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
 from lti_provider.lti import LTI, LTIException
-from .models import Policies
+from .models import Policies, PolicyVersion, CoursePolicy
+from .cache import invalidate_student_policy_page
+from .cache_pipeline import CachePipeline
+from .usage import add_template_usage, add_template_usage_many
+from . import roles
+
+logger = logging.getLogger(__name__)
+
+# LIS context (course membership) roles and their sub-roles.
+# See https://www.imsglobal.org/specs/ltiv1p1/implementation-guide#toc-29 and
+# https://www.imsglobal.org/spec/lti/v1p3/#lis-vocabulary-for-context-roles
+_CONTEXT_SUB_ROLES = {
+    'Learner': ['Learner', 'NonCreditLearner', 'GuestLearner', 'ExternalLearner', 'Instructor'],
+    'Instructor': ['PrimaryInstructor', 'SecondaryInstructor', 'Lecturer', 'GuestInstructor', 'ExternalInstructor',
+                   'Grader', 'TeachingAssistant', 'TeachingAssistantSection', 'TeachingAssistantSectionAssociation',
+                   'TeachingAssistantOffering', 'TeachingAssistantTemplate', 'TeachingAssistantGroup'],
+    'ContentDeveloper': ['ContentDeveloper', 'Librarian', 'ContentExpert', 'ExternalContentExpert'],
+    'Member': ['Member'],
+    'Manager': ['AreaManager', 'CourseCoordinator', 'Observer', 'ExternalObserver'],
+    'Mentor': ['Mentor', 'Reviewer', 'Advisor', 'Auditor', 'Tutor', 'LearningFacilitator', 'ExternalMentor',
+               'ExternalReviewer', 'ExternalAdvisor', 'ExternalAuditor', 'ExternalTutor',
+               'ExternalLearningFacilitator'],
+    'Administrator': ['Administrator', 'Support', 'Developer', 'SystemAdministrator', 'ExternalSystemAdministrator',
+                      'ExternalDeveloper', 'ExternalSupport'],
+    'TeachingAssistant': ['TeachingAssistant', 'TeachingAssistantSection', 'TeachingAssistantSectionAssociation',
+                          'TeachingAssistantOffering', 'TeachingAssistantTemplate', 'TeachingAssistantGroup',
+                          'Grader'],
+}
+# LIS institution roles. See https://www.imsglobal.org/spec/lti/v1p3/#lis-vocabulary-for-institution-roles
+_INSTITUTION_ROLES = ['Administrator', 'Faculty', 'Guest', 'None', 'Other', 'Staff', 'Student', 'Alumni', 'Instructor',
+                      'Learner', 'Member', 'Mentor', 'Observer', 'ProspectiveStudent']
+
+# How the principal roles map to the 3 role types (Administrator, Instructor, and Student) in this policy wizard app.
+# Any principal role not listed here maps to Student.
+_CONTEXT_ROLE_TO_POLICY_ROLE = {
+    'Administrator': roles.ADMINISTRATOR,
+    'Instructor': roles.INSTRUCTOR,
+    'TeachingAssistant': roles.INSTRUCTOR,
+}
+_INSTITUTION_ROLE_TO_POLICY_ROLE = {
+    'Administrator': roles.ADMINISTRATOR,
+}
+# When a launcher has several roles, the most privileged one wins
+_POLICY_ROLE_PRECEDENCE = [roles.STUDENT, roles.INSTRUCTOR, roles.ADMINISTRATOR]
+
+_CONTEXT = 'context'
+_INSTITUTION = 'institution'
+
+def _build_role_table():
+    """
+    Maps every known LTI 1.1 and LTI 1.3 role URN to a (role kind, policy role) pair
+    """
+    table = {}
+    for principal, sub_roles in _CONTEXT_SUB_ROLES.items():
+        policy_role = _CONTEXT_ROLE_TO_POLICY_ROLE.get(principal, roles.STUDENT)
+        principal_urns = [
+            principal,  # LTI 1.1 permits the short form of context roles
+            'urn:lti:role:ims/lis/%s' % principal,
+            'http://purl.imsglobal.org/vocab/lis/v2/membership#%s' % principal,
+        ]
+        sub_role_urns = []
+        for sub_role in sub_roles:
+            sub_role_urns.append('urn:lti:role:ims/lis/%s/%s' % (principal, sub_role))
+            sub_role_urns.append('http://purl.imsglobal.org/vocab/lis/v2/membership/%s#%s' % (principal, sub_role))
+        for urn in principal_urns + sub_role_urns:
+            table[urn] = (_CONTEXT, policy_role)
+    for institution_role in _INSTITUTION_ROLES:
+        policy_role = _INSTITUTION_ROLE_TO_POLICY_ROLE.get(institution_role, roles.STUDENT)
+        table['urn:lti:instrole:ims/lis/%s' % institution_role] = (_INSTITUTION, policy_role)
+        table['http://purl.imsglobal.org/vocab/lis/v2/institution/person#%s' % institution_role] = (_INSTITUTION, policy_role)
+    return table
+
+_ROLE_TABLE = _build_role_table()
 
-def role_identifier(ext_roles_text):
+def role_identifier(ext_roles):
     """
-    :param ext_roles_text: This will be the value of the 'ext_roles' attribute in the POST request lti forms.
+    :param ext_roles: This will be the value of the 'ext_roles' attribute in the POST request lti forms.
     It is a string, like 'urn:lti:instrole:ims/lis/Administrator,urn:lti:instrole:ims/lis/Instructor,
-    urn:lti:instrole:ims/lis/Student,urn:lti:role:ims/lis/Instructor,urn:lti:sysrole:ims/lis/User'
+    urn:lti:instrole:ims/lis/Student,urn:lti:role:ims/lis/Instructor,urn:lti:sysrole:ims/lis/User'.
+    The roles claim of an LTI 1.3 launch, a list of role URIs, is accepted as well.
     :return: A one word string, namely, the actual role. E.g. 'Student'
     """
+    if ext_roles is None:
+        ext_roles = ''
+    elif not isinstance(ext_roles, str):
+        # Lists are not hashable, so they cannot key the memo
+        ext_roles = tuple(ext_roles)
+    return _resolve_roles(ext_roles)
 
-    # E.g., transform 'urn:lti:instrole:ims/lis/Administrator,urn:lti:instrole:ims/lis/Instructor,
-    # urn:lti:instrole:ims/lis/Student,urn:lti:role:ims/lis/Instructor,urn:lti:sysrole:ims/lis/User'
-    # to [urn:lti:instrole:ims/lis/Administrator, urn:lti:instrole:ims/lis/Instructor,
-    # urn:lti:instrole:ims/lis/Student, urn:lti:role:ims/lis/Instructor, urn:lti:sysrole:ims/lis/User]
-    ext_roles_text_as_list = ext_roles_text.split(",")
+@lru_cache(maxsize=256)
+def _resolve_roles(ext_roles):
+    """
+    Resolves the policy role of a launcher. Canvas sends only a handful of distinct role strings, so the result
+    is memoized on the raw value.
+    """
+    if isinstance(ext_roles, str):
+        ext_roles = ext_roles.split(",")
 
-    # Store the context roles in context_roles and the institutional roles in institutional_roles. Ignore system roles.
+    # Sort the roles into context roles and institutional roles. Ignore system roles and anything unknown.
     # In this app, the institutional roles are used only when there are no context roles.
-    # For context/institution/system role reference, see https://www.imsglobal.org/specs/ltiv1p1/implementation-guide#toc-29
     context_roles = []
     institutional_roles = []
-    for role in ext_roles_text_as_list:
-        if 'lti:role' in role:
-            context_roles.append(role)
-        elif 'lti:instrole' in role:
-            institutional_roles.append(role)
-        else:
-            pass
-    # Determine the 'policy_role', i.e. the role to use in this app, by mapping from context/institutional roles in Canvas
-    # to the 3 role types (Administrator, Instructor, and Student) in this policy wizard app
-    if bool(context_roles): #if context_roles list is not empty... (It is expected that if the launcher is registered in the course,
-    # a context role will be present to reflect the launcher's role in the course.)
-        context_roles_as_string = ''.join(context_roles)  # convert context_roles to string
-        if ('Administrator' in context_roles_as_string):
-            policy_role = 'Administrator'
-        elif ('Instructor' in context_roles_as_string) or ('TeachingAssistant' in context_roles_as_string):
-            policy_role = 'Instructor'
-        else:
-            policy_role = 'Student'
-    else: #if context_roles list is empty... (This can happen in at least 2 cases: 1, when the canvas course site from which the wizard
-    # is launched is current but the launcher is not registered in the course site, or 2, when the canvas course site from which the
-    # wizard is launched is no longer current.)
-        institutional_roles_as_string = ''.join(institutional_roles)  # convert institutional_roles to string
-        if ('Administrator' in institutional_roles_as_string):
-            policy_role = 'Administrator'
-        else:
-            policy_role = 'Student'
-
-    return policy_role
-
-# validates LTI request
-def validate_request(request):
-
-    consumer_key = settings.SECURE_SETTINGS['CONSUMER_KEY']
-    shared_secret = settings.SECURE_SETTINGS['LTI_SECRET']
-
-    if consumer_key is None or shared_secret is None:
-        raise ImproperlyConfigured("Unable to validate LTI launch. Missing setting: CONSUMER_KEY or LTI_SECRET")
-
-    # Instantiate an LTI object with an 'initial' request type and 'any' role type
-    lti_object = LTI('initial', 'any')
-
-    return lti_object._verify_request(request)
+    for role in ext_roles:
+        kind, policy_role = _ROLE_TABLE.get(role.strip(), (None, None))
+        if kind == _CONTEXT:
+            context_roles.append(policy_role)
+        elif kind == _INSTITUTION:
+            institutional_roles.append(policy_role)
+
+    # It is expected that if the launcher is registered in the course, a context role will be present to reflect
+    # the launcher's role in the course. The context roles can be missing in at least 2 cases: 1, when the canvas
+    # course site from which the wizard is launched is current but the launcher is not registered in the course site,
+    # or 2, when the canvas course site from which the wizard is launched is no longer current.
+    # In those cases only administrators are recognised.
+    candidate_roles = context_roles or [r for r in institutional_roles if r == roles.ADMINISTRATOR]
+    return max(candidate_roles, key=_POLICY_ROLE_PRECEDENCE.index, default=roles.STUDENT)
+
+class LaunchValidator(object):
+    """
+    Verifies the OAuth signature of LTI launch requests and rejects replayed nonces.
+
+    Consumer configuration is read once, when the validator is built, so a single instance is meant to be
+    shared by every launch handled by the process (see `get_launch_validator`). Nonces are remembered in the
+    cache named by settings.LTI_NONCE_CACHE_ALIAS for settings.LTI_NONCE_WINDOW_SECS, which must be longer
+    than the timestamp window OAuth already enforces, so a replay is caught by a single cache `add`.
+    """
+
+    def __init__(self, consumer_key, shared_secret, nonce_cache, nonce_window):
+        if consumer_key is None or shared_secret is None:
+            raise ImproperlyConfigured("Unable to validate LTI launch. Missing setting: CONSUMER_KEY or LTI_SECRET")
+        self.consumer_key = consumer_key
+        self.nonce_cache = nonce_cache
+        self.nonce_window = nonce_window
+        self.lti = _ConfiguredLTI({consumer_key: {'secret': shared_secret}})
+
+    def nonce_cache_key(self, request):
+        params = request.POST if request.method == 'POST' else request.GET
+        return 'lti_nonce:%s:%s:%s' % (params.get('oauth_consumer_key'), params.get('oauth_timestamp'),
+                                       params.get('oauth_nonce'))
+
+    def verify(self, request):
+        """
+        :return: True if the request is a correctly signed LTI launch that has not been seen before
+        :raises: LTIException if the signature is invalid or the nonce has already been used
+        """
+        started = time.perf_counter()
+        try:
+            self.lti._verify_request(request)
+            # `add` only succeeds for keys not already in the cache, which makes the check atomic
+            if not self.nonce_cache.add(self.nonce_cache_key(request), 1, self.nonce_window):
+                self.reject_replay(request)
+        finally:
+            logger.debug('LTI launch verification took %.1fms', (time.perf_counter() - started) * 1000)
+        return True
+
+    def verify_signature(self, request):
+        """
+        Verifies the signature only. The nonce must then be recorded with queue_nonce, and the launch rejected
+        with reject_replay if it had already been used.
+
+        :return: True if the request is a correctly signed LTI launch
+        :raises: LTIException if the signature is invalid
+        """
+        started = time.perf_counter()
+        try:
+            self.lti._verify_request(request)
+        finally:
+            logger.debug('LTI launch signature verification took %.1fms', (time.perf_counter() - started) * 1000)
+        return True
+
+    def queue_nonce(self, request, pipeline):
+        """
+        Queues recording the nonce of the request on a CachePipeline over the nonce cache. Its result is False
+        if the nonce has already been used.
+        """
+        pipeline.add(self.nonce_cache_key(request), 1, self.nonce_window)
+
+    def reject_replay(self, request):
+        # Undo the session set up for the replayed launch, as pylti does for any failed verification
+        self.lti.clear_session(request)
+        raise LTIException('OAuth nonce has already been used')
+
+class _ConfiguredLTI(LTI):
+    """
+    An 'initial' LTI request verifier for 'any' role that uses the consumers it was built with instead of
+    re-reading them from the settings on every request
+    """
+
+    def __init__(self, consumers):
+        super(_ConfiguredLTI, self).__init__('initial', 'any')
+        self._consumers = consumers
+
+    def consumers(self):
+        return self._consumers
+
+@lru_cache(maxsize=None)
+def get_launch_validator():
+    """
+    Returns the LaunchValidator shared by every launch handled by this process
+    """
+    return LaunchValidator(
+        settings.SECURE_SETTINGS['CONSUMER_KEY'],
+        settings.SECURE_SETTINGS['LTI_SECRET'],
+        caches[settings.LTI_NONCE_CACHE_ALIAS],
+        settings.LTI_NONCE_WINDOW_SECS,
+    )
+
+# validates LTI request. Without record_nonce only the signature is verified, and the nonce must be recorded
+# with save_launch_session.
+def validate_request(request, record_nonce=True):
+    validator = get_launch_validator()
+    return validator.verify(request) if record_nonce else validator.verify_signature(request)
+
+def launch_session_can_be_pipelined(request):
+    """
+    True if the launch's session can be saved in the same cache round trip as its nonce is recorded, which
+    needs the 'cache' session mode with the sessions and the nonces in the same cache
+    """
+    return (hasattr(request.session, 'queue_save')
+            and settings.SESSION_CACHE_ALIAS == settings.LTI_NONCE_CACHE_ALIAS)
+
+def save_launch_session(request):
+    """
+    Records the nonce of a launch whose signature has been verified and saves its session, in one cache round
+    trip. See launch_session_can_be_pipelined.
+
+    :raises: LTIException if the nonce has already been used, after discarding the session
+    """
+    validator = get_launch_validator()
+    pipeline = CachePipeline(caches[settings.LTI_NONCE_CACHE_ALIAS])
+    validator.queue_nonce(request, pipeline)
+    request.session.queue_save(pipeline)
+    nonce_added, session_saved = pipeline.execute()
+    request.session.saved_in_pipeline(session_saved)
+    if not nonce_added:
+        validator.reject_replay(request)
+
+def conditional_response(request, etag, last_modified, respond):
+    '''
+    Answers a conditional GET with 304 Not Modified when the client's copy, identified by its ETag or its
+    Last-Modified date, is still current. Otherwise returns respond(). Either way the response carries the
+    validators and asks the browser to revalidate before reusing its copy.
+    '''
+    etag = quote_etag(etag) if etag else None
+    last_modified = timegm(last_modified.utctimetuple()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = respond()
+    if etag and not response.has_header('ETag'):
+        response['ETag'] = etag
+    if last_modified and not response.has_header('Last-Modified'):
+        response['Last-Modified'] = http_date(last_modified)
+    # The page depends on the launcher's session, so only their browser may keep it
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+def _lock_active_policies(course_id):
+    """
+    Locks the active policy rows of the course until the end of the transaction, so concurrent publishes for
+    the course are serialized
+    """
+    list(Policies.objects.select_for_update().filter(course_id=course_id, is_active=True).only('pk'))
+
+def _inactivate_course_policies(course_id):
+    active_policies = Policies.objects.filter(course_id=course_id, is_active=True)
+    template_ids = list(active_policies.values_list('related_template_id', flat=True))
+    active_policies.update(is_active=False)
+    CoursePolicy.objects.filter(course_id=course_id).update(current_version=None)
+    add_template_usage_many({template_id: {'active_courses': -count}
+                             for template_id, count in Counter(template_ids).items()})
+
+def _record_version(policy, published_by):
+    """
+    Appends the policy's body to the version history of its course and makes it the current version
+    """
+    course_policy, _ = CoursePolicy.objects.select_for_update().get_or_create(course_id=policy.course_id)
+    course_policy.version_count += 1
+    course_policy.current_version = PolicyVersion.objects.create(
+        course_id=policy.course_id,
+        number=course_policy.version_count,
+        policy=policy,
+        published_by=published_by,
+        compressed_body=PolicyVersion.compress(policy.rendered_body),
+    )
+    course_policy.save()
 
 # Inactivates active policies for a particular course
 def inactivate_active_policies(request):
-    policies_to_inactivate = Policies.objects.filter(course_id=request.session['course_id'], is_active=True)
-    policies_to_inactivate.update(is_active=False)
\ No newline at end of file
+    with transaction.atomic():
+        _lock_active_policies(request.session['course_id'])
+        _inactivate_course_policies(request.session['course_id'])
+    invalidate_student_policy_page(request.session['course_id'])
+
+# How many times publishing is attempted when a concurrent publish for the same course wins the race
+PUBLISH_ATTEMPTS = 3
+
+def publish_policy(course_id, **fields):
+    """
+    Creates a new active policy for the course and inactivates the one it replaces, in a single transaction.
+
+    If there is no active policy to lock, two co-instructors publishing at the same moment can both get as far
+    as the insert. The database then lets only one of them through, and the other starts over.
+
+    Raises PermissionDenied, as for a launch that is not valid, if the session has no course, e.g. when the tool
+    was launched from outside a Canvas course.
+    """
+    # Every attempt would fail on the course's version history, whose primary key is the course id
+    if course_id in (None, ''):
+        raise PermissionDenied
+    for attempt in range(1, PUBLISH_ATTEMPTS + 1):
+        try:
+            with transaction.atomic():
+                _lock_active_policies(course_id)
+                _inactivate_course_policies(course_id)
+                policy = Policies.objects.create(course_id=course_id, is_active=True, **fields)
+                _record_version(policy, policy.published_by)
+                add_template_usage(
+                    policy.related_template_id, active_courses=1, published=1,
+                    published_with_changes=int(policy.related_template_id is not None and
+                                               policy.body_hash != policy.related_template.body_hash))
+            break
+        except IntegrityError:
+            if attempt == PUBLISH_ATTEMPTS:
+                raise
+    invalidate_student_policy_page(course_id)
+    return policy
+
+def activate_policy(policy, body, edited_by):
+    """
+    Updates the body of a previously published policy and makes it the active policy of its course,
+    in a single transaction
+    """
+    with transaction.atomic():
+        _lock_active_policies(policy.course_id)
+        _inactivate_course_policies(policy.course_id)
+        policy.body = body
+        policy.is_active = True
+        policy.save()
+        _record_version(policy, edited_by)
+        add_template_usage(policy.related_template_id, active_courses=1, edits=1)
+    invalidate_student_policy_page(policy.course_id)
+    return policy
@@ -1,20 +1,35 @@
 import logging
+from calendar import timegm
 
 from pylti.common import LTIException
 
 from django.conf import settings
-from django.shortcuts import render, redirect, get_object_or_404
+from django.shortcuts import render, redirect
 from django.core.exceptions import PermissionDenied
-from django.http import HttpResponse, HttpResponseServerError
+from django.http import HttpResponse, HttpResponseServerError, JsonResponse, Http404, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
-from .models import PolicyTemplates, Policies
-from .utils import role_identifier, validate_request, inactivate_active_policies
+from django.views.decorators.http import require_POST
+from django.utils.http import http_date, quote_etag
+from .models import Policies, CUSTOM_POLICY_TEMPLATE_NAME
+from .utils import role_identifier, validate_request, inactivate_active_policies, publish_policy, activate_policy, \
+    conditional_response, launch_session_can_be_pipelined, save_launch_session
+from .cache import get_cached_student_policy_page, load_student_policy_page, student_policy_validators, \
+    get_template_catalogue, invalidate_template_catalogue, get_template_panels, invalidate_template_panels
 from .forms import PolicyTemplateForm, NewPolicyForm
+from .queries import active_policy_for_display, policy_for_display, policy_validators, editable_policy, \
+    policy_for_update, policy_history_page, current_version_id, template_for_display, template_for_update, \
+    template_reference, editable_template, template_usage
 from django.views.decorators.clickjacking import xframe_options_exempt
-from .decorators import require_role_administrator, require_role_instructor, require_role_student
+from .decorators import require_role_administrator, require_role_instructor, require_role_student, require_api_token
 from . import roles
+from .metrics import histogram_snapshot
+from .bulk import BulkPublishError, bulk_publish_policies, parse_course_mapping
+from .export import EXPORT_FORMATS, export_policies, parse_export_filters
 logger = logging.getLogger(__name__)
 
+# Number of policy versions shown per page of a course's policy history
+POLICY_HISTORY_PAGE_SIZE = 20
+
 @csrf_exempt
 @xframe_options_exempt #Allows rendering in Canvas frame
 def process_lti_launch_request_view(request):
@@ -26,8 +41,12 @@ def process_lti_launch_request_view(request):
     is_basic_lti_launch = request.method == 'POST' and request.POST.get(
         'lti_message_type') == 'basic-lti-launch-request'
 
+    #If the session is kept with the nonces, the launch's nonce is recorded when its session is saved, below,
+    #in a single cache round trip
+    pipelined = is_basic_lti_launch and launch_session_can_be_pipelined(request)
+
     try:
-        request_is_valid = validate_request(request)
+        request_is_valid = validate_request(request, record_nonce=not pipelined)
     except LTIException: # oauth session may have timed out or the keys may be wrong
         return redirect('lti_exception_view')
 
@@ -51,6 +70,12 @@ def process_lti_launch_request_view(request):
         #This is used later to indicate the author of a course policy.
         request.session['lis_person_sourcedid'] = request.POST.get('lis_person_sourcedid')
 
+        if pipelined:
+            try:
+                save_launch_session(request)
+            except LTIException: # the launch is a replay
+                return redirect('lti_exception_view')
+
         #Using the role, e.g. 'Administrator', 'Instructor', or 'Student', determine route to take
         role = request.session.get('role')
         if role==roles.ADMINISTRATOR or role==roles.INSTRUCTOR:
@@ -76,46 +101,46 @@ def policy_templates_list_view(request):
     if role==roles.INSTRUCTOR or role==roles.ADMINISTRATOR:
 
         if role==roles.INSTRUCTOR:
-            try: #If there is an active policy for this course, get it. (Only 1 active policy expected.)
-                active_policy = Policies.objects.get(course_id=request.session['course_id'], is_active=True)
+            try: #If there is an active policy for this course (there is at most 1), get it.
+                active_policy = active_policy_for_display(request.session['course_id'])
                 # Render the active policy
                 return render(request, 'instructor_active_policy.html', {'active_policy': active_policy})
-            except Policies.MultipleObjectsReturned: #If multiple active policies exist (which should never happen)...
-                # ... return the latest active policy
-                active_policy = Policies.objects.filter(course_id=request.session['course_id'], is_active=True).latest('created_at')
-                return render(request, 'instructor_active_policy.html', {'active_policy': active_policy})
             except Policies.DoesNotExist: #If no active policy exists ...
                 pass
 
 
-        #Fetch each policy template from the `PolicyTemplates` table in the database and store as a variable
-        written_work_policy_template = PolicyTemplates.objects.get(name="Collaboration Permitted: Written Work")
-        problem_sets_policy_template = PolicyTemplates.objects.get(name="Collaboration Permitted: Problem Sets")
-        collaboration_prohibited_policy_template = PolicyTemplates.objects.get(name="Collaboration Prohibited")
-        custom_policy_template = PolicyTemplates.objects.get(name="Custom Policy")
+        #Fetch the policy templates (a single query, or none at all if the catalogue is cached).
+        #The 'Custom Policy' template is offered to instructors separately as a blank template.
+        policy_templates = []
+        custom_policy_template = None
+        for policy_template in get_template_catalogue():
+            if policy_template.name == CUSTOM_POLICY_TEMPLATE_NAME:
+                custom_policy_template = policy_template
+            else:
+                policy_templates.append(policy_template)
 
         if role==roles.ADMINISTRATOR:
             #Django template to use
             template_to_use = 'admin_level_template_list.html'
             list_level = 'admin_level_template_edit'
-            button_text = 'Update'
+            #Usage of the templates, read from their counters
+            usage = template_usage()
         else: #role=='Instructor'
             # Django template to use
             template_to_use = 'instructor_level_template_list.html'
             list_level = 'instructor_level_policy_edit'
-            button_text = 'Choose'
+            usage = None
 
         #Render the policy templates
         return render(
             request,
             template_to_use,
             {
-                'written_work_policy_template': written_work_policy_template,
-                'problem_sets_policy_template': problem_sets_policy_template,
-                'collaboration_prohibited_policy_template': collaboration_prohibited_policy_template,
+                'policy_templates': policy_templates,
+                'template_panels': get_template_panels(policy_templates, list_level),
                 'custom_policy_template': custom_policy_template,
                 'list_level': list_level,
-                'button_text': button_text
+                'template_usage': usage,
             })
 
     else: #i.e. 'Student'
@@ -128,25 +153,80 @@ def admin_level_template_edit_view(request, pk):
     '''
     Presents the text editor to an administrator so they can edit and update a policy template
     '''
-    template_to_update = get_object_or_404(PolicyTemplates, pk=pk)
-
     if request.method == 'POST':
+        template_to_update = template_for_update(pk)
         form = PolicyTemplateForm(request.POST)
         if form.is_valid():
+            previous_version = template_to_update.updated_at
             template_to_update.body = form.cleaned_data.get('body')
             template_to_update.save()
+            invalidate_template_catalogue()
+            invalidate_template_panels(template_to_update.pk, previous_version)
             return redirect('admin_updated_template', pk=template_to_update.pk)
     else:
+        template_to_update = editable_template(pk)
         form = PolicyTemplateForm(initial={'body': template_to_update.body})
     return render(request, 'admin_level_template_edit.html', {'form': form, 'template_to_update': template_to_update})
 
+@xframe_options_exempt
+@require_role_administrator
+def request_metrics_view(request):
+    '''
+    Shows an administrator the request time histogram of the process serving the request
+    '''
+    return JsonResponse(histogram_snapshot())
+
+@require_api_token
+@require_POST
+def bulk_publish_policies_view(request):
+    '''
+    Publishes policies in many courses at once, e.g. at term rollover, from a course mapping an administrator's
+    script posts as JSON or, with a text/csv content type, as CSV, with the name the policies are published under
+    as ?published_by=. See policy_wizard/bulk.py for the mapping.
+    '''
+    published_by = request.GET.get('published_by')
+    if not published_by:
+        return JsonResponse({'error': 'published_by is required'}, status=400)
+
+    def log_progress(done, total):
+        logger.info('Bulk publish by %s: %d of %d courses done', published_by, done, total)
+
+    mapping_format = 'csv' if request.content_type == 'text/csv' else 'json'
+    try:
+        rows = parse_course_mapping(request.body.decode('utf-8'), mapping_format)
+        result = bulk_publish_policies(rows, published_by, progress=log_progress)
+    except (BulkPublishError, UnicodeDecodeError) as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    return JsonResponse(result)
+
+@xframe_options_exempt
+@require_role_administrator
+def export_policies_view(request):
+    '''
+    Streams the active policy of every course to an administrator, as CSV or, with ?format=json, as JSON.
+    Optionally filtered by ?since= and ?until= (dates the policies were last published or edited) and ?template_id=.
+    '''
+    export_format = request.GET.get('format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        return JsonResponse({'error': 'format must be one of %s' % ', '.join(sorted(EXPORT_FORMATS))}, status=400)
+    try:
+        filters = parse_export_filters(request.GET.get('since'), request.GET.get('until'),
+                                       request.GET.get('template_id'))
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    lines, content_type = EXPORT_FORMATS[export_format]
+    response = StreamingHttpResponse(lines(export_policies(**filters)), content_type=content_type)
+    response['Content-Disposition'] = 'attachment; filename="policies.%s"' % export_format
+    return response
+
 @xframe_options_exempt
 @require_role_administrator
 def admin_updated_template_view(request, pk):
     '''
     Present the updated template to the administrator
     '''
-    updated_template = PolicyTemplates.objects.get(pk=pk)
+    updated_template = template_for_display(pk)
     return render(request, 'admin_updated_template.html', {'updated_template': updated_template})
 
 @xframe_options_exempt
@@ -155,15 +235,18 @@ def admin_edit_updated_template_view(request, pk):
     '''
     Present administrator with editor so they can edit a template they just updated
     '''
-    template_to_update = get_object_or_404(PolicyTemplates, pk=pk)
-
     if request.method == 'POST':
+        template_to_update = template_for_update(pk)
         form = PolicyTemplateForm(request.POST)
         if form.is_valid():
+            previous_version = template_to_update.updated_at
             template_to_update.body = form.cleaned_data.get('body')
             template_to_update.save()
+            invalidate_template_catalogue()
+            invalidate_template_panels(template_to_update.pk, previous_version)
             return redirect('admin_updated_template', pk=template_to_update.pk)
     else:
+        template_to_update = editable_template(pk)
         form = PolicyTemplateForm(initial={'body': template_to_update.body})
     return render(request, 'admin_edit_updated_template.html', {'form': form, 'template_to_update': template_to_update})
 
@@ -174,27 +257,23 @@ def instructor_level_policy_edit_view(request, pk):
     Presents the text editor to an instructor so they can edit and publish a policy
     '''
 
-    policy_template = get_object_or_404(PolicyTemplates, pk=pk)
-
     if request.method == 'POST':
+        policy_template = template_reference(pk)
         form = NewPolicyForm(request.POST)
         if form.is_valid():
-            # First, inactivate any active policies for the course that may be present in the database ...
-            # (Ensures there is ever only one active policy for the course)
-            inactivate_active_policies(request)
-            # ... then create a new active policy for the course
-            finalPolicy = Policies.objects.create(
-                course_id=request.session['course_id'],
+            # Create a new active policy for the course, inactivating the one it replaces
+            finalPolicy = publish_policy(
+                request.session['course_id'],
                 context_id=request.session['context_id'],
                 body=form.cleaned_data.get('body'),
                 related_template = policy_template,
                 published_by = request.session['lis_person_sourcedid'],
                 is_published = True,
-                is_active=True,
             )
 
             return redirect('instructor_active_policy', pk=finalPolicy.pk)
     else:
+        policy_template = editable_template(pk)
         form = NewPolicyForm(initial={'body': policy_template.body})
     return render(request, 'instructor_level_policy_edit.html', {'policy_template': policy_template, 'form': form})
 
@@ -202,10 +281,14 @@ def instructor_level_policy_edit_view(request, pk):
 @require_role_instructor
 def instructor_active_policy(request, pk):
     '''
-    Displays to the instructor the policy they just prepared
+    Displays to the instructor the policy they just prepared.
+    A repeat request from a browser that has the page answers 304 after reading only the policy's hash and date.
     '''
-    active_policy = Policies.objects.get(pk=pk)
-    return render(request, 'instructor_active_policy.html', {'active_policy': active_policy})
+    validators = policy_validators(pk)
+    if validators is None:
+        raise Http404
+    return conditional_response(request, *validators, respond=lambda: render(
+        request, 'instructor_active_policy.html', {'active_policy': policy_for_display(pk)}))
 
 @xframe_options_exempt
 @require_role_instructor
@@ -213,22 +296,36 @@ def edit_active_policy(request, pk):
     '''
     Provides an instructor the capability to edit a policy they already published
     '''
-    policy_to_edit = Policies.objects.get(pk=pk)
     if request.method == 'POST':
+        policy_to_edit = policy_for_update(pk)
         form = NewPolicyForm(request.POST)
         if form.is_valid():
-            # First, inactivate any active policies for the course that may be present in the database ...
-            # (Ensures there is ever only one active policy for the course)
-            inactivate_active_policies(request)
-            # ... then mark the edited policy as active, and save
-            policy_to_edit.body = form.cleaned_data.get('body')
-            policy_to_edit.is_active=True
-            policy_to_edit.save()
+            # Save the edited policy and make it the course's active policy (again)
+            activate_policy(policy_to_edit, form.cleaned_data.get('body'), request.session['lis_person_sourcedid'])
             return redirect('instructor_active_policy', pk=policy_to_edit.pk)
     else:
+        policy_to_edit = editable_policy(pk)
         form = NewPolicyForm(initial={'body': policy_to_edit.body})
     return render(request, 'instructor_level_policy_edit.html', {'policy_template': policy_to_edit, 'form': form})
 
+@xframe_options_exempt
+@require_role_instructor
+def policy_history_view(request):
+    '''
+    Displays to the instructor every version of the course's policy, newest first, a page at a time
+    '''
+    course_id = request.session['course_id']
+    before = request.GET.get('before', '')
+    # Fetch one extra version to find out whether there is a next page
+    versions = policy_history_page(course_id, int(before) if before.isdigit() else None, POLICY_HISTORY_PAGE_SIZE + 1)
+    next_before = versions[POLICY_HISTORY_PAGE_SIZE - 1].number if len(versions) > POLICY_HISTORY_PAGE_SIZE else None
+
+    return render(request, 'instructor_policy_history.html', {
+        'versions': versions[:POLICY_HISTORY_PAGE_SIZE],
+        'current_version_id': current_version_id(course_id),
+        'next_before': next_before,
+    })
+
 @xframe_options_exempt
 @require_role_instructor
 def instructor_inactivate_policies_view(request):
@@ -244,16 +341,26 @@ def instructor_inactivate_policies_view(request):
 @require_role_student
 def student_active_policy_view(request):
     '''
-    Displays to the student the policy for the course if one exists
+    Displays to the student the policy for the course if one exists.
+    The rendered page is cached per course, so a warm hit needs neither a query nor a template render, and
+    only one request at a time re-renders a course's page after it expires or is dropped.
+    On a miss, a student reopening a page they already have gets a 304 after a query of the page's hash and date.
     '''
-    try:
-        # If an active policy exists (Only 1 expected)...
-        active_policy = Policies.objects.get(course_id=request.session['course_id'], is_active=True)
-        # Render the policy
-        return render(request, 'student_active_policy.html', {'active_policy': active_policy})
-    except Policies.DoesNotExist: #If no active policy exists ...
-        return HttpResponse("There is no published academic integrity policy in record for this course.")
-    except Policies.MultipleObjectsReturned: #If multiple active policies present (which should never happen) ...
-        # ... return the latest active policy
-        active_policy = Policies.objects.filter(course_id=request.session['course_id'], is_active=True).latest('created_at')
-        return render(request, 'instructor_active_policy.html', {'active_policy': active_policy})
+    course_id = request.session['course_id']
+    entry = get_cached_student_policy_page(course_id)
+    if entry is None and ('HTTP_IF_NONE_MATCH' in request.META or 'HTTP_IF_MODIFIED_SINCE' in request.META):
+        etag, last_modified = student_policy_validators(course_id)
+    else:
+        entry = entry or load_student_policy_page(course_id)
+        etag, last_modified = entry['etag'], entry['last_modified']
+
+    def respond():
+        # The page may have been published since its validators were read, so tag the response with its own
+        served = entry or load_student_policy_page(course_id)
+        response = HttpResponse(served['page'])
+        response['ETag'] = quote_etag(served['etag'])
+        if served['last_modified']:
+            response['Last-Modified'] = http_date(timegm(served['last_modified'].utctimetuple()))
+        return response
+
+    return conditional_response(request, etag, last_modified, respond)